@@ -13,17 +13,32 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Optional
 
+import aiohttp
+import allure
 import pytest_html
 from pytest_metadata.plugin import metadata_key
 import pytest
+import pytest_asyncio
 import requests
 from py.xml import html
-from requests.adapters import HTTPAdapter
-from urllib3 import Retry
 from config.environment import Environment
 from src.base.api_client import APIClient
+from src.base.api_retry import CircuitOpenError, format_snapshot as format_retry_snapshot, \
+    snapshot as retry_snapshot
+from src.base.api_session import PoolStats, create_api_session, pool_stats
+from src.base.api_timeouts import APITimeoutError, TimeoutPolicy, load_endpoint_timeouts
+from src.base.async_api_client import AsyncAPIClient, create_connector
+from src.base.browser_pool import BrowserPool
+from src.base.command_tracker import command_tracker
+from src.base.har_recorder import har_recorder
 from src.base.web_driver import WebDriverManager
+from src.pages.base_page import dropdown_stats
+from src.pages.element_cache import element_cache_stats
+from src.pages.page_metrics import aggregate, check_budgets, format_aggregate, load_budgets, page_metrics
+from src.pages.retry_policy import retry_budget
+from src.pages.wait_engine import wait_stats
 from src.utils import logger
+from src.utils.screenshot_service import screenshot_service
 log = logger.customLogger()
 
 
@@ -34,6 +49,8 @@ def pytest_addoption(parser):
     parser.addoption("--platform", action="store", default=None, help="Remote platform: Windows, macOS, etc.")
     parser.addoption("--headless", action="store_true", help="Run browser in headless mode")
     parser.addoption("--test-type",action="store",default="all",choices=["all", "api", "ui"],help="Run only specific test types: all, api, or ui")
+    parser.addoption("--no-browser-reuse", action="store_true", default=False, help="Start a fresh browser for every UI test")
+    parser.addoption("--har", action="store_true", default=False, help="Write a HAR file per UI test to reports/har (Chrome/Edge)")
 
     #parser.addoption("--remote-url", action="store",default="https://hub-cloud.browserstack.com/wd/hub",help="Remote WebDriver URL")
 
@@ -69,50 +86,155 @@ def setup_environment(request):
     if bs_access_key := request.config.getoption("--bs-access-key"):
         os.environ["BS_ACCESS_KEY"] = bs_access_key
 
+    if request.config.getoption("--no-browser-reuse"):
+        os.environ["BROWSER_REUSE"] = "False"
+
+    if request.config.getoption("--har"):
+        os.environ["HAR_CAPTURE"] = "True"
+
 @pytest.fixture(scope="session")
 def api_session():
     log.info("🌐 Creating API session")
-    session = requests.Session()
-    retries = Retry(total=5, backoff_factor=5, status_forcelist=[502, 503, 504],allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],raise_on_status=False)
-    adapter = HTTPAdapter(max_retries=retries)
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
+    session = create_api_session()
     yield session
     session.close()
+    log.info(f"API connection pools:\n{pool_stats.format_summary()}")
+
+
+@pytest.fixture(scope="session")
+def api_endpoint_timeouts():
+    """Per-endpoint API timeouts from testData/api_timeouts.json (optional)."""
+    return load_endpoint_timeouts()
 
 
 @pytest.fixture(scope="function")
-def api_request_context(api_session):
+def api_timeouts(request, api_endpoint_timeouts):
+    """
+    Timeout policy of an API test.
+
+    Its deadline (API_TEST_TIMEOUT, or an api_deadline(seconds) marker) starts
+    when the test starts and caps every request the test makes.
+    """
+    marker = request.node.get_closest_marker("api_deadline")
+    return TimeoutPolicy.from_env(api_endpoint_timeouts, marker.args[0] if marker else None)
+
+
+@pytest.fixture(scope="function")
+def api_request_context(api_session, api_timeouts):
      # Import your client class
-    return APIClient(api_session)
+    return APIClient(api_session, api_timeouts)
+
+
+@pytest_asyncio.fixture
+async def async_api_request_context(api_timeouts):
+    """Asyncio counterpart of api_request_context (one aiohttp session per test)."""
+    async with aiohttp.ClientSession(connector=create_connector(),
+                                     timeout=aiohttp.ClientTimeout(total=None)) as session:
+        yield AsyncAPIClient(session, api_timeouts)
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def driver_manager():
     """Create WebDriver Manager instance."""
     log.info("Creating WebDriver Manager")
     return WebDriverManager()
 
 
-@pytest.fixture(scope="function")
-def driver(request, driver_manager):
+@pytest.fixture(scope="session")
+def browser_pool(request, driver_manager):
     """
-    Create WebDriver instance.
-    
-    This fixture initializes a WebDriver instance for UI tests
-    and handles cleanup after test completion.
+    Create the per-worker browser pool.
+
+    Each xdist worker runs its own session, so sessions are never shared
+    between processes.
     """
     remote = request.config.getoption("--remote")
-    log.info(f"Initializing WebDriver (remote: {remote})")
-    
-    # Initialize driver
-    driver = driver_manager.initialize_driver(remote=remote)
-    
+    pool = BrowserPool(driver_manager, remote=remote)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def performance_budgets():
+    """Per-page performance budgets from testData/performance_budgets.json (optional)."""
+    return load_budgets()
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_manager, browser_pool, performance_budgets):
+    """
+    Lease a WebDriver instance from the browser pool.
+
+    The session is reset and returned to the pool after the test,
+    so the next UI test does not pay for a browser cold start.
+    WebDriver commands issued by the test are counted; a
+    max_round_trips(N) marker (or MAX_ROUND_TRIPS env var) fails the
+    test when it issues more than N commands. A network_profile(name)
+    marker (or NETWORK_PROFILE env var) selects the requests to block.
+    Page metrics captured on navigation are checked against the budgets
+    in testData/performance_budgets.json and a perf_budget(...) marker.
+    """
+    log.info("Leasing WebDriver from browser pool")
+    driver = browser_pool.acquire()
+    try:
+        profile_marker = request.node.get_closest_marker("network_profile")
+        interceptor = driver_manager.apply_network_profile(driver, profile_marker.args[0] if profile_marker else None)
+        request.node.network_interceptor = interceptor
+        command_tracker.start_test(request.node.nodeid, driver)
+        page_metrics.start_test(request.node.nodeid)
+        if driver_manager.har_capture:
+            request.node.har_path = har_recorder.start_test(request.node.nodeid, driver)
+    except Exception:
+        # E.g. an unknown network_profile name: hand the session back instead of leaking it
+        browser_pool.release(driver)
+        raise
+
     # Yield driver to test
     yield driver
-    
-    # Quit driver after test
-    driver_manager.quit_driver()
+
+    try:
+        summary = command_tracker.stop_test()
+        log.info(f"{request.node.nodeid}\n{command_tracker.format_summary(summary)}")
+        if interceptor is not None:
+            log.info(interceptor.format_stats(interceptor.stats()))
+        har_path = har_recorder.stop_test()
+        if har_path:
+            allure.attach.file(har_path, name="HAR", extension="har")
+        metrics = page_metrics.stop_test()
+        if metrics:
+            # Reports carry user properties to the xdist controller for the run summary
+            request.node.user_properties.append(("page_metrics", metrics))
+    finally:
+        # Reset the session and hand it back to the pool, even if reporting failed
+        browser_pool.release(driver)
+
+    failures = []
+    marker = request.node.get_closest_marker("max_round_trips")
+    budget = marker.args[0] if marker else int(os.getenv("MAX_ROUND_TRIPS", "0"))
+    if budget and summary["commands"] > budget:
+        failures.append(f"Round-trip budget exceeded: {summary['commands']} WebDriver commands "
+                        f"(budget: {budget})")
+    perf_marker = request.node.get_closest_marker("perf_budget")
+    failures += [f"Performance budget exceeded: {violation}" for violation in
+                 check_budgets(metrics, performance_budgets, perf_marker.kwargs if perf_marker else None)]
+    if failures:
+        pytest.fail("\n".join(failures), pytrace=False)
+
+
+@pytest.fixture(scope="function")
+def stub_responses(driver, driver_manager):
+    """
+    Serve recorded responses from testData/ to the test's browser.
+
+    Usage:
+        with stub_responses("AutomationExerciseData", "products_stubs.json") as stubs:
+            ...
+        assert not stubs.unused
+    """
+    def _stub_responses(folder_name, file_name):
+        return driver_manager.stub_responses(driver, folder_name, file_name)
+
+    return _stub_responses
 
 
 # @pytest.hookimpl(hookwrapper=True)
@@ -175,16 +297,39 @@ def pytest_runtest_makereport(item, call):
     else:
         setattr(report, "description", item.nodeid.split("::")[-1])
 
+    # Attach the WebDriver round-trip summary of UI tests
+    if report.when == 'call' and command_tracker.node_id == item.nodeid:
+        summary_text = command_tracker.format_summary(command_tracker.summary())
+        extra.append(pytest_html.extras.text(summary_text, "WebDriver Commands"))
+    har_path = getattr(item, "har_path", None)
+    if report.when == 'call' and har_path and item.config.option.htmlpath:
+        report_dir = os.path.dirname(os.path.abspath(item.config.option.htmlpath))
+        extra.append(pytest_html.extras.url(os.path.relpath(os.path.abspath(har_path), report_dir), "HAR"))
+    if report.when == 'call' and page_metrics.node_id == item.nodeid and page_metrics.records:
+        extra.append(pytest_html.extras.text(page_metrics.format_records(page_metrics.records), "Page Metrics"))
+    interceptor = getattr(item, "network_interceptor", None)
+    if report.when == 'call' and interceptor is not None:
+        extra.append(pytest_html.extras.text(interceptor.format_stats(interceptor.stats()), "Network"))
+
+    # Timeouts and open circuit breakers are reported as their own failure classes
+    if report.failed and call.excinfo and isinstance(call.excinfo.value, APITimeoutError):
+        report.user_properties.append(("failure_class", "API TIMEOUT"))
+    elif report.failed and call.excinfo and isinstance(call.excinfo.value, CircuitOpenError):
+        report.user_properties.append(("failure_class", "CIRCUIT OPEN"))
+
     # Handle screenshots and logs only for failures
     if report.when in ('call', 'setup') and report.failed:
         driver = item.funcargs.get("driver", None)
         if driver:
-            try:
-                # Take screenshot
-                screenshot = driver.get_screenshot_as_base64()
-                extra.append(pytest_html.extras.image(screenshot, 'Screenshot'))
-            except Exception as e:
-                print(f"Failed to take screenshot: {e}")
+            # Reuse the screenshot BasePage already took for this failure
+            failure = call.excinfo.value if call.excinfo else None
+            path = screenshot_service.capture(driver, f"failure_{item.name}",
+                                              os.getenv("SCREENSHOTS_DIR", "reports/screenshots"), failure)
+            if path:
+                screenshot, mime_type = screenshot_service.read_base64(path)
+                if screenshot:
+                    extra.append(pytest_html.extras.image(screenshot, 'Screenshot', mime_type=mime_type,
+                                                          extension=os.path.splitext(path)[1].lstrip(".")))
 
         # Add only the log messages without tracebacks
         if hasattr(item, "capturelog"):
@@ -311,7 +456,10 @@ test_data: Dict[str, Optional[float] | dict] = {
                 "semantic": 0
             }
         )
-    )
+    ),
+    # API connection pool and retry stats per xdist worker ("main" when not distributed)
+    "api_pool_stats": {},
+    "api_retry_stats": {}
 }
 
 @pytest.hookimpl
@@ -319,6 +467,28 @@ def pytest_sessionstart(session):
     test_data["start_time"] = time.time()
 
 
+@pytest.hookimpl
+def pytest_sessionfinish(session):
+    # xdist workers hand their connection pool and retry stats to the controller
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["api_pool_stats"] = pool_stats.snapshot()
+        session.config.workeroutput["api_retry_stats"] = retry_snapshot()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    for key in ("api_pool_stats", "api_retry_stats"):
+        stats = getattr(node, "workeroutput", {}).get(key)
+        if stats:
+            test_data[key][node.gateway.id] = stats
+
+
+@pytest.hookimpl
+def pytest_runtest_setup(item):
+    # Every test gets a fresh UI retry time budget
+    retry_budget.reset()
+
+
 # @pytest.hookimpl
 # def pytest_terminal_summary(terminalreporter, exitstatus, config):
 #     test_data["end_time"] = time.time()
@@ -419,7 +589,8 @@ def pytest_runtest_logreport(report):
         "duration": f"{duration:.2f}s",
         "status": "passed" if report.passed else "failed" if report.failed else "skipped",
         "reason": report.longrepr.reprcrash.message.splitlines()[0] if report.failed else str(
-            report.longrepr) if report.skipped else None
+            report.longrepr) if report.skipped else None,
+        "failure_class": next((value for name, value in report.user_properties if name == "failure_class"), None)
     }
 
     if test_type:
@@ -532,11 +703,80 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
             group, project = project_path.split("::")
             report += f"{group.upper()}::{project}:\n"
             for test in tests:
-                report += f"  - {test['name']} ({test['duration']})\n"
+                failure_class = f" [{test['failure_class']}]" if test.get('failure_class') else ""
+                report += f"  - {test['name']} ({test['duration']}){failure_class}\n"
                 if test.get('reason'):
                     report += f"    Reason: {test['reason']}\n"
             report += "\n"
 
+    # Slowest explicit waits per locator (collected in this process only)
+    if wait_stats.data:
+        report += (
+            f"SLOWEST WAITS\n"
+            f"-------------------------\n"
+            f"{wait_stats.format_summary()}\n\n"
+        )
+
+    # Dropdown reads and selections per locator (collected in this process only)
+    if dropdown_stats.data:
+        report += (
+            f"DROPDOWN OPERATIONS\n"
+            f"-------------------------\n"
+            f"{dropdown_stats.format_summary()}\n\n"
+        )
+
+    # Failure screenshots (collected in this process only)
+    if screenshot_service.captured or screenshot_service.reused:
+        report += (
+            f"SCREENSHOTS\n"
+            f"-------------------------\n"
+            f"{screenshot_service.format_summary()}\n\n"
+        )
+
+    # Element cache reuse (collected in this process only)
+    if element_cache_stats.hits or element_cache_stats.misses:
+        report += (
+            f"ELEMENT CACHE\n"
+            f"-------------------------\n"
+            f"{element_cache_stats.format_summary()}\n\n"
+        )
+
+    # API connection pool reuse, per worker
+    worker_pools = test_data["api_pool_stats"] or ({"main": pool_stats.snapshot()} if pool_stats.hosts else {})
+    if worker_pools:
+        report += (
+            f"API CONNECTION POOLS\n"
+            f"-------------------------\n"
+        )
+        for worker, stats in sorted(worker_pools.items()):
+            report += f"{worker}:\n{PoolStats.format_snapshot(stats)}\n"
+        report += "\n"
+
+    # API retries and circuit breakers, per worker
+    current = retry_snapshot()
+    worker_retries = test_data["api_retry_stats"] or ({"main": current} if current["budget"]["requests"] else {})
+    if worker_retries:
+        report += (
+            f"API RETRIES\n"
+            f"-------------------------\n"
+        )
+        for worker, stats in sorted(worker_retries.items()):
+            report += f"{worker}:\n{format_retry_snapshot(stats)}\n"
+        report += "\n"
+
+    # Page performance per URL, from the reports of all workers
+    visits = [visit
+              for reports in terminalreporter.stats.values() for report in reports
+              if getattr(report, "when", None) == "teardown"
+              for name, value in getattr(report, "user_properties", []) if name == "page_metrics"
+              for visit in value]
+    if visits:
+        report += (
+            f"PAGE METRICS (p50/p95)\n"
+            f"-------------------------\n"
+            f"{format_aggregate(aggregate(visits))}\n\n"
+        )
+
     print(report)
 
 
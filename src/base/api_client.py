@@ -3,24 +3,50 @@ API Client Module.
 
 This module provides a client for making API requests with various HTTP methods.
 It supports request customization, response validation, and error handling.
+Batches of requests can run concurrently over the shared session. Every
+request gets connect/read timeouts from its TimeoutPolicy, capped by the
+test's deadline.
 """
 import json
-from typing import Optional, Dict, Any, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Union
+import requests
+from src.base.api_timeouts import TimeoutPolicy, current_deadline, timeout_kind
 from src.utils import logger
 log = logger.customLogger()
 
 
+@dataclass
+class RequestResult:
+    """Outcome of one request of a batch (see APIClient.make_requests)."""
+
+    index: int
+    spec: Dict
+    response: Any = None
+    exception: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the request got a response (of any status code)."""
+        return self.exception is None
+
+
 class APIClient:
     """API Client for making HTTP requests."""
 
-    def __init__(self, session):
+    def __init__(self, session, timeouts: Optional[TimeoutPolicy] = None):
         """
         Initialize API client with session.
 
         Args:
             session: Request session object
+            timeouts: Timeout policy of the test (defaults to one from the environment)
         """
         self.session = session
+        self.timeouts = timeouts or TimeoutPolicy.from_env()
         self.method_map = {
             'GET': self.get_request,
             'POST': self.post_request,
@@ -41,7 +67,8 @@ class APIClient:
             path_params: Dictionary to replace path placeholders in api_endpoint
             api_endpoint = "/api/v1/todos/{id}"  # Must include {id}
             path_params = {"id": "123"}  # Key must match the placeholder
-            **kwargs: Additional arguments to pass to the request method
+            **kwargs: Additional arguments to pass to the request method, e.g.
+                timeout (seconds, (connect, read) or {"connect": c, "read": r})
 
         Returns:
             Response object
@@ -49,6 +76,7 @@ class APIClient:
         Raises:
             ValueError: If unsupported HTTP method is provided
             KeyError: If path_params is missing a required placeholder
+            APITimeoutError: If the request times out or the test deadline has passed
         """
         method = method.upper()
         if method not in self.method_map:
@@ -70,10 +98,76 @@ class APIClient:
         log.info(f"Making {method} request to {base_url}{api_endpoint}")
         return self.method_map[method](base_url, api_endpoint, **kwargs)
 
+    def make_requests(self, batch: List[Dict], max_concurrency: int = 8) -> List[RequestResult]:
+        """
+        Make a batch of requests concurrently over the shared session.
+
+        Every spec holds the keyword arguments of make_request(). Requests go
+        through the session's adapters (so its retry policy and connection pool
+        apply), and a failing request does not abort the others.
+
+        Args:
+            batch: Request specs, e.g. {"base_url": url, "api_endpoint": "/todos/{id}",
+                "method": "GET", "path_params": {"id": "1"}, "header": {...}}
+            max_concurrency: Most requests in flight at once
+
+        Returns:
+            One RequestResult per spec, in input order, with the response or the
+            exception and the elapsed time in seconds
+        """
+        if not batch:
+            return []
+        log.info(f"Making {len(batch)} requests with max concurrency {max_concurrency}")
+
+        def run(index, spec):
+            start = time.monotonic()
+            try:
+                response = self.make_request(**spec)
+                return RequestResult(index, spec, response=response, elapsed=time.monotonic() - start)
+            except Exception as e:
+                log.error(f"Request {index} of the batch failed: {type(e).__name__}: {str(e)}")
+                return RequestResult(index, spec, exception=e, elapsed=time.monotonic() - start)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(batch))),
+                                thread_name_prefix="api-batch") as executor:
+            results = list(executor.map(run, range(len(batch)), batch))
+        failed = sum(1 for result in results if not result.ok)
+        log.info(f"Batch finished: {len(results) - failed} responses, {failed} errors, "
+                 f"slowest {max(result.elapsed for result in results):.3f}s")
+        return results
+
+    def _send(self, method: str, url: str, timeout: Any = None, **kwargs) -> Any:
+        """
+        Send a request over the session with the timeout of the test's policy.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Optional override of the policy's timeout
+            **kwargs: Arguments for session.request()
+
+        Returns:
+            Response object
 
+        Raises:
+            APITimeoutError: If the request times out or the test deadline has passed
+        """
+        timeout = self.timeouts.timeout_for(method, url, timeout)
+        log.info(f"Timeouts (connect, read): {timeout[0]:g}s, {timeout[1]:g}s")
+        start = time.monotonic()
+        deadline = current_deadline.set(self.timeouts.deadline)
+        try:
+            return self.session.request(method, url, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            kind = timeout_kind(e)
+            if kind:
+                raise self.timeouts.timeout_error(method, url, time.monotonic() - start, timeout, kind) from e
+            raise
+        finally:
+            current_deadline.reset(deadline)
 
     def get_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
-                    query_params: Optional[Dict] = None) -> Any:
+                    query_params: Optional[Dict] = None, timeout: Any = None) -> Any:
         """
         Perform a GET request.
 
@@ -82,6 +176,7 @@ class APIClient:
             api_endpoint: API endpoint
             header: Optional headers
             query_params: Optional query parameters
+            timeout: Optional timeout override (see make_request)
 
         Returns:
             Response object
@@ -101,7 +196,7 @@ class APIClient:
             else:
                 log.info("No headers provided.")
 
-            response = self.session.get(url, headers=header, params=query_params, timeout=None)
+            response = self._send("GET", url, timeout, headers=header, params=query_params)
             return response
 
         except Exception as e:
@@ -110,7 +205,7 @@ class APIClient:
 
     def post_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
                      param: Optional[Dict] = None, payload: Optional[Union[Dict, str]] = None,
-                     file: Optional[Dict] = None) -> Any:
+                     file: Optional[Dict] = None, timeout: Any = None) -> Any:
         """
         Perform a POST request.
 
@@ -121,6 +216,7 @@ class APIClient:
             param: Optional query parameters
             payload: Optional request payload
             file: Optional files to upload
+            timeout: Optional timeout override (see make_request)
 
         Returns:
             Response object
@@ -151,11 +247,11 @@ class APIClient:
 
         try:
             if file is not None:
-                response = self.session.post(url, headers=header, data=payload,
-                                             params=param, files=file, timeout=None)
+                response = self._send("POST", url, timeout, headers=header, data=payload,
+                                    params=param, files=file)
             else:
-                response = self.session.post(url, headers=header, data=json.dumps(payload),
-                                             params=param, timeout=None)
+                response = self._send("POST", url, timeout, headers=header, data=json.dumps(payload),
+                                    params=param)
             return response
 
         except Exception as e:
@@ -163,7 +259,7 @@ class APIClient:
             raise
 
     def put_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
-                    payload: Optional[Dict] = None, param: Optional[Dict] = None) -> Any:
+                    payload: Optional[Dict] = None, param: Optional[Dict] = None, timeout: Any = None) -> Any:
         """
         Perform a PUT request.
 
@@ -173,6 +269,7 @@ class APIClient:
             header: Optional headers
             payload: Optional request payload
             param: Optional query parameters
+            timeout: Optional timeout override (see make_request)
 
         Returns:
             Response object
@@ -197,8 +294,8 @@ class APIClient:
             log.warning("No payload provided.")
 
         try:
-            response = self.session.put(url, headers=header, data=json.dumps(payload),
-                                        params=param, timeout=None)
+            response = self._send("PUT", url, timeout, headers=header, data=json.dumps(payload),
+                                    params=param)
             return response
 
         except Exception as e:
@@ -206,7 +303,7 @@ class APIClient:
             raise
 
     def patch_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
-                      payload: Optional[Dict] = None) -> Any:
+                      payload: Optional[Dict] = None, timeout: Any = None) -> Any:
         """
         Perform a PATCH request.
 
@@ -215,6 +312,7 @@ class APIClient:
             api_endpoint: API endpoint
             header: Optional headers
             payload: Optional request payload
+            timeout: Optional timeout override (see make_request)
 
         Returns:
             Response object
@@ -234,7 +332,7 @@ class APIClient:
             log.warning("No payload provided.")
 
         try:
-            response = self.session.patch(url, headers=header, data=json.dumps(payload), timeout=None)
+            response = self._send("PATCH", url, timeout, headers=header, data=json.dumps(payload))
             return response
 
         except Exception as e:
@@ -242,7 +340,8 @@ class APIClient:
             raise
 
     def delete_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
-                       payload: Optional[Dict] = None, query_params: Optional[Dict] = None) -> Any:
+                       payload: Optional[Dict] = None, query_params: Optional[Dict] = None,
+                       timeout: Any = None) -> Any:
         """
         Perform a DELETE request.
 
@@ -252,6 +351,7 @@ class APIClient:
             header: Optional headers
             payload: Optional request payload
             query_params: Optional query parameters
+            timeout: Optional timeout override (see make_request)
 
         Returns:
             Response object
@@ -276,7 +376,7 @@ class APIClient:
             log.warning("No query parameters provided.")
 
         try:
-            response = self.session.delete(url, headers=header, params=query_params, timeout=None)
+            response = self._send("DELETE", url, timeout, headers=header, params=query_params)
             return response
 
         except Exception as e:
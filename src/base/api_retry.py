@@ -0,0 +1,334 @@
+"""
+API Retry Module.
+
+This module provides the retry and fail-fast layer of the API session:
+
+- BudgetedRetry retries idempotent requests only, with capped, jittered
+  backoff. It stops at the test's deadline and when the process-wide retry
+  budget (retries as a ratio of requests) is used up, so a degraded backend
+  is not hammered by every test.
+- CircuitBreakers keep one circuit breaker per host. After sustained gateway
+  errors (502/503/504 by default), timeouts or connection failures the breaker
+  opens, and further calls to that host fail at once with a diagnosis instead
+  of waiting on a broken environment. After a cool-down one probe request
+  decides whether it closes.
+"""
+import os
+import random
+import threading
+import time
+from itertools import takewhile
+import requests
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from src.base.api_timeouts import current_deadline
+from src.utils import logger
+log = logger.customLogger()
+
+# Server errors worth retrying (bad gateway, unavailable, gateway timeout)
+RETRY_STATUSES = (502, 503, 504)
+
+# Statuses that count as circuit breaker failures: the backend behind the host is
+# down. A 500 is the expected answer of many negative tests, so it does not count.
+BREAKER_STATUSES = (502, 503, 504)
+
+# Methods that are safe to repeat. POST and PATCH are never retried, and DELETE
+# is not either: a repeated DELETE whose first attempt went through returns 404.
+# Connection failures are retried for every method, the request was never sent.
+DEFAULT_RETRY_METHODS = "GET,HEAD,OPTIONS,PUT"
+
+
+def _env_float(name, default):
+    """Read a number from the environment, falling back to the default."""
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        log.warning(f"Invalid {name} env var. Using default: {default}")
+        return default
+
+
+class RetryRatioBudget:
+    """Process-wide budget of retries, as a ratio of the requests sent."""
+
+    def __init__(self, ratio=None, minimum=None):
+        """
+        Initialize retry budget.
+
+        Args:
+            ratio (float, optional): Retries allowed per request sent. Defaults to
+                the API_RETRY_BUDGET_RATIO env var (0.2), read on first use.
+            minimum (int, optional): Retries always allowed, so the first requests
+                of a run can retry. Defaults to API_RETRY_BUDGET_MIN (10).
+        """
+        self.ratio = ratio
+        self.minimum = minimum
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Count a request sent by the session."""
+        with self._lock:
+            self.requests += 1
+
+    def allow_retry(self):
+        """
+        Take one retry from the budget.
+
+        Returns:
+            bool: True if the retry may be made
+        """
+        with self._lock:
+            if self.ratio is None:
+                self.ratio = _env_float("API_RETRY_BUDGET_RATIO", 0.2)
+                self.minimum = self.minimum if self.minimum is not None else _env_float("API_RETRY_BUDGET_MIN", 10)
+            if self.retries < self.minimum + self.ratio * self.requests:
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+    def snapshot(self):
+        """
+        Copy the counters (e.g. to send them from an xdist worker to the controller).
+
+        Returns:
+            dict: requests, retries and denied retries
+        """
+        with self._lock:
+            return {"requests": self.requests, "retries": self.retries, "denied": self.denied}
+
+
+class BudgetedRetry(Retry):
+    """urllib3 Retry that retries idempotent methods within the retry budget and the test deadline."""
+
+    def get_backoff_cap(self):
+        """Longest backoff before the next retry: backoff_factor * 2^(n-1), capped at backoff_max."""
+        consecutive = len(list(takewhile(lambda attempt: attempt.redirect_location is None,
+                                         reversed(self.history))))
+        if consecutive == 0:
+            return 0.0
+        return min(self.backoff_max, self.backoff_factor * (2 ** (consecutive - 1)))
+
+    def get_backoff_time(self):
+        """Full-jitter backoff: a random delay up to get_backoff_cap()."""
+        return random.uniform(0, self.get_backoff_cap())
+
+    def get_retry_after(self, response):
+        """Retry-After of the server, capped at backoff_max."""
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.backoff_max)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        """Count the retry, unless the retry budget is used up or the deadline leaves no time for it."""
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if response is not None and error is None and response.get_redirect_location():
+            return retry
+
+        deadline = current_deadline.get()
+        delay = retry.get_backoff_cap()
+        if response is not None and self.respect_retry_after_header:
+            delay = max(delay, retry.get_retry_after(response) or 0)
+        if deadline is not None and deadline - time.monotonic() <= delay:
+            log.warning(f"Not retrying {method} {url}: the test deadline leaves no time for a retry")
+        elif api_retry_budget.allow_retry():
+            log.warning(f"Retrying {method} {url} after {error or response.status} "
+                        f"(attempt {len(retry.history)}, backoff up to {delay:.2f}s)")
+            return retry
+        else:
+            log.warning(f"Not retrying {method} {url}: retry budget used up "
+                        f"({api_retry_budget.retries} retries for {api_retry_budget.requests} requests)")
+        raise MaxRetryError(_pool, url, error or ResponseError(f"{response.status} and no retry left"))
+
+
+def retry_from_env():
+    """
+    Create the session's retry policy from the environment.
+
+    Returns:
+        BudgetedRetry: Policy from API_RETRIES, API_RETRY_BACKOFF, API_RETRY_BACKOFF_MAX and API_RETRY_METHODS
+    """
+    methods = [method.strip().upper() for method in os.getenv("API_RETRY_METHODS", DEFAULT_RETRY_METHODS).split(",")]
+    return BudgetedRetry(total=int(_env_float("API_RETRIES", 3)),
+                         backoff_factor=_env_float("API_RETRY_BACKOFF", 0.5),
+                         backoff_max=_env_float("API_RETRY_BACKOFF_MAX", 5),
+                         status_forcelist=RETRY_STATUSES,
+                         allowed_methods=frozenset(filter(None, methods)),
+                         raise_on_status=False)
+
+
+def _breaker_statuses():
+    """Read the statuses that count as breaker failures from API_BREAKER_STATUSES."""
+    value = os.getenv("API_BREAKER_STATUSES", ",".join(map(str, BREAKER_STATUSES)))
+    try:
+        return tuple(int(status) for status in value.split(",") if status.strip())
+    except ValueError:
+        log.warning(f"Invalid API_BREAKER_STATUSES env var. Using default: {BREAKER_STATUSES}")
+        return BREAKER_STATUSES
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """A request was not sent because the circuit breaker of its host is open."""
+
+
+class CircuitBreaker:
+    """Circuit breaker of one host."""
+
+    def __init__(self, host, failure_threshold, cooldown, failure_statuses=BREAKER_STATUSES):
+        """
+        Initialize circuit breaker (closed).
+
+        Args:
+            host (str): Host (and port) the breaker guards
+            failure_threshold (int): Consecutive failures that open the breaker
+            cooldown (float): Seconds the breaker stays open before a probe request
+            failure_statuses (tuple, optional): Response statuses that count as failures
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failure_statuses = failure_statuses
+        self.state = "closed"
+        self.failures = 0
+        self.last_failure = None
+        self.opened_at = None
+        self.trips = 0
+        self.short_circuited = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self, method, url):
+        """
+        Let a request through, or fail it at once while the breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or a probe request is already in flight)
+        """
+        with self._lock:
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half-open"
+                self._probing = False
+            if self.state == "closed" or (self.state == "half-open" and not self._probing):
+                self._probing = self.state == "half-open"
+                return
+            self.short_circuited += 1
+            message = f"{method} {url} not sent: {self.diagnosis()}"
+        log.error(message)
+        raise CircuitOpenError(message)
+
+    def record(self, failure=None):
+        """
+        Record the outcome of a request.
+
+        Args:
+            failure (str, optional): Description of the failure, None for success
+        """
+        with self._lock:
+            self._probing = False
+            if failure is None:
+                if self.state != "closed":
+                    log.info(f"Circuit breaker for {self.host} closed again")
+                self.state = "closed"
+                self.failures = 0
+                return
+            self.failures += 1
+            self.last_failure = failure
+            if self.state == "half-open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+                if self.state == "closed":
+                    self.trips += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                log.error(f"Circuit breaker for {self.host} opened: {self.diagnosis()}")
+
+    def diagnosis(self):
+        """Explain why the breaker is open (call with the lock held)."""
+        wait = max(0.0, self.cooldown - (time.monotonic() - self.opened_at)) if self.opened_at else 0.0
+        return (f"circuit breaker for {self.host} is open after {self.failures} consecutive failures "
+                f"(last: {self.last_failure}); the backend looks unavailable, failing fast for {wait:.0f}s more")
+
+    def snapshot(self):
+        """
+        Copy the breaker's counters.
+
+        Returns:
+            dict: state, trips, short-circuited calls and last failure
+        """
+        with self._lock:
+            return {"state": self.state, "trips": self.trips, "short_circuited": self.short_circuited,
+                    "last_failure": self.last_failure}
+
+
+class CircuitBreakers:
+    """Circuit breakers per host, shared by all sessions of the process."""
+
+    def __init__(self):
+        """Initialize circuit breaker registry."""
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, host):
+        """
+        Get the breaker of a host, creating it on first use.
+
+        Thresholds come from API_BREAKER_FAILURES (5), API_BREAKER_COOLDOWN (30s)
+        and API_BREAKER_STATUSES (502,503,504); an API_BREAKER_FAILURES of 0
+        disables the breakers.
+
+        Args:
+            host (str): Host (and port)
+
+        Returns:
+            CircuitBreaker: Breaker of the host, or None if breakers are disabled
+        """
+        with self._lock:
+            breaker = self.breakers.get(host)
+            if breaker is None:
+                threshold = int(_env_float("API_BREAKER_FAILURES", 5))
+                if threshold <= 0:
+                    return None
+                breaker = self.breakers[host] = CircuitBreaker(host, threshold,
+                                                               _env_float("API_BREAKER_COOLDOWN", 30),
+                                                               _breaker_statuses())
+            return breaker
+
+    def snapshot(self):
+        """
+        Copy the breakers' counters.
+
+        Returns:
+            dict: host -> breaker counters (hosts whose breaker never opened are left out)
+        """
+        with self._lock:
+            breakers = list(self.breakers.items())
+        return {host: breaker.snapshot() for host, breaker in breakers if breaker.trips}
+
+
+def format_snapshot(snapshot):
+    """
+    Format retry budget and breaker counters as report lines.
+
+    Args:
+        snapshot (dict): {"budget": RetryRatioBudget.snapshot(), "breakers": CircuitBreakers.snapshot()}
+
+    Returns:
+        str: Human readable counters
+    """
+    budget = snapshot["budget"]
+    lines = [f"  - Requests: {budget['requests']} | Retries: {budget['retries']} | "
+             f"Denied by budget: {budget['denied']}"]
+    for host, breaker in sorted(snapshot["breakers"].items()):
+        lines.append(f"  - Circuit breaker {host} > Opened: {breaker['trips']} | "
+                     f"Failed fast: {breaker['short_circuited']} | Now: {breaker['state']} | "
+                     f"Last failure: {breaker['last_failure']}")
+    return "\n".join(lines)
+
+
+def snapshot():
+    """Retry budget and breaker counters of this process (see format_snapshot)."""
+    return {"budget": api_retry_budget.snapshot(), "breakers": circuit_breakers.snapshot()}
+
+
+# Process-wide budget and breakers; each xdist worker keeps its own
+api_retry_budget = RetryRatioBudget()
+circuit_breakers = CircuitBreakers()
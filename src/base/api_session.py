@@ -0,0 +1,251 @@
+"""
+API Session Module.
+
+This module builds the requests session shared by the API tests. Its adapter
+sizes the urllib3 connection pools from the environment (with per-host
+overrides) and counts, per host, the connections opened and reused, the waits
+for a free connection and the connections discarded because the pool was full,
+so the run summary shows whether keep-alive works and the pools are big enough.
+Requests are retried by BudgetedRetry and guarded by per-host circuit breakers
+(see api_retry).
+"""
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+from src.base.api_retry import api_retry_budget, circuit_breakers, retry_from_env
+from src.utils import logger
+log = logger.customLogger()
+
+# Counters kept per host, in report order
+POOL_COUNTERS = ("opened", "reused", "waits", "discarded")
+
+
+class PoolStats:
+    """Connection pool counters per host, shared by all pools of the process."""
+
+    def __init__(self):
+        """Initialize pool stats."""
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def record(self, host, counter, wait_seconds=0.0):
+        """
+        Count one pool event.
+
+        Args:
+            host (str): scheme://host:port of the pool
+            counter (str): One of POOL_COUNTERS
+            wait_seconds (float, optional): Time spent waiting for a connection
+        """
+        with self._lock:
+            stats = self.hosts.setdefault(host, dict(dict.fromkeys(POOL_COUNTERS, 0), wait_seconds=0.0))
+            stats[counter] += 1
+            stats["wait_seconds"] += wait_seconds
+
+    def snapshot(self):
+        """
+        Copy the counters (e.g. to send them from an xdist worker to the controller).
+
+        Returns:
+            dict: host -> {counter: value}
+        """
+        with self._lock:
+            return {host: dict(stats) for host, stats in self.hosts.items()}
+
+    @staticmethod
+    def format_snapshot(snapshot):
+        """
+        Format pool counters as report lines.
+
+        Args:
+            snapshot (dict): host -> {counter: value}, from snapshot()
+
+        Returns:
+            str: One line per host
+        """
+        lines = []
+        for host, stats in sorted(snapshot.items()):
+            requests_made = stats["opened"] + stats["reused"]
+            reuse = stats["reused"] / requests_made * 100 if requests_made else 0.0
+            lines.append(f"  - {host} > Opened: {stats['opened']} | Reused: {stats['reused']} ({reuse:.1f}%) | "
+                         f"Pool waits: {stats['waits']} ({stats['wait_seconds']:.2f}s) | "
+                         f"Discarded: {stats['discarded']}")
+        return "\n".join(lines)
+
+    def format_summary(self):
+        """Format the counters of this process as report lines."""
+        return self.format_snapshot(self.snapshot())
+
+
+class _InstrumentedPoolMixin:
+    """Counts connection checkouts and check-ins of a urllib3 connection pool."""
+
+    def _get_conn(self, timeout=None):
+        """Get a connection, counting it as opened or reused and any wait for it."""
+        host = f"{self.scheme}://{self.host}:{self.port}"
+        # A blocking pool with no idle connection makes the caller wait for one
+        waiting = self.block and self.pool is not None and self.pool.empty()
+        start = time.monotonic()
+        try:
+            conn = super()._get_conn(timeout)
+        finally:
+            if waiting:
+                pool_stats.record(host, "waits", time.monotonic() - start)
+        # A connection without a socket (new, or reset after the server dropped it) connects again
+        pool_stats.record(host, "opened" if conn.is_closed else "reused")
+        return conn
+
+    def _put_conn(self, conn):
+        """Return a connection, counting it if the pool is full and it gets closed."""
+        if conn is not None and self.pool is not None and self.pool.full():
+            pool_stats.record(f"{self.scheme}://{self.host}:{self.port}", "discarded")
+        super()._put_conn(conn)
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    """HTTP connection pool with pool stats."""
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    """HTTPS connection pool with pool stats."""
+
+
+class InstrumentedPoolManager(PoolManager):
+    """Pool manager that creates instrumented pools, sized per host."""
+
+    def __init__(self, *args, host_overrides=None, **kwargs):
+        """
+        Initialize pool manager.
+
+        Args:
+            host_overrides (dict, optional): host -> {"maxsize": int, "block": bool}
+        """
+        super().__init__(*args, **kwargs)
+        self.host_overrides = host_overrides or {}
+        self.pool_classes_by_scheme = {"http": InstrumentedHTTPConnectionPool,
+                                       "https": InstrumentedHTTPSConnectionPool}
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        """Create the pool of a host, applying its overrides."""
+        request_context = dict(request_context if request_context is not None else self.connection_pool_kw)
+        override = self.host_overrides.get(host)
+        if override:
+            request_context.update(override)
+            log.info(f"Connection pool for {host}: {override}")
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with instrumented per-host pools, guarded by per-host circuit breakers."""
+
+    def __init__(self, pool_connections=DEFAULT_POOLSIZE, pool_maxsize=DEFAULT_POOLSIZE,
+                 pool_block=DEFAULT_POOLBLOCK, host_overrides=None, **kwargs):
+        """
+        Initialize adapter.
+
+        Args:
+            pool_connections (int): Number of host pools kept
+            pool_maxsize (int): Connections kept per host
+            pool_block (bool): Wait for a free connection instead of opening (and then discarding) extra ones
+            host_overrides (dict, optional): host -> {"maxsize": int, "block": bool}
+            **kwargs: Other HTTPAdapter arguments (e.g. max_retries)
+        """
+        # Set before HTTPAdapter.__init__, which creates the pool manager
+        self.host_overrides = host_overrides or {}
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                         pool_block=pool_block, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        """Create the instrumented pool manager."""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = InstrumentedPoolManager(num_pools=connections, maxsize=maxsize, block=block,
+                                                   host_overrides=getattr(self, "host_overrides", None),
+                                                   **pool_kwargs)
+
+    def send(self, request, **kwargs):
+        """
+        Send a request unless its host's circuit breaker is open, and record the outcome.
+
+        Raises:
+            CircuitOpenError: If the host's breaker is open
+        """
+        parts = urlsplit(request.url)
+        breaker = circuit_breakers.breaker_for(parts.netloc)
+        if breaker is not None:
+            breaker.before_request(request.method, request.url)
+        api_retry_budget.record_request()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(f"{type(e).__name__} on {request.method} {parts.path}")
+            raise
+        if breaker is not None:
+            breaker.record(f"{response.status_code} {response.reason} on {request.method} {parts.path}"
+                           if response.status_code in breaker.failure_statuses else None)
+        return response
+
+
+def pool_settings():
+    """
+    Read the connection pool settings from the environment.
+
+    API_POOL_HOST_OVERRIDES lists host=maxsize[:block] entries separated by
+    commas, e.g. "api.freeapi.app=32,localhost=4:true".
+
+    Returns:
+        dict: pool_connections, pool_maxsize, pool_block and host_overrides
+    """
+    try:
+        connections = int(os.getenv("API_POOL_CONNECTIONS", str(DEFAULT_POOLSIZE)))
+        maxsize = int(os.getenv("API_POOL_MAXSIZE", str(DEFAULT_POOLSIZE)))
+    except ValueError:
+        log.warning(f"Invalid API_POOL_CONNECTIONS/API_POOL_MAXSIZE env var. Using default: {DEFAULT_POOLSIZE}")
+        connections = maxsize = DEFAULT_POOLSIZE
+    block = os.getenv("API_POOL_BLOCK", "False").lower() == "true"
+
+    overrides = {}
+    for entry in filter(None, (item.strip() for item in os.getenv("API_POOL_HOST_OVERRIDES", "").split(","))):
+        host, _, value = entry.partition("=")
+        size, _, host_block = value.partition(":")
+        try:
+            override = {"maxsize": int(size)}
+        except ValueError:
+            log.warning(f"Invalid API_POOL_HOST_OVERRIDES entry '{entry}'. Expected host=maxsize[:block]")
+            continue
+        if host_block:
+            override["block"] = host_block.lower() == "true"
+        overrides[host.strip()] = override
+    return {"pool_connections": connections, "pool_maxsize": maxsize, "pool_block": block,
+            "host_overrides": overrides}
+
+
+def create_api_session(max_retries=None):
+    """
+    Create a requests session with instrumented, configurable connection pools.
+
+    Args:
+        max_retries: Retry policy for the adapter (int or urllib3 Retry). Defaults
+            to the budgeted retry policy from the environment (see api_retry).
+
+    Returns:
+        requests.Session: Session with the adapter mounted for http:// and https://
+    """
+    settings = pool_settings()
+    log.info(f"API connection pools: {settings}")
+    adapter = PooledHTTPAdapter(max_retries=retry_from_env() if max_retries is None else max_retries, **settings)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Process-wide stats; each xdist worker counts its own connections
+pool_stats = PoolStats()
@@ -0,0 +1,198 @@
+"""
+API Timeouts Module.
+
+This module decides the timeouts of API requests: separate connect and read
+timeouts from the environment, per-endpoint overrides from test data, and a
+per-test deadline that caps every request the test makes. A request that times
+out raises APITimeoutError, which names the limit that was hit and the time the
+request took, so timeouts are reported apart from other failures.
+"""
+import contextvars
+import os
+import time
+from fnmatch import fnmatchcase
+import requests
+from urllib3.exceptions import ConnectTimeoutError, TimeoutError as Urllib3TimeoutError
+from src.utils.file_reader import get_file_with_json_extension, read_file
+from src.utils import logger
+log = logger.customLogger()
+
+# Deadline (time.monotonic()) of the request being sent in this context, None without one;
+# the session's retry policy reads it to stop retrying when the test runs out of time
+current_deadline = contextvars.ContextVar("current_deadline", default=None)
+
+
+class APITimeoutError(requests.exceptions.Timeout):
+    """An API request ran into its connect/read timeout or the test deadline."""
+
+    def __init__(self, method, url, elapsed, limit):
+        """
+        Initialize timeout error.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            elapsed (float): Seconds the request took before it timed out
+            limit (str): Limit that was hit, e.g. "read timeout 30s"
+        """
+        self.method = method
+        self.url = url
+        self.elapsed = elapsed
+        self.limit = limit
+        super().__init__(f"{method} {url} timed out after {elapsed:.2f}s ({limit})")
+
+
+def timeout_kind(exception):
+    """
+    Tell whether a requests exception was caused by a timeout.
+
+    Timeouts that used up the adapter's retries reach the caller as a
+    ConnectionError wrapping urllib3's MaxRetryError, not as ReadTimeout.
+
+    Args:
+        exception (Exception): Exception raised by a requests call
+
+    Returns:
+        str: "connect" or "read", or None if it is not a timeout
+    """
+    if isinstance(exception, requests.exceptions.ConnectTimeout):
+        return "connect"
+    if isinstance(exception, requests.exceptions.Timeout):
+        return "read"
+    reason = getattr(exception.args[0], "reason", None) if exception.args else None
+    if isinstance(reason, ConnectTimeoutError):
+        return "connect"
+    return "read" if isinstance(reason, Urllib3TimeoutError) else None
+
+
+def _pair(value):
+    """(connect, read) from a number, a [connect, read] list or a {"connect", "read"} dict."""
+    if isinstance(value, dict):
+        return value.get("connect"), value.get("read")
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value, value
+
+
+def load_endpoint_timeouts(folder_name="", file_name="api_timeouts.json"):
+    """
+    Load per-endpoint timeouts from test data.
+
+    The file maps URL patterns to a timeout in seconds (connect and read) or
+    separate limits, e.g. {"*/api/v1/todos/*": {"read": 60}, "*/upload*": 120}.
+
+    Args:
+        folder_name (str, optional): Folder under testData/. Defaults to testData/ itself.
+        file_name (str, optional): Timeout file. Defaults to api_timeouts.json.
+
+    Returns:
+        dict: URL pattern -> timeout; empty if the file does not exist
+    """
+    if not os.path.exists(get_file_with_json_extension(folder_name, file_name)):
+        return {}
+    return read_file(folder_name, file_name)
+
+
+class TimeoutPolicy:
+    """Timeouts of the requests of one test."""
+
+    def __init__(self, connect=10.0, read=30.0, endpoint_timeouts=None, deadline_seconds=0):
+        """
+        Initialize timeout policy; the deadline starts now.
+
+        Args:
+            connect (float): Default connect timeout in seconds
+            read (float): Default read timeout in seconds (between bytes received)
+            endpoint_timeouts (dict, optional): URL pattern -> timeout (see load_endpoint_timeouts)
+            deadline_seconds (float, optional): Time all requests of the test must finish in (0 disables it)
+        """
+        self.connect = connect
+        self.read = read
+        self.endpoint_timeouts = endpoint_timeouts or {}
+        self.deadline_seconds = deadline_seconds
+        self.deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+
+    @classmethod
+    def from_env(cls, endpoint_timeouts=None, deadline_seconds=None):
+        """
+        Create a policy from API_CONNECT_TIMEOUT, API_TIMEOUT (read) and API_TEST_TIMEOUT.
+
+        Args:
+            endpoint_timeouts (dict, optional): URL pattern -> timeout
+            deadline_seconds (float, optional): Deadline of the test, instead of API_TEST_TIMEOUT
+
+        Returns:
+            TimeoutPolicy: Policy whose deadline starts now
+        """
+        try:
+            connect = float(os.getenv("API_CONNECT_TIMEOUT", "10"))
+            read = float(os.getenv("API_TIMEOUT", "30"))
+            if deadline_seconds is None:
+                deadline_seconds = float(os.getenv("API_TEST_TIMEOUT", "0"))
+        except ValueError:
+            log.warning("Invalid API_CONNECT_TIMEOUT/API_TIMEOUT/API_TEST_TIMEOUT env var. Using defaults: 10/30/0")
+            connect, read, deadline_seconds = 10.0, 30.0, deadline_seconds or 0
+        return cls(connect, read, endpoint_timeouts, deadline_seconds)
+
+    def remaining(self):
+        """Seconds left until the test deadline, or None without a deadline."""
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def timeout_for(self, method, url, override=None):
+        """
+        Get the (connect, read) timeout of a request.
+
+        An explicit override wins over the endpoint timeouts, which win over the
+        defaults; both parts are capped by the time left until the deadline.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            override (optional): Timeout passed by the caller (number, pair or dict)
+
+        Returns:
+            tuple: (connect, read) in seconds
+
+        Raises:
+            APITimeoutError: If the test deadline has already passed
+        """
+        connect, read = self.connect, self.read
+        if override is None:
+            override = next((value for pattern, value in self.endpoint_timeouts.items()
+                             if fnmatchcase(url, pattern)), None)
+        if override is not None:
+            override_connect, override_read = _pair(override)
+            connect = connect if override_connect is None else override_connect
+            read = read if override_read is None else override_read
+
+        remaining = self.remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                raise APITimeoutError(method, url, 0.0, f"test deadline of {self.deadline_seconds:g}s already passed")
+            connect, read = min(connect, remaining), min(read, remaining)
+        return connect, read
+
+    def timeout_error(self, method, url, elapsed, timeout, kind="read"):
+        """
+        Build the APITimeoutError of a request that timed out.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            elapsed (float): Seconds the request took
+            timeout (tuple): (connect, read) the request was sent with
+            kind (str, optional): "connect" or "read" (see timeout_kind)
+
+        Returns:
+            APITimeoutError: Error naming the limit that was hit
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            limit = f"test deadline of {self.deadline_seconds:g}s"
+        elif kind == "connect":
+            limit = f"connect timeout {timeout[0]:g}s"
+        else:
+            limit = f"read timeout {timeout[1]:g}s"
+        error = APITimeoutError(method, url, elapsed, limit)
+        log.error(str(error))
+        return error
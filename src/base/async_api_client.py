@@ -0,0 +1,334 @@
+"""
+Async API Client Module.
+
+This module provides an asyncio counterpart of APIClient built on aiohttp.
+It keeps APIClient's make_request contract and per-method arguments, and
+returns requests.Response objects, so the validators in api_utilities and the
+Allure helpers work unchanged. One event loop can keep hundreds of requests in
+flight without a thread per call. Timeouts and the test deadline come from
+the same TimeoutPolicy as APIClient's, and requests go through the same
+per-host circuit breakers and count towards the same retry budget as the
+API session's (see api_retry); the async client itself does not retry.
+"""
+import asyncio
+import json
+import os
+import time
+from datetime import timedelta
+from typing import Optional, Dict, Any, List, Union
+from urllib.parse import urlsplit
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from src.base.api_client import RequestResult
+from src.base.api_retry import api_retry_budget, circuit_breakers
+from src.base.api_timeouts import TimeoutPolicy
+from src.utils import logger
+log = logger.customLogger()
+
+
+def _query(params: Optional[Dict]) -> Optional[Dict]:
+    """Query parameters encoded the way requests does (None dropped, lists repeated, values as str)."""
+    if not params:
+        return None
+    query = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            query[key] = [str(item) for item in value if item is not None]
+        else:
+            query[key] = str(value)
+    return query
+
+
+def _form_data(payload: Optional[Union[Dict, str]], file: Dict) -> aiohttp.FormData:
+    """Multipart body from a requests-style data dict and files dict."""
+    form = aiohttp.FormData()
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            form.add_field(key, str(value))
+    for name, value in file.items():
+        filename, content_type = os.path.basename(getattr(value, "name", name)), None
+        if isinstance(value, (list, tuple)):
+            filename, content_type, value = value[0], value[2] if len(value) > 2 else None, value[1]
+        form.add_field(name, value, filename=filename, content_type=content_type)
+    return form
+
+
+def create_connector() -> aiohttp.TCPConnector:
+    """
+    Create the connector of an async API session (call it inside the event loop).
+
+    aiohttp's default caps a session at 100 connections in flight; the limit
+    comes from API_ASYNC_MAX_CONNECTIONS instead, 0 meaning no limit.
+
+    Returns:
+        aiohttp.TCPConnector: Connector sized from the environment
+    """
+    try:
+        limit = int(os.getenv("API_ASYNC_MAX_CONNECTIONS", "0"))
+    except ValueError:
+        log.warning("Invalid API_ASYNC_MAX_CONNECTIONS env var. Using default: 0 (no limit)")
+        limit = 0
+    return aiohttp.TCPConnector(limit=max(limit, 0))
+
+
+class AsyncAPIClient:
+    """Asyncio API client for making HTTP requests."""
+
+    def __init__(self, session: aiohttp.ClientSession, timeouts: Optional[TimeoutPolicy] = None):
+        """
+        Initialize async API client with session.
+
+        Args:
+            session: aiohttp client session
+            timeouts: Timeout policy of the test (defaults to one from the environment)
+        """
+        self.session = session
+        self.timeouts = timeouts or TimeoutPolicy.from_env()
+        self.method_map = {
+            'GET': self.get_request,
+            'POST': self.post_request,
+            'PUT': self.put_request,
+            'PATCH': self.patch_request,
+            'DELETE': self.delete_request
+        }
+        log.info("Initialized async API client")
+
+    async def make_request(self, base_url: str, api_endpoint: str, method: str = 'GET',
+                           path_params: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """
+        Generic method to make API requests based on the specified method.
+
+        Args:
+            base_url: Base URL of the API
+            api_endpoint: API endpoint (may contain placeholders like {id})
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            path_params: Dictionary to replace path placeholders in api_endpoint
+            **kwargs: Additional arguments to pass to the request method
+
+        Returns:
+            Response object
+
+        Raises:
+            ValueError: If unsupported HTTP method is provided
+            KeyError: If path_params is missing a required placeholder
+            APITimeoutError: If the request times out or the test deadline has passed
+        """
+        method = method.upper()
+        if method not in self.method_map:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if path_params:
+            try:
+                api_endpoint = api_endpoint.format(**path_params)
+            except KeyError as e:
+                log.error(f"Missing path parameter: {e}")
+                raise
+
+        log.info(f"Making {method} request to {base_url}{api_endpoint}")
+        return await self.method_map[method](base_url, api_endpoint, **kwargs)
+
+    async def make_requests(self, batch: List[Dict], max_concurrency: int = 100) -> List[RequestResult]:
+        """
+        Make a batch of requests concurrently on the event loop.
+
+        Args:
+            batch: Request specs holding the keyword arguments of make_request()
+            max_concurrency: Most requests in flight at once
+
+        Returns:
+            One RequestResult per spec, in input order (see APIClient.make_requests)
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(index, spec):
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    response = await self.make_request(**spec)
+                    return RequestResult(index, spec, response=response, elapsed=time.monotonic() - start)
+                except Exception as e:
+                    log.error(f"Request {index} of the batch failed: {type(e).__name__}: {str(e)}")
+                    return RequestResult(index, spec, exception=e, elapsed=time.monotonic() - start)
+
+        return list(await asyncio.gather(*(run(index, spec) for index, spec in enumerate(batch))))
+
+    async def _send(self, method: str, url: str, header: Optional[Dict], params: Optional[Dict] = None,
+                    data: Any = None, timeout: Any = None) -> requests.Response:
+        """
+        Send a request and read it into a requests.Response.
+
+        Like requests, a string body is sent without a Content-Type of its own.
+        The whole exchange is also capped by the time left until the test deadline.
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+        """
+        connect, read = self.timeouts.timeout_for(method, url, timeout)
+        client_timeout = aiohttp.ClientTimeout(total=self.timeouts.remaining(), sock_connect=connect, sock_read=read)
+        parts = urlsplit(url)
+        breaker = circuit_breakers.breaker_for(parts.netloc)
+        if breaker is not None:
+            breaker.before_request(method, url)
+        api_retry_budget.record_request()
+        start = time.monotonic()
+        skip_auto_headers = ("Content-Type",) if isinstance(data, str) else None
+        try:
+            async with self.session.request(method, url, headers=header, params=_query(params), data=data,
+                                            skip_auto_headers=skip_auto_headers, timeout=client_timeout) as raw:
+                content = await raw.read()
+        except asyncio.TimeoutError as e:
+            if breaker is not None:
+                breaker.record(f"{type(e).__name__} on {method} {parts.path}")
+            kind = "connect" if isinstance(e, getattr(aiohttp, "ConnectionTimeoutError", ())) else "read"
+            raise self.timeouts.timeout_error(method, url, time.monotonic() - start, (connect, read), kind) from e
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(f"{type(e).__name__} on {method} {parts.path}")
+            raise
+        if breaker is not None:
+            breaker.record(f"{raw.status} {raw.reason} on {method} {parts.path}"
+                           if raw.status in breaker.failure_statuses else None)
+        response = requests.Response()
+        response.status_code = raw.status
+        response.reason = raw.reason
+        response.url = str(raw.url)
+        response.headers = CaseInsensitiveDict()
+        for name, value in raw.headers.items():
+            response.headers[name] = f"{response.headers[name]}, {value}" if name in response.headers else value
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        response.elapsed = timedelta(seconds=time.monotonic() - start)
+        response.request = requests.PreparedRequest()
+        response.request.prepare(method=method, url=str(raw.request_info.url),
+                                 headers=dict(raw.request_info.headers))
+        response.request.body = data if isinstance(data, (str, bytes)) else None
+        return response
+
+    async def get_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
+                          query_params: Optional[Dict] = None, timeout: Any = None) -> requests.Response:
+        """
+        Perform a GET request.
+
+        Args:
+            base_url: Base URL of the API
+            api_endpoint: API endpoint
+            header: Optional headers
+            query_params: Optional query parameters
+            timeout: Optional timeout override (see APIClient.make_request)
+
+        Returns:
+            Response object
+        """
+        url = f"{base_url}{api_endpoint}"
+        log.info(f"Request Method: GET, URL: {url}, Query Parameters: {query_params}")
+        try:
+            return await self._send("GET", url, header, params=query_params, timeout=timeout)
+        except Exception as e:
+            log.error(f"An error occurred during the GET request: {str(e)}")
+            raise
+
+    async def post_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
+                           param: Optional[Dict] = None, payload: Optional[Union[Dict, str]] = None,
+                           file: Optional[Dict] = None, timeout: Any = None) -> requests.Response:
+        """
+        Perform a POST request.
+
+        Args:
+            base_url: Base URL of the API
+            api_endpoint: API endpoint
+            header: Optional headers
+            param: Optional query parameters
+            payload: Optional request payload
+            file: Optional files to upload
+            timeout: Optional timeout override (see APIClient.make_request)
+
+        Returns:
+            Response object
+        """
+        url = f"{base_url}{api_endpoint}"
+        log.info(f"Request Type: POST, URL: {url}, Payload: {payload}")
+        try:
+            if file is not None:
+                return await self._send("POST", url, header, params=param, data=_form_data(payload, file),
+                                        timeout=timeout)
+            return await self._send("POST", url, header, params=param, data=json.dumps(payload), timeout=timeout)
+        except Exception as e:
+            log.error(f"Error occurred during the POST request: {str(e)}")
+            raise
+
+    async def put_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
+                          payload: Optional[Dict] = None, param: Optional[Dict] = None,
+                          timeout: Any = None) -> requests.Response:
+        """
+        Perform a PUT request.
+
+        Args:
+            base_url: Base URL of the API
+            api_endpoint: API endpoint
+            header: Optional headers
+            payload: Optional request payload
+            param: Optional query parameters
+            timeout: Optional timeout override (see APIClient.make_request)
+
+        Returns:
+            Response object
+        """
+        url = f"{base_url}{api_endpoint}"
+        log.info(f"Request Type: PUT, URL: {url}, Payload: {payload}")
+        try:
+            return await self._send("PUT", url, header, params=param, data=json.dumps(payload), timeout=timeout)
+        except Exception as e:
+            log.error(f"Error occurred during the PUT request to {url}: {str(e)}")
+            raise
+
+    async def patch_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
+                            payload: Optional[Dict] = None, timeout: Any = None) -> requests.Response:
+        """
+        Perform a PATCH request.
+
+        Args:
+            base_url: Base URL of the API
+            api_endpoint: API endpoint
+            header: Optional headers
+            payload: Optional request payload
+            timeout: Optional timeout override (see APIClient.make_request)
+
+        Returns:
+            Response object
+        """
+        url = f"{base_url}{api_endpoint}"
+        log.info(f"Request Type: PATCH, URL: {url}, Payload: {payload}")
+        try:
+            return await self._send("PATCH", url, header, data=json.dumps(payload), timeout=timeout)
+        except Exception as e:
+            log.error(f"Error occurred during the PATCH request to {url}: {str(e)}")
+            raise
+
+    async def delete_request(self, base_url: str, api_endpoint: str, header: Optional[Dict] = None,
+                             payload: Optional[Dict] = None, query_params: Optional[Dict] = None,
+                             timeout: Any = None) -> requests.Response:
+        """
+        Perform a DELETE request.
+
+        Args:
+            base_url: Base URL of the API
+            api_endpoint: API endpoint
+            header: Optional headers
+            payload: Optional request payload (logged only, as in APIClient)
+            query_params: Optional query parameters
+            timeout: Optional timeout override (see APIClient.make_request)
+
+        Returns:
+            Response object
+        """
+        url = f"{base_url}{api_endpoint}"
+        log.info(f"Request Type: DELETE, URL: {url}, Query Parameters: {query_params}")
+        try:
+            return await self._send("DELETE", url, header, params=query_params, timeout=timeout)
+        except Exception as e:
+            log.error(f"Error occurred during the DELETE request to {url}: {str(e)}")
+            raise
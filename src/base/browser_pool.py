@@ -0,0 +1,345 @@
+"""
+Browser Pool Module.
+
+This module provides a per-worker pool of live WebDriver sessions built around
+WebDriverManager. Each UI test leases a session from the pool instead of
+starting a new browser, and the session is reset to a clean state before it is
+handed to the next test. Spare sessions are pre-warmed on a background thread
+so recycled or crashed sessions do not put browser startup on the critical path.
+"""
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from src.base.window_tracker import get_window_tracker
+from src.utils import logger
+log = logger.customLogger()
+
+
+class PooledSession:
+    """A live WebDriver session tracked by the browser pool."""
+
+    def __init__(self, driver):
+        """
+        Initialize pooled session.
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+        self.lease_count = 0
+
+
+class BrowserPool:
+    """Pool of reusable WebDriver sessions for a single pytest worker."""
+
+    def __init__(self, driver_manager, remote=False, max_reuse=None, reuse=None, spares=None):
+        """
+        Initialize browser pool.
+
+        Args:
+            driver_manager (WebDriverManager): Manager used to create sessions
+            remote (bool, optional): Whether to create remote sessions. Defaults to False.
+            max_reuse (int, optional): Maximum number of leases per session before it
+                is recycled. Defaults to the BROWSER_MAX_REUSE env var (50).
+            reuse (bool, optional): Whether sessions are reused at all. Defaults to
+                the BROWSER_REUSE env var (True).
+            spares (int, optional): Number of spare sessions kept warm in the
+                background. Defaults to the BROWSER_POOL_SPARES env var (1).
+        """
+        self.driver_manager = driver_manager
+        self.remote = remote
+        if max_reuse is None:
+            try:
+                max_reuse = int(os.getenv("BROWSER_MAX_REUSE", "50"))
+            except ValueError:
+                log.warning("Invalid BROWSER_MAX_REUSE env var. Using default: 50")
+                max_reuse = 50
+        if reuse is None:
+            reuse = os.getenv("BROWSER_REUSE", "True").lower() == "true"
+        self.max_reuse = max_reuse if reuse else 1
+        if spares is None:
+            try:
+                spares = int(os.getenv("BROWSER_POOL_SPARES", "1"))
+            except ValueError:
+                log.warning("Invalid BROWSER_POOL_SPARES env var. Using default: 1")
+                spares = 1
+        self.spares = max(spares, 0)
+        self._idle = []
+        self._leased = {}
+        self._warming = []
+        self._executor = None
+        # Stats are also counted on the pre-warm thread
+        self._lock = threading.Lock()
+        if self.spares:
+            self._executor = ThreadPoolExecutor(max_workers=self.spares, thread_name_prefix="browser-prewarm")
+        self.stats = {
+            "created": 0, "leases": 0, "reused": 0, "recycled": 0, "unhealthy": 0,
+            "spare_hits": 0, "warmup_waits": 0, "cold_starts": 0, "startup_wait_seconds": 0.0,
+        }
+        log.info(f"Initialized BrowserPool (remote: {remote}, max reuse: {self.max_reuse}, spares: {self.spares})")
+        self._replenish()
+
+    def acquire(self):
+        """
+        Lease a live WebDriver session from the pool.
+
+        Idle sessions are health-checked before they are handed out; broken
+        sessions are discarded. When no idle session is left, a pre-warmed spare
+        is handed out and a replacement is started in the background. A cold
+        start only happens when no spare is ready or warming up.
+
+        Returns:
+            webdriver: WebDriver instance
+        """
+        while self._idle:
+            session = self._idle.pop()
+            if self._is_healthy(session.driver):
+                self._count("reused")
+                return self._lease(session)
+            log.warning("Discarding unhealthy pooled browser session")
+            self._count("unhealthy")
+            self._quit(session)
+
+        session = self._take_spare()
+        if session is None:
+            log.info("No idle or spare browser session available, starting a new one")
+            start = time.monotonic()
+            session = PooledSession(self.driver_manager.create_driver(remote=self.remote))
+            self._count("created")
+            self._count("cold_starts")
+            self._count("startup_wait_seconds", time.monotonic() - start)
+        self._replenish()
+        return self._lease(session)
+
+    def release(self, driver, discard=False):
+        """
+        Return a leased session to the pool.
+
+        The session is reset (cookies, storage of every visited origin, extra
+        windows, blank page) so the next test starts from a clean browser. Sessions that fail the
+        reset, reach the max reuse count or are explicitly discarded are quit.
+
+        Args:
+            driver: WebDriver instance previously returned by acquire()
+            discard (bool, optional): Quit the session instead of pooling it. Defaults to False.
+        """
+        session = self._leased.pop(id(driver), None)
+        if session is None:
+            log.warning("Released a browser session that is not owned by the pool, quitting it")
+            self._quit(PooledSession(driver))
+            return
+
+        if discard:
+            self._quit(session)
+            return
+
+        if session.lease_count >= self.max_reuse:
+            log.info(f"Browser session reached max reuse count ({self.max_reuse}), recycling")
+            self._count("recycled")
+            self._quit(session)
+            return
+
+        if not self._reset(session.driver):
+            self._count("unhealthy")
+            self._quit(session)
+            return
+
+        self._idle.append(session)
+
+    def close(self):
+        """Quit every session owned by the pool, including spares still warming up."""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        spares = [future.result() for future in self._warming]
+        for session in self._idle + list(self._leased.values()) + [s for s in spares if s]:
+            self._quit(session)
+        self._idle = []
+        self._leased = {}
+        self._warming = []
+        log.info(f"Closed BrowserPool. Stats: {self.stats}")
+
+    def _take_spare(self):
+        """
+        Take a pre-warmed spare session.
+
+        Returns a ready spare immediately; if spares are still starting, waits for
+        the first one to finish (counted as a warm-up wait).
+
+        Returns:
+            PooledSession or None: Spare session, or None if no spare is available
+        """
+        while self._warming:
+            ready = [future for future in self._warming if future.done()]
+            waited = not ready
+            if waited:
+                log.info("Waiting for a pre-warmed browser session to finish starting")
+                start = time.monotonic()
+                ready, _ = wait(self._warming, return_when=FIRST_COMPLETED)
+                self._count("startup_wait_seconds", time.monotonic() - start)
+
+            future = next(iter(ready))
+            self._warming.remove(future)
+            session = future.result()
+            if session and self._is_healthy(session.driver):
+                self._count("warmup_waits" if waited else "spare_hits")
+                return session
+            if session:
+                self._count("unhealthy")
+                self._quit(session)
+        return None
+
+    def _replenish(self):
+        """Start background sessions until the configured number of spares is warming or ready."""
+        if not self._executor:
+            return
+        while len(self._warming) < self.spares:
+            self._warming.append(self._executor.submit(self._start_spare))
+
+    def _start_spare(self):
+        """
+        Start a spare session (runs on the pre-warm thread).
+
+        Returns:
+            PooledSession or None: Started session, or None if the browser failed to start
+        """
+        try:
+            session = PooledSession(self.driver_manager.create_driver(remote=self.remote))
+            self._count("created")
+            log.info("Pre-warmed spare browser session is ready")
+            return session
+        except Exception as e:
+            log.error(f"Failed to pre-warm browser session: {str(e)}")
+            return None
+
+    def _count(self, stat, amount=1):
+        """Add to a pool stat (thread-safe)."""
+        with self._lock:
+            self.stats[stat] += amount
+
+    def _lease(self, session):
+        """Mark a session as leased and return its driver."""
+        session.lease_count += 1
+        self._count("leases")
+        self._leased[id(session.driver)] = session
+        return session.driver
+
+    def _is_healthy(self, driver):
+        """
+        Check that the browser session still responds to commands.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the session is usable, False otherwise
+        """
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException as e:
+            log.warning(f"Browser session health check failed: {str(e)}")
+            return False
+
+    def _reset(self, driver):
+        """
+        Reset browser state between leases.
+
+        Closes the extra windows/tabs and navigates the first tab to
+        about:blank. The session stays in its first tab, so DevTools
+        connections bound to that tab (network interceptor, page readiness
+        tracker) keep working on the next lease.
+
+        Chromium sessions also collect the origins every window visited (tab
+        history and frames) and clear cookies and the storage (localStorage,
+        sessionStorage, IndexedDB, caches, service workers) of each of them
+        through DevTools. Sessions without DevTools (Firefox, remote) only clear
+        the cookies and web storage of the origin each window is on at release;
+        storage of other origins the test navigated away from is not cleared.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the reset succeeded, False otherwise
+        """
+        devtools = hasattr(driver, "execute_cdp_cmd")
+        try:
+            origins = set()
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                if devtools:
+                    origins.update(self._visited_origins(driver))
+                else:
+                    self._clear_current_origin(driver)
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+            driver.switch_to.default_content()
+            get_window_tracker(driver).switched_window(handles[0])
+            if devtools:
+                self._clear_current_origin(driver)
+            driver.get("about:blank")
+
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                try:
+                    # sessionStorage belongs to the tab, which stays open
+                    driver.execute_cdp_cmd("DOMStorage.clear", {"storageId": {"securityOrigin": origin,
+                                                                              "isLocalStorage": False}})
+                except WebDriverException:
+                    log.debug(f"Could not clear sessionStorage of {origin}")
+            if devtools:
+                # Clears cookies for every domain, not only the visited ones
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                log.debug(f"Cleared browser storage of {len(origins)} origin(s): {sorted(origins)}")
+            return True
+        except WebDriverException as e:
+            log.warning(f"Failed to reset pooled browser session: {str(e)}")
+            return False
+
+    @staticmethod
+    def _clear_current_origin(driver):
+        """Clear cookies, localStorage and sessionStorage of the focused window's origin."""
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # Storage is not accessible on some origins (e.g. about:blank, data: URLs)
+            log.debug("Could not clear web storage for the current origin")
+        driver.delete_all_cookies()
+
+    @staticmethod
+    def _visited_origins(driver):
+        """
+        Get the web origins the focused window visited: its history and its current frames.
+
+        Args:
+            driver: Chromium WebDriver instance
+
+        Returns:
+            set: Origins such as "https://example.com"
+        """
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        urls = [entry["url"] for entry in history.get("entries", [])]
+        frames = [driver.execute_cdp_cmd("Page.getFrameTree", {}).get("frameTree", {})]
+        while frames:
+            node = frames.pop()
+            urls.append(node.get("frame", {}).get("url", ""))
+            frames.extend(node.get("childFrames", []))
+
+        origins = set()
+        for url in urls:
+            parts = urlsplit(url)
+            if parts.scheme in ("http", "https") and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    def _quit(self, session):
+        """Quit a pooled session, ignoring errors from dead browsers."""
+        try:
+            session.driver.quit()
+        except WebDriverException as e:
+            log.warning(f"Error while quitting browser session: {str(e)}")
@@ -0,0 +1,138 @@
+"""
+Command Tracker Module.
+
+This module instruments WebDriver sessions created by WebDriverManager. Every
+remote (W3C wire) command is counted and timed, and attributed to the BasePage
+action that issued it and to the running test, so page-object regressions in
+round trips show up per test.
+"""
+import sys
+import time
+from collections import Counter
+from src.utils import logger
+log = logger.customLogger()
+
+
+def _calling_page_action():
+    """
+    Find the BasePage action that issued the current command.
+
+    Walks the call stack from the innermost frame outwards and returns the
+    first public method called on a BasePage (or subclass) instance.
+
+    Returns:
+        str: "PageClass.method", or "direct" for commands issued outside page objects
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        name = code.co_name
+        page = frame.f_locals.get(code.co_varnames[0]) if code.co_argcount else None
+        if page is not None and not name.startswith("_") and any(
+                cls.__name__ == "BasePage" for cls in type(page).__mro__):
+            return f"{type(page).__name__}.{name}"
+        frame = frame.f_back
+    return "direct"
+
+
+class CommandTracker:
+    """Counts and times WebDriver commands for the active test."""
+
+    def __init__(self):
+        """Initialize command tracker."""
+        self.node_id = None
+        self._driver = None
+        self.records = []
+
+    def attach(self, driver):
+        """
+        Wrap driver.execute so every remote command is recorded.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            webdriver: The same driver, instrumented
+        """
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            if self._driver is not driver:
+                return original_execute(driver_command, params)
+            action = _calling_page_action()
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self.records.append((driver_command, action, time.perf_counter() - start))
+
+        driver.execute = execute
+        return driver
+
+    def start_test(self, node_id, driver):
+        """
+        Start recording commands of a driver for a test.
+
+        Args:
+            node_id (str): pytest node id of the test
+            driver: WebDriver instance leased to the test
+        """
+        self.node_id = node_id
+        self._driver = driver
+        self.records = []
+
+    def stop_test(self):
+        """
+        Stop recording and return the summary of the test.
+
+        Returns:
+            dict: Summary (see summary())
+        """
+        summary = self.summary()
+        self.node_id = None
+        self._driver = None
+        self.records = []
+        return summary
+
+    def summary(self, top=5):
+        """
+        Summarize the commands recorded for the current test.
+
+        Args:
+            top (int, optional): Number of slowest commands to include. Defaults to 5.
+
+        Returns:
+            dict: node_id, commands, wire_time, by_action and slowest commands
+        """
+        slowest = sorted(self.records, key=lambda record: record[2], reverse=True)[:top]
+        return {
+            "node_id": self.node_id,
+            "commands": len(self.records),
+            "wire_time": sum(record[2] for record in self.records),
+            "by_action": Counter(record[1] for record in self.records).most_common(),
+            "slowest": slowest,
+        }
+
+    @staticmethod
+    def format_summary(summary):
+        """
+        Format a summary as report text.
+
+        Args:
+            summary (dict): Summary returned by summary() or stop_test()
+
+        Returns:
+            str: Human readable summary
+        """
+        lines = [
+            f"WebDriver commands: {summary['commands']} | Wire time: {summary['wire_time']:.2f}s",
+            "Commands per action:",
+        ]
+        lines += [f"  - {action}: {count}" for action, count in summary["by_action"]]
+        lines.append("Slowest commands:")
+        lines += [f"  - {command} ({action}): {seconds:.3f}s" for command, action, seconds in summary["slowest"]]
+        return "\n".join(lines)
+
+
+# Process-wide tracker; each xdist worker tracks its own tests
+command_tracker = CommandTracker()
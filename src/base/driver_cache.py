@@ -0,0 +1,168 @@
+"""
+Driver Cache Module.
+
+This module resolves browser driver binaries once per machine and pins the
+resolved path and browser version in a local cache file. The cache is shared
+between xdist workers through a file lock, and an offline mode resolves drivers
+without ever touching the network.
+"""
+import json
+import os
+import platform
+import shutil
+from datetime import datetime
+from pathlib import Path
+from filelock import FileLock
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from src.utils import logger
+log = logger.customLogger()
+
+
+# Browser name -> (webdriver-manager class, env var with an explicit driver path, driver executable)
+DRIVER_MANAGERS = {
+    "chrome": (ChromeDriverManager, "CHROMEDRIVER_PATH", "chromedriver"),
+    "firefox": (GeckoDriverManager, "GECKODRIVER_PATH", "geckodriver"),
+    "edge": (EdgeChromiumDriverManager, "EDGEDRIVER_PATH", "msedgedriver"),
+}
+
+
+class DriverCache:
+    """Machine-wide cache of resolved browser driver binaries."""
+
+    def __init__(self, cache_file=None, offline=None):
+        """
+        Initialize driver cache.
+
+        Args:
+            cache_file (str, optional): Path of the cache file. Defaults to the
+                WDM_CACHE_FILE env var or ~/.wdm/resolved_drivers.json.
+            offline (bool, optional): Never use the network to resolve drivers.
+                Defaults to the WDM_OFFLINE env var (False).
+        """
+        default_file = Path.home() / ".wdm" / "resolved_drivers.json"
+        self.cache_file = Path(cache_file or os.getenv("WDM_CACHE_FILE", str(default_file)))
+        if offline is None:
+            offline = os.getenv("WDM_OFFLINE", "False").lower() == "true"
+        self.offline = offline
+        self.lock = FileLock(f"{self.cache_file}.lock", timeout=300)
+        self._resolved = {}
+
+    def resolve(self, browser):
+        """
+        Resolve the driver binary for a browser.
+
+        Resolution order: in-process memo, explicit driver path env var,
+        cache file entry, and finally a webdriver-manager lookup (online) or
+        the driver on PATH (offline).
+
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+
+        Returns:
+            str: Path to the driver binary
+
+        Raises:
+            ValueError: If the browser is not supported
+            FileNotFoundError: If no driver can be found in offline mode
+        """
+        browser = browser.lower()
+        if browser not in DRIVER_MANAGERS:
+            raise ValueError(f"Unsupported browser: {browser}")
+
+        if browser in self._resolved:
+            return self._resolved[browser]
+
+        manager_class, path_env, executable = DRIVER_MANAGERS[browser]
+        explicit_path = os.getenv(path_env)
+        if explicit_path:
+            log.info(f"Using {browser} driver from {path_env}: {explicit_path}")
+            self._resolved[browser] = explicit_path
+            return explicit_path
+
+        key = self._cache_key(browser)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            cache = self._read_cache()
+            entry = cache.get(key)
+            browser_version = None if self.offline else self._get_browser_version(manager_class)
+
+            if self._is_entry_valid(entry, browser_version):
+                log.info(f"Using cached {browser} driver: {entry['driver_path']} "
+                         f"(browser version: {entry.get('browser_version')})")
+                self._resolved[browser] = entry["driver_path"]
+                return entry["driver_path"]
+
+            if self.offline:
+                driver_path = shutil.which(executable)
+                if not driver_path:
+                    log.error(f"Offline mode: no cached or PATH {browser} driver found")
+                    raise FileNotFoundError(
+                        f"Offline mode: no {browser} driver in {self.cache_file}, {path_env} or PATH")
+                log.info(f"Offline mode: using {browser} driver from PATH: {driver_path}")
+            else:
+                log.info(f"Resolving {browser} driver with webdriver-manager")
+                driver_path = manager_class().install()
+
+            cache[key] = {
+                "driver_path": driver_path,
+                "browser_version": browser_version,
+                "resolved_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            self._write_cache(cache)
+
+        self._resolved[browser] = driver_path
+        return driver_path
+
+    def _is_entry_valid(self, entry, browser_version):
+        """
+        Check that a cache entry still points at a usable driver.
+
+        An entry is stale when the driver binary is gone or the installed browser
+        was upgraded since the driver was resolved.
+        """
+        if not entry or not os.path.exists(entry.get("driver_path", "")):
+            return False
+        if browser_version and entry.get("browser_version") and browser_version != entry["browser_version"]:
+            log.info(f"Browser version changed ({entry['browser_version']} -> {browser_version}), "
+                     f"re-resolving driver")
+            return False
+        return True
+
+    @staticmethod
+    def _cache_key(browser):
+        """Build the cache key for a browser on this machine."""
+        return f"{browser}-{platform.system()}-{platform.machine()}".lower()
+
+    @staticmethod
+    def _get_browser_version(manager_class):
+        """
+        Read the installed browser version from the OS (no network access).
+
+        Returns:
+            str or None: Browser version, or None if it cannot be detected
+        """
+        try:
+            return manager_class().driver.get_browser_version_from_os()
+        except Exception as e:
+            log.warning(f"Could not detect installed browser version: {str(e)}")
+            return None
+
+    def _read_cache(self):
+        """Read the cache file, returning an empty cache if it is missing or corrupt."""
+        try:
+            with self.cache_file.open(mode='r', encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            log.warning(f"Ignoring corrupt driver cache file {self.cache_file}: {e}")
+            return {}
+
+    def _write_cache(self, cache):
+        """Atomically write the cache file."""
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with tmp_file.open(mode='w', encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
@@ -0,0 +1,220 @@
+"""
+HAR Recorder Module.
+
+This module turns the Chrome performance log (DevTools Network events) of a
+UI test into a compact HAR file under reports/har/. The log is drained after
+every navigation and at the end of the test, and each request is written to
+disk as soon as it completes, so a test's traffic is never held in memory.
+Response bodies are left out unless HAR_BODIES is enabled.
+"""
+import json
+import os
+import re
+from datetime import datetime, timezone
+from selenium.common.exceptions import WebDriverException
+from src.utils import logger
+log = logger.customLogger()
+
+HAR_DIR = os.path.join("reports", "har")
+
+
+def _headers(headers):
+    """Convert a DevTools headers object to HAR name/value pairs."""
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _duration(start, end):
+    """Duration between two ResourceTiming offsets in ms, or -1 when not measured."""
+    return round(end - start, 3) if start is not None and end is not None and start >= 0 and end >= 0 else -1
+
+
+class HarRecorder:
+    """Streams the network traffic of the running UI test to a HAR file."""
+
+    def __init__(self):
+        """Initialize HAR recorder."""
+        self.driver = None
+        self.path = None
+        self._file = None
+        self._pending = {}
+        self._entries = 0
+        self.include_bodies = False
+
+    @property
+    def active(self):
+        """True while a test is being recorded."""
+        return self._file is not None
+
+    def start_test(self, node_id, driver):
+        """
+        Start a HAR file for a test.
+
+        Log entries left over from before the test (e.g. the pool's session reset)
+        are discarded.
+
+        Args:
+            node_id (str): pytest node id of the test
+            driver: WebDriver instance with performance logging enabled
+
+        Returns:
+            str: Path of the HAR file
+        """
+        self.driver = driver
+        self.include_bodies = os.getenv("HAR_BODIES", "False").lower() == "true"
+        self._pending = {}
+        self._entries = 0
+        self._read_log()
+
+        os.makedirs(HAR_DIR, exist_ok=True)
+        self.path = os.path.join(HAR_DIR, re.sub(r"[^\w.-]+", "_", node_id) + ".har")
+        self._file = open(self.path, "w", encoding="utf-8")
+        creator = {"name": "hybrid_python_automation_framework", "version": "1.0"}
+        self._file.write('{"log": {"version": "1.2", "creator": ' + json.dumps(creator)
+                         + ', "pages": [], "entries": [\n')
+        return self.path
+
+    def flush(self):
+        """Drain the performance log and write the requests completed so far."""
+        if not self.active:
+            return
+        for message in self._read_log():
+            self._handle(message["method"], message["params"])
+        self._file.flush()
+
+    def stop_test(self):
+        """
+        Flush, write requests still in flight as incomplete, and close the HAR file.
+
+        Returns:
+            str: Path of the HAR file, or None if no test was being recorded
+        """
+        if not self.active:
+            return None
+        self.flush()
+        for entry in self._pending.values():
+            entry["response"]["_error"] = "incomplete"
+            self._write(entry)
+        self._file.write("\n]}}\n")
+        self._file.close()
+        log.info(f"HAR with {self._entries} requests written to {self.path}")
+        path, self._file, self.driver, self._pending = self.path, None, None, {}
+        return path
+
+    def _read_log(self):
+        """
+        Read the Network events buffered in the browser's performance log.
+
+        Returns:
+            list[dict]: DevTools messages ({method, params})
+        """
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as e:
+            log.warning(f"Performance log unavailable, HAR stays empty: {e.msg}")
+            return []
+        messages = []
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message.get("method", "").startswith("Network."):
+                messages.append(message)
+        return messages
+
+    def _handle(self, method, params):
+        """Update the HAR entry of a request from one Network event."""
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if params.get("redirectResponse") and request_id in self._pending:
+                # A redirect reuses the request id: finish the redirected request first
+                entry = self._pending.pop(request_id)
+                self._set_response(entry, params["redirectResponse"])
+                self._finish(entry, params["timestamp"])
+            request = params["request"]
+            if request["url"].startswith("data:"):
+                return
+            self._pending[request_id] = {
+                "startedDateTime": datetime.fromtimestamp(params["wallTime"], timezone.utc).isoformat(),
+                "time": 0,
+                "request": {
+                    "method": request["method"], "url": request["url"], "httpVersion": "",
+                    "headers": _headers(request.get("headers")), "queryString": [], "cookies": [],
+                    "headersSize": -1, "bodySize": len(request.get("postData", "")),
+                },
+                "response": {
+                    "status": 0, "statusText": "", "httpVersion": "", "headers": [], "cookies": [],
+                    "content": {"size": 0, "mimeType": ""}, "redirectURL": "", "headersSize": -1, "bodySize": -1,
+                },
+                "cache": {},
+                "timings": {"send": -1, "wait": -1, "receive": -1},
+                "_resourceType": params.get("type", ""),
+                "_start": params["timestamp"],
+            }
+        elif request_id not in self._pending:
+            return
+        elif method == "Network.responseReceived":
+            self._set_response(self._pending[request_id], params["response"])
+        elif method == "Network.loadingFinished":
+            entry = self._pending.pop(request_id)
+            entry["response"]["bodySize"] = entry["response"]["_transferSize"] = int(params["encodedDataLength"])
+            if self.include_bodies:
+                self._add_body(entry, request_id)
+            self._finish(entry, params["timestamp"])
+        elif method == "Network.loadingFailed":
+            entry = self._pending.pop(request_id)
+            entry["response"]["_error"] = params.get("errorText", "failed")
+            self._finish(entry, params["timestamp"])
+
+    @staticmethod
+    def _set_response(entry, response):
+        """Copy a DevTools response into a HAR entry."""
+        entry["request"]["httpVersion"] = entry["response"]["httpVersion"] = response.get("protocol", "")
+        entry["response"].update({
+            "status": response.get("status", 0),
+            "statusText": response.get("statusText", ""),
+            "headers": _headers(response.get("headers")),
+            "redirectURL": (response.get("headers") or {}).get("location", ""),
+        })
+        entry["response"]["content"]["mimeType"] = response.get("mimeType", "")
+        entry["_timing"] = response.get("timing")
+
+    def _finish(self, entry, end_timestamp):
+        """Fill in the total time and phase timings of a completed request and write it."""
+        total = round((end_timestamp - entry.pop("_start")) * 1000, 3)
+        entry["time"] = total
+        timing = entry.pop("_timing", None)
+        if timing:
+            headers_end = timing.get("receiveHeadersEnd")
+            entry["timings"] = {
+                "blocked": -1,
+                "dns": _duration(timing.get("dnsStart"), timing.get("dnsEnd")),
+                "connect": _duration(timing.get("connectStart"), timing.get("connectEnd")),
+                "ssl": _duration(timing.get("sslStart"), timing.get("sslEnd")),
+                "send": _duration(timing.get("sendStart"), timing.get("sendEnd")),
+                "wait": _duration(timing.get("sendEnd"), headers_end),
+                "receive": round(max(0.0, total - headers_end), 3) if headers_end is not None else -1,
+            }
+        else:
+            entry["timings"] = {"send": 0, "wait": total, "receive": 0}
+        self._write(entry)
+
+    def _add_body(self, entry, request_id):
+        """Fetch the response body over CDP (local Chromium sessions only)."""
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except (AttributeError, WebDriverException):
+            return
+        content = entry["response"]["content"]
+        content["text"] = body.get("body", "")
+        content["size"] = len(content["text"])
+        if body.get("base64Encoded"):
+            content["encoding"] = "base64"
+
+    def _write(self, entry):
+        """Append one completed entry to the HAR file."""
+        entry.pop("_start", None)
+        entry.pop("_timing", None)
+        self._file.write((",\n" if self._entries else "") + json.dumps(entry))
+        self._entries += 1
+
+
+# Process-wide recorder; each xdist worker records its own tests
+har_recorder = HarRecorder()
@@ -0,0 +1,431 @@
+"""
+Network Interceptor Module.
+
+This module applies named network profiles to Chromium sessions through the
+Chrome DevTools Protocol Fetch domain. A profile lists resource types to block
+(images, fonts, media, ...) and URL patterns to deny or always allow, so page
+loads only fetch what a test needs. Profiles are defined in
+config/network_profiles.json.
+
+The same interception serves recorded responses (stubs) from files under
+testData/ for requests a test does not exercise, e.g. slow third-party XHRs.
+
+CDP events can't be received over WebDriver commands, so each intercepted
+session runs its own DevTools connection in a background thread. Only
+requests matching the active profile's patterns are paused; everything else
+goes straight to the network.
+"""
+import base64
+import json
+import math
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, List
+import trio
+from selenium.webdriver.common.bidi import cdp
+from src.utils import logger
+from src.utils.file_reader import read_file
+log = logger.customLogger()
+
+PROFILES_FILE = Path(__file__).resolve().parents[2] / "config" / "network_profiles.json"
+
+# Seconds to wait for the DevTools connection to come up
+START_TIMEOUT = 10
+
+
+def devtools_endpoint(driver):
+    """
+    Get the DevTools protocol version and browser websocket URL of a Chromium session.
+
+    Args:
+        driver: Chromium WebDriver instance (local, or remote through Selenium Grid)
+
+    Returns:
+        tuple: (major version, websocket URL)
+    """
+    if driver.caps.get("se:cdp"):
+        return driver.caps.get("se:cdpVersion").split(".")[0], driver.caps.get("se:cdp")
+    return driver._get_cdp_details()
+
+
+@dataclass
+class NetworkProfile:
+    """Named set of request blocking rules."""
+
+    name: str
+    block_resource_types: List[str] = field(default_factory=list)
+    deny: List[str] = field(default_factory=list)
+    allow: List[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self):
+        """True when the profile blocks nothing."""
+        return not self.block_resource_types and not self.deny
+
+    def blocks(self, url, resource_type):
+        """
+        Check whether a request is blocked by this profile.
+
+        Allow patterns win over deny patterns and resource type blocking.
+
+        Args:
+            url (str): Request URL
+            resource_type (str): CDP resource type, e.g. "Image"
+
+        Returns:
+            bool: True if the request must be blocked
+        """
+        if any(fnmatchcase(url, pattern) for pattern in self.allow):
+            return False
+        return resource_type in self.block_resource_types or any(fnmatchcase(url, pattern) for pattern in self.deny)
+
+
+def load_network_profiles(path=None):
+    """
+    Load network profiles from a JSON file.
+
+    Args:
+        path (str, optional): Profiles file. Defaults to NETWORK_PROFILES_FILE env var
+            or config/network_profiles.json.
+
+    Returns:
+        dict: Profile name -> NetworkProfile
+    """
+    path = Path(path or os.getenv("NETWORK_PROFILES_FILE") or PROFILES_FILE)
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    return {name: NetworkProfile(name=name, **rules) for name, rules in raw.items()}
+
+
+@dataclass
+class ResponseStub:
+    """Recorded response served for requests matching a URL pattern and method."""
+
+    url: str
+    method: str = "GET"
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Any = ""
+    hits: int = 0
+
+    def __post_init__(self):
+        """Normalize the method and encode the body once, so serving it costs nothing."""
+        self.method = self.method.upper()
+        if isinstance(self.body, (dict, list)):
+            raw = json.dumps(self.body)
+            self.headers.setdefault("Content-Type", "application/json")
+        else:
+            raw = str(self.body)
+        self.encoded_body = base64.b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def matches(self, url, method):
+        """Check whether the stub serves a request ("*" matches any method)."""
+        return self.method in ("*", method.upper()) and fnmatchcase(url, self.url)
+
+
+class StubSet:
+    """
+    Stubs loaded from one testData file, active inside a with block.
+
+    Counts hits per stub and misses (requests whose URL matched a stub
+    pattern but no stub's method), so stale stubs are visible.
+    """
+
+    def __init__(self, interceptor, folder_name, file_name):
+        """
+        Load stubs from testData/<folder_name>/<file_name>.
+
+        The file holds a list of stubs: {"url", "method", "status", "headers", "body"};
+        a JSON body is served as application/json.
+
+        Args:
+            interceptor (NetworkInterceptor): Interceptor of the test's session
+            folder_name (str): Folder under testData/
+            file_name (str): Stub file name (.json optional)
+        """
+        self.interceptor = interceptor
+        self.name = f"{folder_name}/{file_name}"
+        self.stubs = [ResponseStub(**stub) for stub in read_file(folder_name, file_name)]
+        self.misses = 0
+
+    def lookup(self, url, method):
+        """
+        Find the stub serving a request and count the hit or miss.
+
+        Returns:
+            ResponseStub or None: The matching stub
+        """
+        for stub in self.stubs:
+            if stub.matches(url, method):
+                stub.hits += 1
+                return stub
+        if any(fnmatchcase(url, stub.url) for stub in self.stubs):
+            self.misses += 1
+        return None
+
+    @property
+    def hits(self):
+        """Requests served from this stub set."""
+        return sum(stub.hits for stub in self.stubs)
+
+    @property
+    def unused(self):
+        """Stubs that served no request (likely stale)."""
+        return [stub for stub in self.stubs if not stub.hits]
+
+    def __enter__(self):
+        self.interceptor.add_stub_set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.interceptor.remove_stub_set(self)
+        log.info(f"Stubs '{self.name}': {self.hits} hits, {self.misses} misses")
+        for stub in self.unused:
+            log.warning(f"Unused stub in '{self.name}': {stub.method} {stub.url}")
+        return False
+
+
+class NetworkInterceptor:
+    """Fetch-domain request interceptor for one Chromium session."""
+
+    def __init__(self):
+        """Initialize network interceptor."""
+        self.profile = None
+        self.stub_sets = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+        self._trio_token = None
+        self._cancel_scope = None
+        self._session = None
+        self._devtools = None
+        self.error = None
+        self.reset_stats()
+
+    # --- Lifecycle ---
+
+    def start(self, driver):
+        """
+        Connect to a session's DevTools endpoint in a background thread.
+
+        Requests of the session's current window are intercepted.
+
+        Args:
+            driver: Chromium WebDriver instance
+
+        Returns:
+            bool: True if interception is running
+        """
+        if self.running:
+            return True
+        try:
+            version, ws_url = devtools_endpoint(driver)
+            # Chromium window handles are DevTools target ids
+            target_id = driver.current_window_handle
+        except Exception as e:
+            log.warning(f"Network interception unavailable for this session: {e}")
+            return False
+
+        self.error = None
+        self._ready.clear()
+        self._thread = threading.Thread(target=trio.run, args=(self._run, version, ws_url, target_id),
+                                        name="network-interceptor", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(START_TIMEOUT) or self.error:
+            log.warning(f"Network interception failed to start: {self.error or 'timed out'}")
+            return False
+        log.info("Network interception started")
+        return True
+
+    @property
+    def running(self):
+        """True while the DevTools connection is up."""
+        return self._thread is not None and self._thread.is_alive() and self._ready.is_set() and not self.error
+
+    def stop(self):
+        """Close the DevTools connection (paused requests are released by the browser)."""
+        if self._thread is None:
+            return
+        if self._thread.is_alive() and self._trio_token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except trio.RunFinishedError:
+                pass
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    async def _run(self, version, ws_url, target_id):
+        """Background thread main: hold the DevTools session and handle events."""
+        try:
+            self._devtools = cdp.import_devtools(version)
+            async with cdp.open_cdp(ws_url) as connection:
+                self._session = await connection.connect_session(self._devtools.target.TargetID(target_id))
+                with trio.CancelScope() as self._cancel_scope:
+                    self._trio_token = trio.lowlevel.current_trio_token()
+                    events = self._session.listen(self._devtools.fetch.RequestPaused,
+                                                  self._devtools.network.LoadingFinished,
+                                                  buffer_size=math.inf)
+                    await self._session.execute(self._devtools.network.enable())
+                    await self._update_patterns()
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in events:
+                            if isinstance(event, self._devtools.fetch.RequestPaused):
+                                nursery.start_soon(self._handle_request, event)
+                            else:
+                                self._record_transfer(event)
+        except Exception as e:
+            # Also the normal end of an interceptor whose session was quit
+            self.error = str(e) or type(e).__name__
+            log.debug(f"Network interceptor stopped: {self.error}")
+        finally:
+            self._ready.set()
+
+    # --- Rules ---
+
+    def set_profile(self, profile):
+        """
+        Activate a network profile (None or an empty profile blocks nothing).
+
+        Args:
+            profile (NetworkProfile): Profile to apply
+        """
+        self.profile = profile if profile is not None and not profile.is_empty else None
+        self._sync_patterns()
+
+    def add_stub_set(self, stub_set):
+        """Serve responses from a stub set (the most recently added set wins)."""
+        # Replace instead of mutating: the interceptor thread iterates the list
+        self.stub_sets = self.stub_sets + [stub_set]
+        self._sync_patterns()
+
+    def remove_stub_set(self, stub_set):
+        """Stop serving responses from a stub set."""
+        self.stub_sets = [active for active in self.stub_sets if active is not stub_set]
+        self._sync_patterns()
+
+    def _sync_patterns(self):
+        """Push the current patterns to the browser from the calling thread."""
+        if not self.running:
+            if self._thread is not None:
+                log.warning(f"Network interceptor is not connected ({self.error}), rules not applied")
+            return
+        try:
+            trio.from_thread.run(self._update_patterns, trio_token=self._trio_token)
+        except trio.RunFinishedError:
+            log.debug("Network interceptor stopped before its patterns could be updated")
+
+    def _request_patterns(self):
+        """Fetch patterns for the requests that may need a decision (see _decide)."""
+        fetch, network = self._devtools.fetch, self._devtools.network
+        patterns = []
+        if self.profile is not None:
+            patterns += [fetch.RequestPattern(resource_type=network.ResourceType(resource_type))
+                         for resource_type in self.profile.block_resource_types]
+            patterns += [fetch.RequestPattern(url_pattern=pattern) for pattern in self.profile.deny]
+        patterns += [fetch.RequestPattern(url_pattern=stub.url) for stub_set in self.stub_sets for stub in stub_set.stubs]
+        return patterns
+
+    async def _update_patterns(self):
+        """Re-enable the Fetch domain with the current patterns (or disable it)."""
+        patterns = self._request_patterns()
+        if patterns:
+            await self._session.execute(self._devtools.fetch.enable(patterns=patterns))
+        else:
+            await self._session.execute(self._devtools.fetch.disable())
+
+    def _decide(self, event):
+        """
+        Decide what to do with a paused request.
+
+        Stubs win over the network profile.
+
+        Returns:
+            tuple: (action, detail) where action is "stub", "block" or "continue"
+        """
+        for stub_set in reversed(self.stub_sets):
+            stub = stub_set.lookup(event.request.url, event.request.method)
+            if stub is not None:
+                return "stub", stub
+        resource_type = event.resource_type.value
+        if self.profile is not None and self.profile.blocks(event.request.url, resource_type):
+            return "block", resource_type
+        return "continue", None
+
+    async def _handle_request(self, event):
+        """Answer one paused request."""
+        fetch, network = self._devtools.fetch, self._devtools.network
+        action, detail = self._decide(event)
+        try:
+            if action == "stub":
+                with self._lock:
+                    self.stubbed += 1
+                headers = [fetch.HeaderEntry(name=name, value=value) for name, value in detail.headers.items()]
+                await self._session.execute(fetch.fulfill_request(
+                    event.request_id, detail.status, response_headers=headers, body=detail.encoded_body))
+            elif action == "block":
+                with self._lock:
+                    self.blocked[detail] += 1
+                await self._session.execute(
+                    fetch.fail_request(event.request_id, network.ErrorReason.BLOCKED_BY_CLIENT))
+            else:
+                await self._session.execute(fetch.continue_request(event.request_id))
+        except Exception as e:
+            # The request may be gone already (navigation, closed tab)
+            log.debug(f"Could not answer intercepted request {event.request.url}: {e}")
+
+    # --- Stats ---
+
+    def _record_transfer(self, event):
+        """Count a finished network load."""
+        with self._lock:
+            self.requests += 1
+            self.transferred_bytes += int(event.encoded_data_length)
+
+    def reset_stats(self):
+        """Start counting from zero (called before every test)."""
+        with self._lock:
+            self.blocked = Counter()
+            self.stubbed = 0
+            self.requests = 0
+            self.transferred_bytes = 0
+
+    def stats(self):
+        """
+        Snapshot of the counters since the last reset.
+
+        Blocked requests never reach the network, so their size is unknown;
+        transferred bytes cover the requests that were let through.
+
+        Returns:
+            dict: profile, blocked_requests, blocked_by_type, stubbed_requests, requests, transferred_bytes
+        """
+        with self._lock:
+            return {
+                "profile": self.profile.name if self.profile else "default",
+                "blocked_requests": sum(self.blocked.values()),
+                "blocked_by_type": dict(self.blocked.most_common()),
+                "stubbed_requests": self.stubbed,
+                "requests": self.requests,
+                "transferred_bytes": self.transferred_bytes,
+            }
+
+    @staticmethod
+    def format_stats(stats):
+        """
+        Format a stats snapshot as report text.
+
+        Args:
+            stats (dict): Snapshot returned by stats()
+
+        Returns:
+            str: Human readable summary
+        """
+        by_type = ", ".join(f"{resource_type}: {count}" for resource_type, count in stats["blocked_by_type"].items())
+        return (f"Network profile '{stats['profile']}': blocked {stats['blocked_requests']} requests"
+                f"{f' ({by_type})' if by_type else ''}, stubbed {stats['stubbed_requests']}; "
+                f"{stats['requests']} requests transferred {stats['transferred_bytes'] / 1024:.1f} KB")
@@ -5,6 +5,7 @@ This module provides WebDriver management functionality for UI testing.
 It supports local and remote WebDriver initialization with various browsers.
 """
 import os
+import weakref
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -12,9 +13,9 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from src.base.command_tracker import command_tracker
+from src.base.driver_cache import DriverCache
+from src.base.network_interceptor import NetworkInterceptor, StubSet, load_network_profiles
 from src.utils import logger
 log = logger.customLogger()
 
@@ -26,14 +27,41 @@ class WebDriverManager:
         """Initialize WebDriver Manager with environment configuration."""
         self.browser = os.getenv('BROWSER', 'chrome')
         self.headless = os.getenv('HEADLESS', 'False').lower() == 'true'
-        self.implicit_wait = int(os.getenv('IMPLICIT_WAIT', '10'))
+        # BasePage's wait engine owns all waiting; a non-zero implicit wait would
+        # stack on every explicit-wait poll and make negative checks block.
+        self.implicit_wait = 0
+        if os.getenv('IMPLICIT_WAIT', '0') not in ('0', ''):
+            log.warning("IMPLICIT_WAIT is ignored; sessions run with implicit wait 0 and "
+                        "BasePage explicit waits (EXPLICIT_WAIT)")
         self.driver = None
+        self.driver_cache = DriverCache()
+        # Opt-in DevTools network log used for per-test HAR files (Chrome/Edge)
+        self.har_capture = os.getenv('HAR_CAPTURE', 'False').lower() == 'true'
+        self.network_profiles = None
+        # Network interceptor per session (None when the session can't be intercepted)
+        self.interceptors = weakref.WeakKeyDictionary()
         log.info(f"Initialized WebDriver Manager with browser: {self.browser}, headless: {self.headless}")
 
     def initialize_driver(self, remote=False):
         """
         Initialize WebDriver instance.
 
+        Args:
+            remote (bool, optional): Whether to use remote WebDriver. Defaults to False.
+
+        Returns:
+            webdriver: WebDriver instance
+        """
+        self.driver = self.create_driver(remote=remote)
+        return self.driver
+
+    def create_driver(self, remote=False):
+        """
+        Create a new WebDriver instance without binding it to this manager.
+
+        Used by the browser pool, which owns the lifecycle of the sessions
+        it creates. Every session is instrumented by the command tracker.
+
         Args:
             remote (bool, optional): Whether to use remote WebDriver. Defaults to False.
 
@@ -41,9 +69,10 @@ class WebDriverManager:
             webdriver: WebDriver instance
         """
         if remote:
-            return self._initialize_remote_driver()
+            driver = self._initialize_remote_driver()
         else:
-            return self._initialize_local_driver()
+            driver = self._initialize_local_driver()
+        return command_tracker.attach(driver)
 
     def _initialize_local_driver(self):
         """
@@ -63,9 +92,10 @@ class WebDriverManager:
             # options.add_experimental_option('excludeSwitches', ['enable-logging'])
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--window-size=1920,1080")
+            self._enable_performance_log(options)
             
-            self.driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()),
+            driver = webdriver.Chrome(
+                service=ChromeService(self.driver_cache.resolve("chrome")),
                 options=options
             )
         
@@ -74,8 +104,8 @@ class WebDriverManager:
             if self.headless:
                 options.add_argument("--headless")
             
-            self.driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
+            driver = webdriver.Firefox(
+                service=FirefoxService(self.driver_cache.resolve("firefox")),
                 options=options
             )
         
@@ -83,9 +113,10 @@ class WebDriverManager:
             options = EdgeOptions()
             if self.headless:
                 options.add_argument("--headless")
+            self._enable_performance_log(options)
             
-            self.driver = webdriver.Edge(
-                service=EdgeService(EdgeChromiumDriverManager().install()),
+            driver = webdriver.Edge(
+                service=EdgeService(self.driver_cache.resolve("edge")),
                 options=options
             )
         
@@ -94,11 +125,11 @@ class WebDriverManager:
             raise ValueError(f"Unsupported browser: {self.browser}")
         
         # Configure WebDriver
-        self.driver.maximize_window()
-        self.driver.implicitly_wait(self.implicit_wait)
+        driver.maximize_window()
+        driver.implicitly_wait(self.implicit_wait)
         
         log.info(f"Initialized local {self.browser} WebDriver")
-        return self.driver
+        return driver
 
     def _initialize_remote_driver(self):
         """
@@ -158,16 +189,16 @@ class WebDriverManager:
                 options.set_capability("LT:Options", lt_options)
 
         # Initialize remote WebDriver
-        self.driver = webdriver.Remote(
+        driver = webdriver.Remote(
             command_executor=remote_url,
             options=options
         )
 
         # Configure WebDriver
-        self.driver.implicitly_wait(self.implicit_wait)
+        driver.implicitly_wait(self.implicit_wait)
 
         log.info(f"Initialized remote {self.browser} WebDriver")
-        return self.driver
+        return driver
 
     # def _initialize_remote_driver(self):
     #     """
@@ -240,6 +271,7 @@ class WebDriverManager:
             options = ChromeOptions()
             if self.headless:
                 options.add_argument("--headless=new")
+            self._enable_performance_log(options)
             return options
         
         elif self.browser.lower() == "firefox":
@@ -252,11 +284,126 @@ class WebDriverManager:
             options = EdgeOptions()
             if self.headless:
                 options.add_argument("--headless")
+            self._enable_performance_log(options)
             return options
         
         else:
             return None
 
+    def _enable_performance_log(self, options):
+        """
+        Enable the browser performance log (DevTools Network events) when HAR capture is on.
+
+        Args:
+            options: ChromeOptions or EdgeOptions
+        """
+        if self.har_capture:
+            capability = "ms:loggingPrefs" if isinstance(options, EdgeOptions) else "goog:loggingPrefs"
+            options.set_capability(capability, {"performance": "ALL"})
+
+    def get_network_profile(self, name):
+        """
+        Get a named network profile from config/network_profiles.json.
+
+        Args:
+            name (str): Profile name
+
+        Returns:
+            NetworkProfile: The profile
+
+        Raises:
+            ValueError: If the profile is not defined.
+        """
+        if self.network_profiles is None:
+            self.network_profiles = load_network_profiles()
+        if name not in self.network_profiles:
+            raise ValueError(f"Unknown network profile '{name}'. "
+                             f"Available profiles: {', '.join(self.network_profiles)}")
+        return self.network_profiles[name]
+
+    def apply_network_profile(self, driver, name=None):
+        """
+        Apply a named network profile to a session and reset its network stats.
+
+        The DevTools interceptor is started on first use of a non-empty profile;
+        sessions that never block anything are not intercepted at all.
+        Interception needs a Chromium-based browser (Chrome, Edge).
+
+        Args:
+            driver: WebDriver instance
+            name (str, optional): Profile name. Defaults to the NETWORK_PROFILE env var ("default").
+
+        Returns:
+            NetworkInterceptor: The session's interceptor, or None if not intercepted
+        """
+        name = name or os.getenv("NETWORK_PROFILE", "default")
+        profile = self.get_network_profile(name)
+        interceptor = self._get_interceptor(driver, start=not profile.is_empty)
+        if interceptor is not None:
+            interceptor.set_profile(profile)
+            interceptor.reset_stats()
+            log.info(f"Applied network profile '{name}'")
+        return interceptor
+
+    def stub_responses(self, driver, folder_name, file_name):
+        """
+        Serve recorded responses from testData/<folder_name>/<file_name> to a session.
+
+        Use as a context manager; the stubs are active inside the with block:
+
+            with driver_manager.stub_responses(driver, "AutomationExerciseData", "stubs.json") as stubs:
+                ...
+            assert not stubs.unused
+
+        Args:
+            driver: WebDriver instance (Chrome or Edge)
+            folder_name (str): Folder under testData/
+            file_name (str): Stub file name
+
+        Returns:
+            StubSet: Stub set with hit/miss counters
+
+        Raises:
+            RuntimeError: If the session can't be intercepted.
+        """
+        interceptor = self._get_interceptor(driver)
+        if interceptor is None:
+            raise RuntimeError(f"Response stubbing needs network interception (Chrome or Edge), "
+                               f"not available for {self.browser}")
+        return StubSet(interceptor, folder_name, file_name)
+
+    def _get_interceptor(self, driver, start=True):
+        """
+        Get the network interceptor of a session, starting it on first use.
+
+        An interceptor whose DevTools connection went down (e.g. the test closed
+        the tab it was attached to) is started again on the current tab.
+
+        Args:
+            driver: WebDriver instance
+            start (bool, optional): Start an interceptor if the session has none. Defaults to True.
+
+        Returns:
+            NetworkInterceptor: The interceptor, or None if the session is not intercepted
+        """
+        interceptor = self.interceptors.get(driver)
+        if interceptor is not None and not interceptor.running:
+            log.warning(f"Network interceptor is no longer connected ({interceptor.error}), restarting it")
+            interceptor.stop()
+            # start() pushes the interceptor's current profile and stub sets
+            self.interceptors[driver] = interceptor if interceptor.start(driver) else None
+        if driver in self.interceptors:
+            return self.interceptors[driver]
+        if not start:
+            return None
+        if self.browser.lower() not in ("chrome", "edge"):
+            log.warning(f"Network interception needs Chrome or Edge, not {self.browser}")
+            self.interceptors[driver] = None
+            return None
+        interceptor = NetworkInterceptor()
+        self.interceptors[driver] = interceptor if interceptor.start(driver) else None
+        return self.interceptors[driver]
+
     def quit_driver(self):
         """Quit WebDriver instance."""
         if self.driver:
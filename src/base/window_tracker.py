@@ -0,0 +1,202 @@
+"""
+Window Tracker Module.
+
+This module keeps track of the window and frame a WebDriver session is focused
+on, so BasePage can skip switches that would not change anything and knows
+the current window without asking the browser. The state is shared by every
+page object of a session and is "unknown" until a switch through BasePage (or
+the browser pool's reset) establishes it; unknown state never skips a switch.
+
+On Chromium sessions a DevTools connection in a background thread reports new
+windows as they are created (Target.targetCreated), so waiting for a popup or
+tab does not poll window_handles. Other browsers fall back to polling.
+"""
+import math
+import threading
+import weakref
+import trio
+from selenium.webdriver.common.bidi import cdp
+from src.base.network_interceptor import START_TIMEOUT, devtools_endpoint
+from src.utils import logger
+log = logger.customLogger()
+
+# Browsers whose window handles are DevTools target ids
+CHROMIUM_BROWSERS = ("chrome", "msedge", "MicrosoftEdge")
+
+# Tracker per session; entries go away with the driver
+_trackers = weakref.WeakKeyDictionary()
+
+
+def get_window_tracker(driver):
+    """
+    Get the window tracker of a session, creating it on first use.
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        WindowTracker: Tracker shared by all page objects of the session
+    """
+    tracker = _trackers.get(driver)
+    if tracker is None:
+        tracker = _trackers[driver] = WindowTracker()
+    return tracker
+
+
+class WindowTracker:
+    """Focused window and frame stack of one session."""
+
+    def __init__(self):
+        """Initialize window tracker with unknown state."""
+        # Handle of the focused window, None when unknown
+        self.window = None
+        # Frame references entered from the top document, None when unknown
+        self.frames = None
+        # WindowWatcher, or False once it is known to be unavailable
+        self.watcher = None
+
+    @property
+    def at_top(self):
+        """True when the session is known to be on the top document of its window."""
+        return self.frames == []
+
+    def forget(self):
+        """Mark the focused window and frame as unknown."""
+        self.window = None
+        self.frames = None
+
+    def switched_window(self, handle):
+        """Record a switch to a window (which always lands on its top document)."""
+        self.window = handle
+        self.frames = []
+
+    def navigated(self):
+        """Record a top-level navigation (focus returns to the top document)."""
+        self.frames = []
+
+    def entered_frame(self, frame_reference):
+        """Record a switch into a frame of the current document."""
+        if self.frames is not None:
+            self.frames.append(frame_reference)
+
+    def left_frame(self):
+        """Record a switch to the parent frame."""
+        if self.frames:
+            self.frames.pop()
+
+    def get_watcher(self, driver):
+        """
+        Get the new-window watcher of the session, starting it on first use.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            WindowWatcher or None: The running watcher, or None if the session can't be watched
+        """
+        if self.watcher is None:
+            self.watcher = False
+            if driver.caps.get("browserName") in CHROMIUM_BROWSERS:
+                watcher = WindowWatcher()
+                if watcher.start(driver):
+                    self.watcher = watcher
+        if self.watcher and not self.watcher.running:
+            self.watcher = False
+        return self.watcher or None
+
+
+class WindowWatcher:
+    """Collects the windows a Chromium browser opens, from DevTools target events."""
+
+    def __init__(self):
+        """Initialize window watcher."""
+        self.error = None
+        self.opened = []
+        self._known = set()
+        self._changed = threading.Condition()
+        self._ready = threading.Event()
+        self._thread = None
+
+    def start(self, driver):
+        """
+        Connect to a session's DevTools endpoint in a background thread.
+
+        Args:
+            driver: Chromium WebDriver instance
+
+        Returns:
+            bool: True if new windows are being watched
+        """
+        try:
+            version, ws_url = devtools_endpoint(driver)
+        except Exception as e:
+            log.info(f"Window events unavailable for this session, polling instead: {e}")
+            return False
+
+        self._thread = threading.Thread(target=trio.run, args=(self._run, version, ws_url),
+                                        name="window-watcher", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(START_TIMEOUT) or self.error:
+            log.info(f"Window events unavailable, polling instead: {self.error or 'timed out'}")
+            return False
+        log.info("Watching for new windows through DevTools target events")
+        return True
+
+    @property
+    def running(self):
+        """True while the DevTools connection is up."""
+        return self._thread is not None and self._thread.is_alive() and not self.error
+
+    def mark(self):
+        """
+        Mark the windows opened so far (call before the action that opens a window).
+
+        Returns:
+            int: Marker for wait_for_new_window()
+        """
+        with self._changed:
+            return len(self.opened)
+
+    def wait_for_new_window(self, mark, timeout):
+        """
+        Wait for a window opened after a mark.
+
+        Args:
+            mark (int): Marker from mark()
+            timeout (float): Timeout in seconds
+
+        Returns:
+            str: Handle of the first window opened after the mark, or None on timeout
+        """
+        with self._changed:
+            if self._changed.wait_for(lambda: len(self.opened) > mark or not self.running, timeout):
+                if len(self.opened) > mark:
+                    return self.opened[mark]
+        return None
+
+    async def _run(self, version, ws_url):
+        """Background thread main: record page targets as they are created."""
+        try:
+            devtools = cdp.import_devtools(version)
+            async with cdp.open_cdp(ws_url) as connection:
+                events = connection.listen(devtools.target.TargetCreated, buffer_size=math.inf)
+                await connection.execute(devtools.target.set_discover_targets(True))
+                # Windows that exist already are not "new"
+                for info in await connection.execute(devtools.target.get_targets()):
+                    self._known.add(str(info.target_id))
+                self._ready.set()
+                async for event in events:
+                    target_id = str(event.target_info.target_id)
+                    if event.target_info.type_ == "page" and target_id not in self._known:
+                        self._known.add(target_id)
+                        with self._changed:
+                            self.opened.append(target_id)
+                            self._changed.notify_all()
+        except Exception as e:
+            # Also the normal end of a watcher whose session was quit
+            self.error = str(e) or type(e).__name__
+            log.debug(f"Window watcher stopped: {self.error}")
+        finally:
+            self._ready.set()
+            with self._changed:
+                self._changed.notify_all()
@@ -142,8 +142,7 @@ class DashboardPage(BasePage):
         Returns:
             list: List of menu item texts
         """
-        menu_items = self.get_menu_items()
-        return [item.text for item in menu_items]
+        return self.get_texts(self.locators.MENU_ITEMS)
 
     def is_dashboard_displayed(self):
         """
@@ -66,7 +66,7 @@ class LoginPage(BasePage):
         self.click(self.locators.LOGIN_BUTTON)
         
         # Wait for page to load
-        self.wait_for_page_load()
+        self.wait_for_page_ready()
         
         return self
 
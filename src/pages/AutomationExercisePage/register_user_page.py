@@ -84,6 +84,29 @@ class RegisterUserPage(BasePage):
     def enterMobilenumber(self, mobile_number):
         self.input_text(self.locators.mobile_number, mobile_number)
 
+    def fillAccountInformation(self, password, birth_day, birth_month, birth_year, first_name, last_name,
+                               company, street_address, address_2, country, state, city, zipcode,
+                               mobile_number, newsletter=True, special_offers=True):
+        """Fill the whole account information form with one wait and batched value updates."""
+        self.fill_form({
+            self.locators.password: password,
+            self.locators.Date_of_Birth_day: birth_day,
+            self.locators.Date_of_Birth_month: birth_month,
+            self.locators.Date_of_Birth_year: birth_year,
+            self.locators.newsletter: newsletter,
+            self.locators.special_offers: special_offers,
+            self.locators.address_firstName: first_name,
+            self.locators.address_lastName: last_name,
+            self.locators.address_company: company,
+            self.locators.street_address: street_address,
+            self.locators.address_2: address_2,
+            self.locators.country: country,
+            self.locators.state: state,
+            self.locators.city: city,
+            self.locators.zipcode: zipcode,
+            self.locators.mobile_number: mobile_number,
+        })
+
     def clickCreateaccountButton(self):
         self.click(self.locators.create_account)
 
@@ -1,5 +1,3 @@
-import time
-
 from src.pages.base_page import BasePage
 from src.pages.locators import AutomationPracticeLocators
 from src.utils import logger
@@ -38,9 +36,10 @@ class AcademyPage(BasePage):
 
     def enterandAutoselectCountry(self,country):
         self.input_text(self.locators.autocomplete,country)
-        self.press_key("ARROW_DOWN")
-        self.press_key("ARROW_DOWN")
-        self.press_key("ENTER")
+        with self.batch_actions():
+            self.press_key("ARROW_DOWN")
+            self.press_key("ARROW_DOWN")
+            self.press_key("ENTER")
 
 
     def selectDropdownByValue(self,dropdownvalue):
@@ -53,16 +52,12 @@ class AcademyPage(BasePage):
 
 
     def switchWindows(self):
-        self.click(self.locators.switchWindows)
-        # l=self.get_window_handles()
-        # self.switch_to_window_by_handle(l[1])
-        self.switch_to_window_by_index(1)
+        self.switch_to_new_window_after_action(lambda: self.click(self.locators.switchWindows))
         self.click(self.locators.logo)
         self.close_current_window_and_switch_back()
 
     def switchOpenTab(self):
-        self.click(self.locators.opentab)
-        self.switch_to_window_by_index(1)
+        self.switch_to_new_window_after_action(lambda: self.click(self.locators.opentab))
         self.click(self.locators.logo)
         self.open_new_tab_and_switch()
         self.close_current_window_and_switch_back()
@@ -1,49 +1,51 @@
 import os
+import re
+import sys
 import time
-import datetime
-from functools import wraps
+from contextlib import contextmanager
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.select import Select
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
-    ElementNotVisibleException,
+    NoSuchWindowException,
     StaleElementReferenceException,
     ElementNotInteractableException,
+    UnexpectedTagNameException,
     WebDriverException
 )
 
+from src.base.har_recorder import har_recorder
+from src.base.window_tracker import get_window_tracker
+from src.pages.element_cache import CACHEABLE_CONDITIONS, ElementCache
+from src.pages.js_scripts import (
+    DROPDOWN_JS, EXTRACT_TABLE_JS, FILL_FORM_JS, FIND_BY_TEXT_JS, GET_TEXTS_JS, HIGHLIGHT_JS, PAGE_METRICS_JS, RESOLVE_ELEMENTS_JS
+)
+from src.pages.page_metrics import page_metrics
+from src.pages.readiness import ReadinessEngine
+from src.pages.retry_policy import retry_on_transient
+from src.pages.table_data import TableData
+from src.pages.wait_engine import OBSERVED_STATES, WaitEngine, wait_stats
+from src.utils.screenshot_service import screenshot_service
+from src.utils.timing_stats import TimingStats
 from src.utils import logger
 log = logger.customLogger()
 
-# --- Retry Decorator ---
-def retry_on_timeout(retries=1, delay=30):
-    """Decorator to retry a function call if TimeoutException occurs."""
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            attempts = 0
-            while attempts <= retries:
-                try:
-                    return func(*args, **kwargs)
-                except (TimeoutException, WebDriverException) as e:
-                    attempts += 1
-                    if attempts > retries:
-                        log.error(f"Operation failed after {retries} retry. Error: {str(e)}")
-                        raise
-                    log.warning(
-                        f"Timeout caught (attempt {attempts}/{retries}). Retrying in {delay}s...")
-                    time.sleep(delay)
+# Text match modes of FIND_BY_TEXT_JS
+TEXT_MATCH_MODES = ("exact", "contains", "normalized", "regex")
 
-        return wrapper
+# Process-wide duration of dropdown reads and selections per locator
+dropdown_stats = TimingStats("dropdown")
 
-    return decorator
+# Exception raised for each DROPDOWN_JS errorType, matching Selenium's Select
+DROPDOWN_ERRORS = {
+    "tag": UnexpectedTagNameException,
+    "missing": NoSuchElementException,
+    "disabled": NotImplementedError,
+}
 
 class BasePage:
     """Enhanced Base Page class for all page objects."""
@@ -57,6 +59,18 @@ class BasePage:
             log.warning("Invalid EXPLICIT_WAIT env var. Using default: 20s")
             self.explicit_wait_timeout = 20
 
+        self.wait_engine = WaitEngine(driver, self.explicit_wait_timeout)
+        try:
+            self.network_idle_ms = int(os.getenv("NETWORK_IDLE_MS", "500"))
+            self.page_ready_timeout = float(os.getenv("PAGE_READY_TIMEOUT", "10"))
+        except ValueError:
+            log.warning("Invalid NETWORK_IDLE_MS/PAGE_READY_TIMEOUT env var. Using defaults: 500ms/10s")
+            self.network_idle_ms, self.page_ready_timeout = 500, 10.0
+        self.readiness = ReadinessEngine(driver, self.explicit_wait_timeout)
+        self.collect_page_metrics = os.getenv("PAGE_METRICS", "True").lower() == "true"
+        self._action_batch = None
+        self.window_tracker = get_window_tracker(driver)
+        self.element_cache = ElementCache(driver, os.getenv("ELEMENT_CACHE", "True").lower() == "true")
         self.default_base_url = os.getenv("AUTOMATIONEXERCISE_BASE_URL", "https://google.com")
         self.screenshots_dir = os.getenv("SCREENSHOTS_DIR", "reports/screenshots")
         os.makedirs(self.screenshots_dir, exist_ok=True)
@@ -64,9 +78,13 @@ class BasePage:
 
     # --- Private Helper Methods ---
 
-    def _wait_for_condition(self, locator, condition, timeout=None, message=""):
+    def _wait_for_condition(self, locator, condition, timeout=None, message="", state=None, expected=None):
         """
         Internal helper to wait for a specific expected condition on an element.
+        All element waits go through the wait engine (the session runs with an
+        implicit wait of 0). Conditions on a DOM state are observed in the
+        browser instead of polled. Single elements found present, visible or
+        clickable are cached per locator and reused after a liveness check.
         Handles TimeoutException and logs appropriately.
 
         Args:
@@ -74,6 +92,9 @@ class BasePage:
             condition (callable): Expected condition function from selenium.webdriver.support.expected_conditions
             timeout (int, optional): Specific timeout for this wait. Defaults to self.explicit_wait_timeout.
             message (str, optional): Custom message for TimeoutException.
+            state (str, optional): DOM state the condition waits for (see WaitEngine.until_observed).
+                Defaults to the state of known expected conditions; other conditions are polled.
+            expected (str, optional): Expected text for the "text" state.
 
         Returns:
             WebElement or list[WebElement] or bool: Result from the condition.
@@ -82,9 +103,21 @@ class BasePage:
             TimeoutException: If the condition is not met within the timeout.
         """
         timeout = timeout if timeout is not None else self.explicit_wait_timeout
-        wait = WebDriverWait(self.driver, timeout,ignored_exceptions=[NoSuchElementException, ElementNotVisibleException,StaleElementReferenceException])
-        try:
-            element = wait.until(condition(locator), message)
+        cached_state = CACHEABLE_CONDITIONS.get(condition)
+        if cached_state:
+            element = self.element_cache.get(locator, cached_state)
+            if element is not None:
+                log.info(f"Reusing cached element ({cached_state}) for locator: {locator}")
+                return element
+        try:
+            state = state or OBSERVED_STATES.get(condition)
+            if state:
+                element = self.wait_engine.until_observed(condition(locator), locator, state, timeout, message,
+                                                          expected=expected)
+            else:
+                element = self.wait_engine.until(condition(locator), timeout, message, key=locator)
+            if cached_state:
+                self.element_cache.put(locator, element)
             condition_name = condition.__name__ if hasattr(condition, "__name__") else "custom condition"
             log.info(f"Condition {condition_name} met for locator: {locator}")
             return element
@@ -99,20 +132,57 @@ class BasePage:
             self.take_screenshot("wait_exception")
             raise
 
+    def _dropdown(self, locator, action, target=None, timeout=None):
+        """
+        Read or change a <select> with one DROPDOWN_JS call and record the duration.
+
+        Args:
+            locator (tuple): Locator of the <select> element
+            action (str): read, text, value or index
+            target (optional): Visible text, value or index to select
+            timeout (int, optional): Specific timeout for this wait.
+
+        Returns:
+            dict: Script result ({options} for read, {selected} for selections)
+
+        Raises:
+            UnexpectedTagNameException: If the element is not a <select>.
+            NoSuchElementException: If no option matches.
+            NotImplementedError: If the matching option is disabled.
+        """
+        start = time.monotonic()
+        element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
+        result = self.driver.execute_script(DROPDOWN_JS, element, action, target)
+        dropdown_stats.record(f"{action} {locator}", time.monotonic() - start)
+        if result.get("error"):
+            raise DROPDOWN_ERRORS[result["errorType"]](result["error"])
+        return result
+
     def _highlight(self, element, effect_time=0.1, color="red", border=3):
         """
         Highlights (blinks) a Selenium WebDriver element. Useful for debugging.
+        The original style is restored in the browser after effect_time, so this
+        costs a single round trip and never blocks the test.
         (Helper method - consider making it public if needed for debugging steps)
         """
         try:
-            original_style = element.get_attribute("style")
             highlight_style = f"border: {border}px solid {color};"
-            self.driver.execute_script("arguments[0].setAttribute('style', arguments[1]);", element, highlight_style)
-            time.sleep(effect_time)
-            self.driver.execute_script("arguments[0].setAttribute('style', arguments[1]);", element, original_style)
+            self.driver.execute_script(HIGHLIGHT_JS, element, highlight_style, int(effect_time * 1000))
         except WebDriverException:
             log.warning("Could not highlight element, possibly due to page refresh or element becoming stale.")
 
+    def _capture_page_metrics(self):
+        """
+        Record performance metrics of the current page (Navigation/Resource Timing,
+        FCP/LCP/CLS) in one script call. Never fails the calling action.
+        """
+        if not self.collect_page_metrics:
+            return
+        try:
+            page_metrics.record(self.driver.execute_async_script(PAGE_METRICS_JS))
+        except WebDriverException as e:
+            log.warning(f"Could not capture page metrics: {e.msg}")
+
     # --- Core Interaction Methods ---
 
     def open(self,base_url_env_key=None,url_path="" ):
@@ -132,14 +202,19 @@ class BasePage:
         full_url = f"{base_url.rstrip('/')}/{url_path.lstrip('/')}"
         log.info(f"Opening URL: {full_url}")
         try:
+            self.element_cache.clear()
             self.driver.get(full_url)
+            self.window_tracker.navigated()
+            self.wait_for_page_ready()
+            self._capture_page_metrics()
+            har_recorder.flush()
             log.info(f"Opened URL successfully: {full_url}")
         except Exception as e:
             log.error(f"Failed to open URL {full_url}: {str(e)}")
             raise
         return self
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def find_element(self, locator, timeout=None):
         """
         Find a single element using the specified locator and wait condition.
@@ -154,7 +229,7 @@ class BasePage:
         log.info(f"Finding element: {locator}")
         return self._wait_for_condition(locator, EC.presence_of_element_located, timeout)
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def find_elements(self, locator, timeout=None):
         """
         Find multiple elements using the specified locator.
@@ -169,7 +244,7 @@ class BasePage:
         log.info(f"Finding elements: {locator}")
         return self._wait_for_condition(locator, EC.presence_of_all_elements_located, timeout)
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def click(self, locator, timeout=None, use_js_fallback=True):
         """
         Clicks an element after ensuring it is clickable.
@@ -210,7 +285,7 @@ class BasePage:
             raise
         return self
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def input_text(self, locator, text, clear_first=True, timeout=None):
         """
         Inputs text into an element after ensuring it is visible.
@@ -240,7 +315,53 @@ class BasePage:
         return self
 
 
-    @retry_on_timeout()
+    def fill_form(self, fields, keystroke_fields=(), timeout=None):
+        """
+        Fills several form fields with one wait and batched value updates.
+
+        All target locators are resolved together in a single wait, then every
+        value is set in one script call that fires input/change events.
+        Fields listed in keystroke_fields are typed with real keystrokes
+        (input_text) instead, for widgets that only react to key events, and
+        for contenteditable elements. Like the per-field methods, disabled or
+        read-only fields, disabled options and file inputs are refused.
+
+        Args:
+            fields (dict): {locator: value}. Strings for text inputs/textareas,
+                the option value for selects, bool for checkboxes/radio buttons.
+            keystroke_fields (iterable, optional): Locators that need real keystrokes.
+            timeout (int, optional): Specific timeout for the wait.
+
+        Returns:
+            BasePage: self for chaining.
+        """
+        keystroke_fields = set(keystroke_fields)
+        batch = [(locator, value) for locator, value in fields.items() if locator not in keystroke_fields]
+        log.info(f"Filling form: {len(batch)} batched fields, {len(fields) - len(batch)} keystroke fields")
+        timeout = timeout if timeout is not None else self.explicit_wait_timeout
+        try:
+            if batch:
+                locators = [list(locator) for locator, _ in batch]
+                elements = self.wait_engine.until(
+                    lambda driver: driver.execute_script(RESOLVE_ELEMENTS_JS, locators),
+                    timeout,
+                    message=f"Form fields not all visible: {locators}",
+                    key="fill_form"
+                )
+                errors = self.execute_script(FILL_FORM_JS, elements, [value for _, value in batch])
+                if errors:
+                    raise NoSuchElementException("; ".join(errors))
+            for locator, value in fields.items():
+                if locator in keystroke_fields:
+                    self.input_text(locator, value, timeout=timeout)
+            log.info("Filled form successfully.")
+        except Exception as e:
+            log.error(f"Failed to fill form: {str(e)}")
+            self.take_screenshot("fill_form_failed")
+            raise
+        return self
+
+    @retry_on_transient()
     def get_text(self, locator, timeout=None):
         """
         Gets the text content of an element.
@@ -264,7 +385,7 @@ class BasePage:
             self.take_screenshot("get_text_failed")
             raise
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def get_attribute(self, locator, attribute_name, timeout=None):
         """
         Gets the value of a specified attribute of an element.
@@ -356,7 +477,7 @@ class BasePage:
             log.info(f"Element is still visible or present: {locator}")
             return False
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def is_element_enabled(self, locator, timeout=None):
         """
         Checks if an element is enabled.
@@ -378,7 +499,7 @@ class BasePage:
             log.error(f"Failed to check if element {locator} is enabled: {str(e)}")
             return False  # Return False on error
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def is_element_selected(self, locator, timeout=None):
         """
         Checks if a checkbox or radio button element is selected.
@@ -425,7 +546,8 @@ class BasePage:
     def wait_for_text_in_element(self, locator, text, timeout=None):
         """Waits for specific text to be present in an element."""
         log.info(f"Waiting for text ", {text}, f" in element: {locator}")
-        return self._wait_for_condition(locator, EC.text_to_be_present_in_element(locator, text), timeout)
+        return self._wait_for_condition(locator, lambda loc: EC.text_to_be_present_in_element(loc, text), timeout,
+                                        state="text", expected=text)
 
     def wait_for_attribute_value(self, locator, attribute, expected_value, timeout=None):
         """
@@ -454,11 +576,15 @@ class BasePage:
                 log.warning(f"Error checking attribute '{attribute}' for {locator}: {e}")
                 return False
 
-        wait = WebDriverWait(self.driver, timeout if timeout is not None else self.explicit_wait_timeout)
         try:
-            return wait.until(
+            return self.wait_engine.until_observed(
                 attribute_value_matches,
-                message=f"Attribute '{attribute}' for {locator} did not become '{expected_value}'"
+                locator,
+                "attribute",
+                timeout,
+                message=f"Attribute '{attribute}' for {locator} did not become '{expected_value}'",
+                attribute=attribute,
+                expected=expected_value
             )
         except TimeoutException:
             log.error(f"Timeout waiting for attribute '{attribute}' of {locator} to be '{expected_value}'")
@@ -476,8 +602,10 @@ class BasePage:
         timeout = timeout if timeout is not None else self.explicit_wait_timeout
         log.info(f"Waiting for page load to complete (document.readyState === 'complete') for {timeout}s")
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            self.wait_engine.until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete",
+                timeout,
+                key="document.readyState"
             )
             log.info("Page load complete.")
         except TimeoutException:
@@ -489,16 +617,72 @@ class BasePage:
             log.error(f"Error waiting for page load: {str(e)}")
             # raise
 
+    def wait_for_network_idle(self, quiet_ms=None, timeout=None):
+        """
+        Waits until the page has loaded and no fetch/XHR request has been in flight for quiet_ms.
+
+        Args:
+            quiet_ms (int, optional): Required quiet time in ms. Defaults to NETWORK_IDLE_MS (500).
+            timeout (int, optional): Specific timeout for this wait.
+
+        Raises:
+            TimeoutException: If the network does not go idle within the timeout.
+        """
+        quiet_ms = quiet_ms if quiet_ms is not None else self.network_idle_ms
+        log.info(f"Waiting for network idle ({quiet_ms}ms quiet)")
+        try:
+            self.readiness.wait(quiet_ms=quiet_ms, timeout=timeout, key="network idle")
+            log.info("Network is idle.")
+        except TimeoutException as e:
+            log.error(str(e))
+            self.take_screenshot("network_idle_timeout")
+            raise
+
+    def wait_for_render_stable(self, frames=3, timeout=None):
+        """
+        Waits until rendering is stable: no DOM mutations, size or scroll changes and no
+        finite animations running for the given number of consecutive animation frames.
+
+        Args:
+            frames (int, optional): Required consecutive stable frames. Defaults to 3.
+            timeout (int, optional): Specific timeout for this wait.
+
+        Raises:
+            TimeoutException: If rendering does not settle within the timeout.
+        """
+        log.info(f"Waiting for render to be stable ({frames} frames)")
+        try:
+            self.readiness.wait(frames=frames, timeout=timeout, key="render stable")
+            log.info("Render is stable.")
+        except TimeoutException as e:
+            log.error(str(e))
+            self.take_screenshot("render_stable_timeout")
+            raise
+
+    def wait_for_page_ready(self, timeout=None):
+        """
+        Waits until the network is idle and rendering is stable, in one wait.
+        Used after navigation and scrolling; a page that never settles (e.g. constant
+        polling) is logged and the test continues.
+
+        Args:
+            timeout (int, optional): Specific timeout for this wait. Defaults to PAGE_READY_TIMEOUT (10s).
+        """
+        timeout = timeout if timeout is not None else self.page_ready_timeout
+        try:
+            self.readiness.wait(quiet_ms=self.network_idle_ms, frames=3, timeout=timeout)
+            log.info("Page is ready (network idle, render stable).")
+        except TimeoutException as e:
+            log.warning(f"{e.msg} Continuing.")
+
     # --- Dropdown Methods ---
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def select_dropdown_option_by_text(self, locator, visible_text, timeout=None):
         """Selects an option from a dropdown by its visible text."""
         log.info(f"Selecting dropdown option by text: '{visible_text}' for locator: {locator}")
         try:
-            element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-            select = Select(element)
-            select.select_by_visible_text(visible_text)
+            self._dropdown(locator, "text", visible_text, timeout)
             log.info(f"Selected option '{visible_text}' successfully.")
         except Exception as e:
             log.error(f"Failed to select dropdown option by text '{visible_text}' for {locator}: {str(e)}")
@@ -506,14 +690,12 @@ class BasePage:
             raise
         return self
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def select_dropdown_option_by_value(self, locator, value, timeout=None):
         """Selects an option from a dropdown by its value attribute."""
         log.info(f"Selecting dropdown option by value: '{value}' for locator: {locator}")
         try:
-            element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-            select = Select(element)
-            select.select_by_value(value)
+            self._dropdown(locator, "value", value, timeout)
             log.info(f"Selected option with value '{value}' successfully.")
         except Exception as e:
             log.error(f"Failed to select dropdown option by value '{value}' for {locator}: {str(e)}")
@@ -521,14 +703,12 @@ class BasePage:
             raise
         return self
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def select_dropdown_option_by_index(self, locator, index, timeout=None):
         """Selects an option from a dropdown by its index (0-based)."""
         log.info(f"Selecting dropdown option by index: {index} for locator: {locator}")
         try:
-            element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-            select = Select(element)
-            select.select_by_index(index)
+            self._dropdown(locator, "index", index, timeout)
             log.info(f"Selected option at index {index} successfully.")
         except Exception as e:
             log.error(f"Failed to select dropdown option by index {index} for {locator}: {str(e)}")
@@ -536,45 +716,102 @@ class BasePage:
             raise
         return self
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def get_dropdown_selected_option_text(self, locator, timeout=None):
         """Gets the text of the currently selected option in a dropdown."""
         log.info(f"Getting selected option text from dropdown: {locator}")
         try:
-            element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-            select = Select(element)
-            selected_text = select.first_selected_option.text
-            log.info(f"Selected dropdown option text: ", {selected_text}, "")
-            return selected_text
+            options = self._dropdown(locator, "read", timeout=timeout)["options"]
+            selected = [option["text"] for option in options if option["selected"]]
+            if not selected:
+                raise NoSuchElementException("No options are selected")
+            log.info(f"Selected dropdown option text: {selected[0]}")
+            return selected[0]
         except Exception as e:
             log.error(f"Failed to get selected dropdown text for {locator}: {str(e)}")
             return None
 
-    @retry_on_timeout()
+    @retry_on_transient()
     def get_dropdown_options_texts(self, locator, timeout=None):
         """Gets the text of all options in a dropdown."""
         log.info(f"Getting all option texts from dropdown: {locator}")
         try:
-            element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-            select = Select(element)
-            options_texts = [option.text for option in select.options]
+            options_texts = [option["text"] for option in self._dropdown(locator, "read", timeout=timeout)["options"]]
             log.info(f"Found {len(options_texts)} options in dropdown {locator}")
             return options_texts
         except Exception as e:
             log.error(f"Failed to get dropdown options texts for {locator}: {str(e)}")
             return []
 
+    @retry_on_transient()
+    def get_dropdown_options(self, locator, timeout=None):
+        """
+        Gets every option of a dropdown in one call.
+
+        Args:
+            locator (tuple): Locator of the <select> element
+            timeout (int, optional): Specific timeout for this wait.
+
+        Returns:
+            list[dict]: {text, value, selected, disabled} per option, in document order.
+        """
+        log.info(f"Getting all options from dropdown: {locator}")
+        try:
+            options = self._dropdown(locator, "read", timeout=timeout)["options"]
+            log.info(f"Found {len(options)} options in dropdown {locator}")
+            return options
+        except Exception as e:
+            log.error(f"Failed to get dropdown options for {locator}: {str(e)}")
+            return []
+
     # --- ActionChains Methods ---
 
-    @retry_on_timeout()
+    @contextmanager
+    def batch_actions(self):
+        """
+        Record the pointer/key actions of BasePage methods and perform them as one actions request.
+
+        Inside the block, hover_over_element, press_key, press_key_down, press_key_up,
+        double_click, right_click and drag_and_drop only record their actions (the
+        elements they target are still located immediately). On leaving the block
+        the whole sequence is sent in a single W3C actions call; nothing is sent if
+        the block raises. Transient errors are not retried inside the block, since a
+        retry would record the same actions twice. Nested blocks join the outer batch.
+
+        Ex:
+            with self.batch_actions():
+                self.press_key("ARROW_DOWN")
+                self.press_key("ENTER")
+        """
+        if self._action_batch is not None:
+            yield self
+            return
+        self._action_batch = ActionChains(self.driver)
+        try:
+            yield self
+            log.info("Performing batched actions")
+            self._action_batch.perform()
+        finally:
+            self._action_batch = None
+
+    def _actions(self):
+        """ActionChains to record on: the open batch, or a new chain."""
+        return self._action_batch if self._action_batch is not None else ActionChains(self.driver)
+
+    def _perform(self, actions):
+        """Perform an action chain now, unless it is the open batch (performed when the batch closes)."""
+        if actions is not self._action_batch:
+            actions.perform()
+
+    @retry_on_transient()
     def hover_over_element(self, locator, timeout=None):
         """Hovers the mouse cursor over an element."""
         log.info(f"Hovering over element: {locator}")
         try:
             element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
             self._highlight(element)
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element).perform()
+            actions = self._actions()
+            self._perform(actions.move_to_element(element))
             log.info(f"Hovered over element {locator} successfully.")
             # Removed time.sleep(1) - wait for subsequent element if needed
         except Exception as e:
@@ -599,13 +836,13 @@ class BasePage:
     def press_key(self, key, locator=None, timeout=None):
         try:
             key_obj = self._get_key(key)
-            action = ActionChains(self.driver)
+            action = self._actions()
 
             if locator:
                 element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-                action.send_keys_to_element(element, key_obj).perform()
+                self._perform(action.send_keys_to_element(element, key_obj))
             else:
-                action.send_keys(key_obj).perform()
+                self._perform(action.send_keys(key_obj))
         except Exception as e:
             log.error(f"Failed to press key '{key}': {e}")
             raise
@@ -620,17 +857,17 @@ class BasePage:
         """
         try:
             key_obj = self._get_key(key)
-            action_chains = ActionChains(self.driver)
+            action_chains = self._actions()
 
             if locator:
                 log.info(f"Pressing key '{key}' down on element: {locator}")
                 element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
 
-                action_chains.key_down(key_obj, element).perform()
+                self._perform(action_chains.key_down(key_obj, element))
                 log.info(f"Successfully pressed key '{key}' down on element: {locator}")
             else:
                 log.info(f"Pressing key '{key}' down")
-                action_chains.key_down(key_obj).perform()
+                self._perform(action_chains.key_down(key_obj))
                 log.info(f"Successfully pressed key '{key}' down")
         except Exception as e:
             log.error(f"Failed to press key '{key}' down: {str(e)}")
@@ -646,16 +883,16 @@ class BasePage:
         """
         try:
             key_obj = self._get_key(key)
-            action_chains = ActionChains(self.driver)
+            action_chains = self._actions()
 
             if locator:
                 log.info(f"Releasing key '{key}' on element: {locator}")
                 element = self._wait_for_condition(locator, EC.visibility_of_element_located, timeout)
-                action_chains.key_up(key_obj, element).perform()
+                self._perform(action_chains.key_up(key_obj, element))
                 log.info(f"Successfully released key '{key}' on element: {locator}")
             else:
                 log.info(f"Releasing key '{key}'")
-                action_chains.key_up(key_obj).perform()
+                self._perform(action_chains.key_up(key_obj))
                 log.info(f"Successfully released key '{key}'")
         except Exception as e:
             log.error(f"Failed to release key '{key}': {str(e)}")
@@ -669,8 +906,8 @@ class BasePage:
         try:
             element = self._wait_for_condition(locator, EC.element_to_be_clickable, timeout)
             self._highlight(element)
-            actions = ActionChains(self.driver)
-            actions.double_click(element).perform()
+            actions = self._actions()
+            self._perform(actions.double_click(element))
             log.info(f"Double-clicked element {locator} successfully.")
         except Exception as e:
             log.error(f"Failed to double-click element {locator}: {str(e)}")
@@ -685,8 +922,8 @@ class BasePage:
         try:
             element = self._wait_for_condition(locator, EC.element_to_be_clickable, timeout)
             self._highlight(element)
-            actions = ActionChains(self.driver)
-            actions.context_click(element).perform()
+            actions = self._actions()
+            self._perform(actions.context_click(element))
             log.info(f"Right-clicked element {locator} successfully.")
         except Exception as e:
             log.error(f"Failed to right-click element {locator}: {str(e)}")
@@ -703,8 +940,8 @@ class BasePage:
             target_element = self._wait_for_condition(target_locator, EC.visibility_of_element_located, timeout)
             self._highlight(source_element)
             self._highlight(target_element)
-            actions = ActionChains(self.driver)
-            actions.drag_and_drop(source_element, target_element).perform()
+            actions = self._actions()
+            self._perform(actions.drag_and_drop(source_element, target_element))
             log.info(f"Dragged {source_locator} to {target_locator} successfully.")
         except Exception as e:
             log.error(f"Failed to drag and drop from {source_locator} to {target_locator}: {str(e)}")
@@ -729,6 +966,7 @@ class BasePage:
             element = self._wait_for_condition(locator, EC.presence_of_element_located, timeout)
             # Use scrollIntoView with boolean argument
             self.execute_script("arguments[0].scrollIntoView(arguments[1]);", element, align_to_top)
+            self.wait_for_page_ready()
             # Alternative: scrollIntoView({block: "start"/"end"})
             # block_arg = "start" if align_to_top else "end"
             # self.execute_script(f"arguments[0].scrollIntoView({{block: \"{block_arg}\", behavior: \"smooth\"}});", element)
@@ -773,6 +1011,7 @@ class BasePage:
                 log.info("Scrolling left to the element")
             # Final scroll into view
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center', inline: 'center'});", element)
+            self.wait_for_page_ready()  # Smooth scrolling ends when the scroll position stops changing
             log.info(f"Successfully scrolled to element with locator: {locator}")
 
         except Exception as e:
@@ -805,8 +1044,8 @@ class BasePage:
             else:
                 log.warning(f"Invalid scroll direction: {direction}")
                 return self
+            self.wait_for_page_ready()  # Lazy-loaded content settles instead of a fixed pause
             log.info(f"Scrolled page {direction} successfully.")
-            time.sleep(0.5)  # Small pause to allow rendering after scroll
         except Exception as e:
             log.error(f"Failed to scroll page {direction}: {str(e)}")
             # No screenshot here as it might not be a critical failure
@@ -821,7 +1060,7 @@ class BasePage:
         timeout = timeout if timeout is not None else self.explicit_wait_timeout
         log.info(f"Waiting for alert ({timeout}s)")
         try:
-            alert = WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            alert = self.wait_engine.until(EC.alert_is_present(), timeout, key="alert")
             log.info("Alert is present")
             return alert
         except TimeoutException:
@@ -893,9 +1132,13 @@ class BasePage:
         timeout = timeout if timeout is not None else self.explicit_wait_timeout
         log.info(f"Switching to frame using reference: {frame_reference}")
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.frame_to_be_available_and_switch_to_it(frame_reference)
+            self.element_cache.clear()
+            self.wait_engine.until(
+                EC.frame_to_be_available_and_switch_to_it(frame_reference),
+                timeout,
+                key=f"frame {frame_reference}"
             )
+            self.window_tracker.entered_frame(frame_reference)
             log.info(f"Switched to frame {frame_reference} successfully.")
         except TimeoutException:
             log.error(f"TimeoutException: Frame {frame_reference} not available or could not switch within {timeout}s.")
@@ -910,8 +1153,13 @@ class BasePage:
     def switch_to_default_content(self):
         """Switches back to the main document from a frame."""
         log.info("Switching to default content")
+        if self.window_tracker.at_top:
+            log.info("Already in default content. Skipping switch.")
+            return self
         try:
+            self.element_cache.clear()
             self.driver.switch_to.default_content()
+            self.window_tracker.navigated()
             log.info("Switched to default content successfully.")
         except Exception as e:
             log.error(f"Failed to switch to default content: {str(e)}")
@@ -921,8 +1169,13 @@ class BasePage:
     def switch_to_parent_frame(self):
         """Switches to the parent frame from a nested frame."""
         log.info("Switching to parent frame")
+        if self.window_tracker.at_top:
+            log.info("Already at the top-level document. Skipping switch.")
+            return self
         try:
+            self.element_cache.clear()
             self.driver.switch_to.parent_frame()
+            self.window_tracker.left_frame()
             log.info("Switched to parent frame successfully.")
         except Exception as e:
             log.error(f"Failed to switch to parent frame: {str(e)}")
@@ -940,9 +1193,12 @@ class BasePage:
             return []
 
     def get_current_window_handle(self):
-        """Gets the handle of the currently focused window/tab."""
+        """Gets the handle of the currently focused window/tab (tracked, so usually without a round trip)."""
+        if self.window_tracker.window is not None:
+            return self.window_tracker.window
         try:
             handle = self.driver.current_window_handle
+            self.window_tracker.window = handle
             log.info(f"Current window handle: {handle}")
             return handle
         except Exception as e:
@@ -952,10 +1208,16 @@ class BasePage:
     def switch_to_window_by_handle(self, handle):
         """Switches focus to the window/tab with the given handle."""
         log.info(f"Switching to window with handle: {handle}")
+        if self.window_tracker.window == handle and self.window_tracker.at_top:
+            log.info(f"Already on window {handle}. Skipping switch.")
+            return self
         try:
+            self.element_cache.clear()
             self.driver.switch_to.window(handle)
+            self.window_tracker.switched_window(handle)
             log.info(f"Switched to window {handle} successfully.")
         except Exception as e:
+            self.window_tracker.forget()
             log.error(f"Failed to switch to window {handle}: {str(e)}")
             raise
         return self
@@ -978,6 +1240,9 @@ class BasePage:
         """
         Performs an action that opens a new window/tab and switches to it.
 
+        On Chromium sessions the new window is reported by DevTools target events;
+        other browsers poll the window handles.
+
         Args:
             action_func (callable): The function/method that triggers the new window.
             timeout (int, optional): Max time to wait for the new window.
@@ -985,23 +1250,32 @@ class BasePage:
         """
         timeout = timeout if timeout is not None else self.explicit_wait_timeout
         log.info("Performing action and waiting for new window...")
-        original_handles = set(self.get_window_handles())
+        watcher = self.window_tracker.get_watcher(self.driver)
+        if watcher:
+            mark = watcher.mark()
+        else:
+            original_handles = set(self.get_window_handles())
         try:
             action_func()  # Execute the action that opens the new window
 
-            # Wait for the new window handle
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: set(driver.window_handles) - original_handles
-            )
-
-            new_handles = set(self.get_window_handles()) - original_handles
-            if new_handles:
-                new_handle = list(new_handles)[0]
-                log.info(f"New window detected: {new_handle}. Switching...")
-                self.switch_to_window_by_handle(new_handle)
+            if watcher:
+                start = time.monotonic()
+                new_handle = watcher.wait_for_new_window(mark, timeout)
+                wait_stats.record("new window", time.monotonic() - start, timed_out=new_handle is None)
+                if new_handle is None:
+                    raise TimeoutException(f"No new window appeared within {timeout}s after action.")
             else:
-                # This part should ideally not be reached if WebDriverWait worked
-                raise TimeoutException(f"No new window appeared within {timeout}s after action.")
+                new_handles = self.wait_engine.until(
+                    lambda driver: set(driver.window_handles) - original_handles,
+                    timeout,
+                    key="new window"
+                )
+                new_handle = list(new_handles)[0]
+
+            log.info(f"New window detected: {new_handle}. Switching...")
+            # The driver may learn about a window a moment after the browser reports it
+            self.wait_engine.until(lambda driver: self._try_switch_to_window(new_handle), timeout,
+                                   key="switch to new window")
         except TimeoutException:
             log.error(f"TimeoutException: No new window appeared within {timeout}s after action.")
             self.take_screenshot("new_window_timeout")
@@ -1012,6 +1286,14 @@ class BasePage:
             raise
         return self
 
+    def _try_switch_to_window(self, handle):
+        """Switch to a window, returning False while the driver does not know it yet."""
+        try:
+            self.switch_to_window_by_handle(handle)
+            return True
+        except NoSuchWindowException:
+            return False
+
     def close_current_window_and_switch_back(self, original_handle=None):
         """
         Closes the current window/tab and switches back to the original one,
@@ -1021,6 +1303,7 @@ class BasePage:
         current_handle = self.get_current_window_handle()
         try:
             self.driver.close()
+            self.window_tracker.forget()
             log.info(f"Closed window: {current_handle}")
             remaining_handles = self.get_window_handles()
 
@@ -1042,8 +1325,11 @@ class BasePage:
         """Opens a new tab and switches to it."""
         log.info("Opening a new tab...")
         try:
+            self.element_cache.clear()
             self.driver.switch_to.new_window('tab')
+            self.window_tracker.forget()
             new_handle = self.get_current_window_handle()
+            self.window_tracker.switched_window(new_handle)
             log.info(f"Switched to new tab with handle: {new_handle}")
         except Exception as e:
             log.error(f"Failed to open and switch to new tab: {str(e)}")
@@ -1054,8 +1340,11 @@ class BasePage:
         """Opens a new window and switches to it."""
         log.info("Opening a new window...")
         try:
+            self.element_cache.clear()
             self.driver.switch_to.new_window('window')
+            self.window_tracker.forget()
             new_handle = self.get_current_window_handle()
+            self.window_tracker.switched_window(new_handle)
             log.info(f"Switched to new window with handle: {new_handle}")
         except Exception as e:
             log.error(f"Failed to open and switch to new window: {str(e)}")
@@ -1106,8 +1395,12 @@ class BasePage:
         """Refreshes the current page."""
         log.info("Refreshing the current page")
         try:
+            self.element_cache.clear()
             self.driver.refresh()
-            self.wait_for_page_load_complete()  # Wait after refresh
+            self.window_tracker.navigated()
+            self.wait_for_page_ready()  # Wait after refresh
+            self._capture_page_metrics()
+            har_recorder.flush()
             log.info("Page refreshed successfully.")
         except Exception as e:
             log.error(f"Failed to refresh page: {str(e)}")
@@ -1119,8 +1412,10 @@ class BasePage:
         """Navigates back in the browser history."""
         log.info("Navigating back in browser history")
         try:
+            self.element_cache.clear()
             self.driver.back()
-            self.wait_for_page_load_complete()  # Wait after navigation
+            self.window_tracker.navigated()
+            self.wait_for_page_ready()  # Wait after navigation
             log.info("Navigated back successfully.")
         except Exception as e:
             log.error(f"Failed to navigate back: {str(e)}")
@@ -1132,8 +1427,10 @@ class BasePage:
         """Navigates forward in the browser history."""
         log.info("Navigating forward in browser history")
         try:
+            self.element_cache.clear()
             self.driver.forward()
-            self.wait_for_page_load_complete()  # Wait after navigation
+            self.window_tracker.navigated()
+            self.wait_for_page_ready()  # Wait after navigation
             log.info("Navigated forward successfully.")
         except Exception as e:
             log.error(f"Failed to navigate forward: {str(e)}")
@@ -1216,12 +1513,12 @@ class BasePage:
         Args:
             cookie_dict (dict): A dictionary specifying the cookie properties (e.g., {"name": "foo", "value": "bar"}).
         """
-        log.info(f"Adding cookie: {cookie_dict.get("name")}")
+        log.info(f"Adding cookie: {cookie_dict.get('name')}")
         try:
             self.driver.add_cookie(cookie_dict)
-            log.info(f"Added cookie ", {cookie_dict.get("name")}, f" successfully.")
+            log.info(f"Added cookie ", {cookie_dict.get('name')}, f" successfully.")
         except Exception as e:
-            log.error(f"Failed to add cookie ", {cookie_dict.get("name")}, f": {str(e)}")
+            log.error(f"Failed to add cookie ", {cookie_dict.get('name')}, f": {str(e)}")
             raise
         return self
 
@@ -1284,27 +1581,18 @@ class BasePage:
         """
         Takes a screenshot and saves it to the configured directory with a timestamp.
 
+        Called while handling a failure, the screenshot is taken once for that
+        failure: nested BasePage methods and the report hook it propagates
+        through reuse it. The file is written in the background (see
+        ScreenshotService).
+
         Args:
             name_prefix (str): Prefix for the screenshot filename.
 
         Returns:
-            str: The full path to the saved screenshot file, or None if failed.
+            str: The full path of the screenshot file, or None if failed.
         """
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        file_name = f"{name_prefix}_{timestamp}.png"
-        file_path = os.path.join(self.screenshots_dir, file_name)
-        log.info(f"Taking screenshot: {file_path}")
-        try:
-            if self.driver.save_screenshot(file_path):
-                log.info(f"Screenshot saved successfully: {file_path}")
-                return file_path
-            else:
-                log.error(f"Failed to save screenshot to {file_path} (driver returned false)")
-                return None
-        except Exception as e:
-            log.error(f"Failed to take screenshot: {str(e)}")
-            return None
-
+        return screenshot_service.capture(self.driver, name_prefix, self.screenshots_dir, sys.exc_info()[1])
 
     def get_element_size(self, locator, timeout=None):
         """Gets the size (width, height) of an element."""
@@ -1332,54 +1620,100 @@ class BasePage:
             return None
 
 
-    def find_and_click_element_by_text(self, locator, text_to_match, exact_match=True, timeout=None):
+    def get_texts(self, locator, timeout=None):
         """
-        Finds elements matching the locator and clicks the one whose text matches.
-        Improved version of find_all_elements_click_based_on_text.
+        Gets the text of every element matching a locator in one call.
+
+        Args:
+            locator (tuple): Locator tuple (By, value)
+            timeout (int, optional): Specific timeout for this wait.
+
+        Returns:
+            list[str]: Trimmed rendered text of each element, in document order.
         """
-        log.info(f"Finding elements with locator {locator} and clicking based on text: {text_to_match}")
+        log.info(f"Getting texts of elements: {locator}")
+        timeout = timeout if timeout is not None else self.explicit_wait_timeout
         try:
-            log.info(f"Finding all elements with locator: {locator}")
-            elements = self.find_elements(locator, timeout)
-            log.info(f"Found {len(elements)} potential elements.")
+            texts = self.wait_engine.until_observed(
+                lambda driver: driver.execute_script(GET_TEXTS_JS, None, *locator), locator, "present", timeout,
+                f"No elements found with locator {locator}")
+            log.info(f"Got {len(texts)} texts for {locator}")
+            return texts
+        except TimeoutException:
+            log.error(f"Timeout: No elements found with locator {locator} within {timeout}s.")
+            self.take_screenshot("get_texts_timeout")
+            raise
 
-            clicked = False
-            for element in elements:
-                try:
-                    element_text = element.text.strip()
-                    if not element_text:
-                        element_text = element.get_attribute("innerText").strip()
-                    if not element_text:
-                        element_text = element.get_attribute("value").strip()
-
-                    log.debug(f"Checking element text: {element_text}")
-                    match = (exact_match and element_text == text_to_match) or \
-                            (not exact_match and text_to_match in element_text)
-
-                    if match:
-                        log.info(f"Match found. Clicking element with text: {element_text}")
-                        self._highlight(element)
-                        element.click()
-                        clicked = True
-                        break
-                except StaleElementReferenceException:
-                    log.warning("Element became stale while checking text, continuing search...")
-                    continue
-                except Exception as check_err:
-                    log.warning(f"Error checking or clicking element: {check_err}")
-                    continue
-
-            if not clicked:
-                error_msg = f"No element found with locator {locator} and matching text '{text_to_match}'"
-                log.error(error_msg)
-                self.take_screenshot("click_by_text_failed")
-                raise NoSuchElementException(error_msg)
+    def find_element_by_text(self, locator, text_to_match, match="exact", timeout=None):
+        """
+        Finds the first element matching the locator whose text matches, filtered in the browser.
+
+        Candidates are located and compared in one script call per attempt instead
+        of several WebDriver commands per element. The text of an element is its
+        rendered text, or its value for inputs and buttons without text.
+
+        Args:
+            locator (tuple): Locator tuple (By, value)
+            text_to_match (str or re.Pattern): Expected text, or a pattern for the "regex" mode.
+                A compiled pattern selects the "regex" mode (JavaScript syntax; IGNORECASE is honoured).
+            match (str, optional): exact, contains, normalized (whitespace collapsed,
+                case-insensitive) or regex. Defaults to exact.
+            timeout (int, optional): Specific timeout for this wait.
+
+        Returns:
+            WebElement: The first matching element.
+
+        Raises:
+            NoSuchElementException: If no element matches within the timeout.
+        """
+        flags = ""
+        if isinstance(text_to_match, re.Pattern):
+            flags = "i" if text_to_match.flags & re.IGNORECASE else ""
+            text_to_match, match = text_to_match.pattern, "regex"
+        if match not in TEXT_MATCH_MODES:
+            raise ValueError(f"Unknown text match mode '{match}'. Use one of: {', '.join(TEXT_MATCH_MODES)}")
+        timeout = timeout if timeout is not None else self.explicit_wait_timeout
+        log.info(f"Finding element with locator {locator} and text ({match}): {text_to_match}")
+        result = {}
+
+        def text_matches(driver):
+            result.update(driver.execute_script(FIND_BY_TEXT_JS, None, *locator, text_to_match, match, flags))
+            return result["element"]
 
+        try:
+            element = self.wait_engine.until_observed(text_matches, locator, "present", timeout,
+                                                      key=f"{locator} text")
         except TimeoutException:
-            error_msg = f"Timeout: No elements found with locator {locator} within timeout."
+            error_msg = (f"No element found with locator {locator} and matching text '{text_to_match}' "
+                         f"({match}) within {timeout}s. Candidates: {result.get('candidates', 0)}")
             log.error(error_msg)
-            self.take_screenshot("click_by_text_timeout")
+            self.take_screenshot("find_by_text_timeout")
             raise NoSuchElementException(error_msg)
+        log.info(f"Match found among {result['candidates']} candidates: {result['text']}")
+        return element
+
+    @retry_on_transient()
+    def find_and_click_element_by_text(self, locator, text_to_match, exact_match=True, timeout=None, match=None):
+        """
+        Finds elements matching the locator and clicks the one whose text matches.
+        Improved version of find_all_elements_click_based_on_text.
+
+        Args:
+            locator (tuple): Locator tuple (By, value)
+            text_to_match (str or re.Pattern): Expected text or pattern (see find_element_by_text).
+            exact_match (bool, optional): Exact match, or substring match when False. Defaults to True.
+            timeout (int, optional): Specific timeout for this wait.
+            match (str, optional): Match mode overriding exact_match (exact, contains, normalized, regex).
+        """
+        match = match or ("exact" if exact_match else "contains")
+        log.info(f"Finding elements with locator {locator} and clicking based on text: {text_to_match}")
+        try:
+            element = self.find_element_by_text(locator, text_to_match, match, timeout)
+            self._highlight(element)
+            element.click()
+            log.info(f"Clicked element with text: {text_to_match}")
+        except NoSuchElementException:
+            raise
         except Exception as e:
             log.error(f"Error finding/clicking element by text '{text_to_match}': {str(e)}")
             self.take_screenshot("click_by_text_error")
@@ -1416,14 +1750,35 @@ class BasePage:
             assert False, f"Failed to get page title or mismatch with expected '{titleToVerify}'"
 
     #To support Static and Dynamic Web Tables effectively in your framework without hardcoding XPath or column/row indexes
+    def get_table(self, table_locator, header_locator, row_locator, cell_locator, timeout=None,
+                  skip_empty_rows=False):
+        """
+        Extracts headers and all cell text of a table in a single script call.
+
+        Args:
+            table_locator (tuple): Locator for the <table> element.
+            header_locator (tuple): Locator for header cells (th), relative to the table.
+            row_locator (tuple): Locator for all table rows (tr), relative to the table.
+            cell_locator (tuple): Locator for all cells within a row (td), relative to the row.
+            timeout (int, optional): Specific timeout for this wait.
+            skip_empty_rows (bool, optional): Leave out located rows without cells (e.g. a header
+                row inside tbody). Defaults to False, so row indexes match the located rows.
+
+        Returns:
+            TableData: Snapshot of the table; lookups on it do not touch the browser. Repeated or
+                blank headers are keyed with an occurrence suffix ("Price", "Price_2").
+        """
+        table = self._wait_for_condition(table_locator, EC.visibility_of_element_located, timeout)
+        raw = self.execute_script(EXTRACT_TABLE_JS, table, *header_locator, *row_locator, *cell_locator)
+        table_data = TableData.from_rows(raw["headers"], raw["rows"], skip_empty_rows)
+        log.info(f"Extracted table {table_locator}: {len(table_data.headers)} columns, "
+                 f"{table_data.row_count} rows, numeric columns: {list(table_data.numeric)}")
+        return table_data
+
     def get_table_headers(self, table_locator,header_locator):
         """Returns the header titles as a list from the table."""
-        headers = []
         element = self._wait_for_condition(table_locator, EC.visibility_of_element_located)
-        header_elements = element.find_elements(*header_locator)
-        for header in header_elements:
-            headers.append(header.text.strip())
-        return headers
+        return self.execute_script(GET_TEXTS_JS, element, *header_locator)
 
     def get_table_data(self, table_locator, header_locator, row_locator, cell_locator):
         """
@@ -1438,43 +1793,22 @@ class BasePage:
         Returns:
             list[dict]: List of row dictionaries with header: value mapping.
         """
-        table = self._wait_for_condition(table_locator, EC.visibility_of_element_located)
-
-        headers = [header.text.strip() for header in table.find_elements(*header_locator)]
-        rows = table.find_elements(*row_locator)
-        data = []
-
-        for row in rows:
-            cells = row.find_elements(*cell_locator)
-            row_data = {
-                headers[i]: cells[i].text.strip() if i < len(cells) else ""
-                for i in range(len(headers))
-            }
-            data.append(row_data)
-
-        return data
+        return self.get_table(table_locator, header_locator, row_locator, cell_locator).rows()
 
     def get_row_by_column_value(self, table_locator,header_locator, row_locator, cell_locator, column_name, value):
         """
-        Returns the first row where the given column matches the specified value.
+        Returns the rows where the given column matches the specified value.
         """
-        matching_rows = []
-        all_rows = self.get_table_data(table_locator,header_locator, row_locator, cell_locator)
-        for row in all_rows:
-            if row.get(column_name) == value:
-                matching_rows.append(row)
-
-        return matching_rows
+        table_data = self.get_table(table_locator, header_locator, row_locator, cell_locator)
+        return table_data.find_rows(column_name, value)
 
     def get_cell_text(self,table_locator,header_locator, row_locator, cell_locator, row_index, column_name):
         """
         Returns text of a cell based on row index and column header.
         Row index is 0-based.
         """
-        data = self.get_table_data(table_locator, header_locator, row_locator, cell_locator)
-        if 0 <= row_index < len(data):
-            return data[row_index].get(column_name)
-        return None
+        table_data = self.get_table(table_locator, header_locator, row_locator, cell_locator)
+        return table_data.cell(row_index, column_name)
 
     def get_column_values_sum(self, table_locator, header_locator, row_locator, cell_locator, column_name):
         """
@@ -1490,23 +1824,5 @@ class BasePage:
         Returns:
             float: Sum of the values in the column.
         """
-        table = self._wait_for_condition(table_locator, EC.visibility_of_element_located)
-        headers = [th.text.strip() for th in table.find_elements(*header_locator)]
-        rows = table.find_elements(*row_locator)
-
-        total = 0
-        for row in rows:
-            cells = row.find_elements(*cell_locator)
-            if len(cells) != len(headers):
-                continue  # Skip malformed rows
-            row_data = dict(zip(headers, [cell.text.strip() for cell in cells]))
-            value = row_data.get(column_name, "").replace("$", "").strip()
-            if value.isdigit():
-                total += int(value)
-            else:
-                try:
-                    total += float(value)
-                except ValueError:
-                    continue  # Skip non-numeric values
-
-        return total
\ No newline at end of file
+        table_data = self.get_table(table_locator, header_locator, row_locator, cell_locator)
+        return table_data.column_sum(column_name)
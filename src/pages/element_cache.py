@@ -0,0 +1,128 @@
+"""
+Element Cache Module.
+
+This module provides the per-page cache of located elements. A cached
+WebElement is returned after one cheap liveness check (still attached to the
+current document, still visible/enabled when required, same URL) instead of a
+fresh wait and lookup. The cache is cleared on navigation, URL change and
+frame or window switches.
+"""
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from src.pages.js_scripts import ELEMENT_LIVENESS_JS
+
+# Single-element conditions whose result can be cached, and the state revalidated on a hit
+CACHEABLE_CONDITIONS = {
+    EC.presence_of_element_located: "present",
+    EC.visibility_of_element_located: "visible",
+    EC.element_to_be_clickable: "clickable",
+}
+
+
+class CacheStats:
+    """Hit/miss counters of element caches."""
+
+    def __init__(self):
+        """Initialize cache stats."""
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self):
+        """Share of lookups served from the cache (0-1)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def format_summary(self):
+        """
+        Format the counters as a report line.
+
+        Returns:
+            str: Human readable counters
+        """
+        return (f"  - Hits: {self.hits} | Misses: {self.misses} | Hit rate: {self.hit_rate:.0%} | "
+                f"Invalidations: {self.invalidations}")
+
+
+# Process-wide counters over all page objects
+element_cache_stats = CacheStats()
+
+
+class ElementCache:
+    """Cache of located elements for one page object, keyed by locator."""
+
+    def __init__(self, driver, enabled=True):
+        """
+        Initialize element cache.
+
+        Args:
+            driver: WebDriver instance
+            enabled (bool, optional): Whether elements are cached. Defaults to True.
+        """
+        self.driver = driver
+        self.enabled = enabled
+        self.entries = {}
+        self.url = None
+        self.stats = CacheStats()
+
+    def get(self, locator, state):
+        """
+        Get a cached element if it still satisfies the state.
+
+        Args:
+            locator (tuple): Locator tuple (By, value)
+            state (str): present, visible or clickable
+
+        Returns:
+            WebElement or None: The cached element, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        element = self.entries.get(locator)
+        if element is None:
+            self._count("misses")
+            return None
+        try:
+            usable, url = self.driver.execute_script(ELEMENT_LIVENESS_JS, element, state)
+        except WebDriverException:
+            # Stale reference, or the element belongs to another frame/window
+            usable, url = False, self.url
+        if url != self.url:
+            self.clear()
+            self._count("misses")
+            return None
+        if not usable:
+            del self.entries[locator]
+            self._count("misses")
+            return None
+        self._count("hits")
+        return element
+
+    def put(self, locator, element):
+        """
+        Cache a located element.
+
+        Args:
+            locator (tuple): Locator tuple (By, value)
+            element (WebElement): Located element
+        """
+        if not self.enabled:
+            return
+        if self.url is None:
+            # Once per page/cache lifetime; later URL changes are detected by the liveness check
+            self.url = self.driver.current_url
+        self.entries[locator] = element
+
+    def clear(self):
+        """Invalidate all cached elements (navigation, URL change, frame or window switch)."""
+        if self.entries:
+            self.stats.invalidations += 1
+            element_cache_stats.invalidations += 1
+        self.entries = {}
+        self.url = None
+
+    def _count(self, counter):
+        """Increment a counter of this cache and of the process-wide stats."""
+        setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+        setattr(element_cache_stats, counter, getattr(element_cache_stats, counter) + 1)
@@ -0,0 +1,430 @@
+"""
+JavaScript Snippets Module.
+
+This module contains the browser-side scripts BasePage runs through
+execute_script to do in one WebDriver round trip what would otherwise take
+one command per element. Scripts that resolve Selenium locators in the browser
+are prefixed with LOCATE_ALL_JS, which understands every By strategy.
+"""
+
+# locateAll(root, by, value): resolve a Selenium (By, value) locator in the browser.
+# root is an element or null for the whole document; XPath is evaluated relative to root.
+LOCATE_ALL_JS = """
+function locateAll(root, by, value) {
+    root = root || document;
+    var doc = root.ownerDocument || root;
+    var toArray = function (list) { return Array.prototype.slice.call(list); };
+    var quote = function (text) { return '"' + String(text).replace(/\\\\/g, '\\\\\\\\').replace(/"/g, '\\\\"') + '"'; };
+    switch (by) {
+        case 'xpath':
+            var snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        case 'css selector':
+            return toArray(root.querySelectorAll(value));
+        case 'id':
+            return toArray(root.querySelectorAll('[id=' + quote(value) + ']'));
+        case 'name':
+            return toArray(root.querySelectorAll('[name=' + quote(value) + ']'));
+        case 'class name':
+            return toArray(root.getElementsByClassName(value));
+        case 'tag name':
+            return toArray(root.getElementsByTagName(value));
+        case 'link text':
+        case 'partial link text':
+            return toArray(root.querySelectorAll('a')).filter(function (link) {
+                var text = (link.innerText || link.textContent || '').trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function elementText(element) {
+    var text = element.innerText;
+    if (text === undefined || text === null) { text = element.textContent || ''; }
+    return text.trim();
+}
+"""
+
+# Returns the trimmed text of every element matching a locator.
+# arguments: root element (or null), by, value
+GET_TEXTS_JS = LOCATE_ALL_JS + """
+return locateAll(arguments[0], arguments[1], arguments[2]).map(elementText);
+"""
+
+# Finds the first element matching a locator whose text matches, in one call. The text
+# of an element is its rendered text, or its value for inputs and buttons without text.
+# Modes: exact, contains, normalized (whitespace collapsed, case-insensitive, NFKC) and
+# regex (JavaScript syntax, searched anywhere in the text).
+# Returns {element, text, candidates}; element is null when nothing matches.
+# arguments: root element (or null), by, value, text or pattern, mode, regex flags
+FIND_BY_TEXT_JS = LOCATE_ALL_JS + """
+var candidates = locateAll(arguments[0], arguments[1], arguments[2]);
+var expected = arguments[3], mode = arguments[4];
+var normalize = function (text) { return text.normalize('NFKC').replace(/\\s+/g, ' ').trim().toLowerCase(); };
+var pattern = mode === 'regex' ? new RegExp(expected, arguments[5] || '') : null;
+if (mode === 'normalized') { expected = normalize(expected); }
+for (var i = 0; i < candidates.length; i++) {
+    var text = elementText(candidates[i]) || (candidates[i].value || '').trim();
+    var matched = mode === 'exact' ? text === expected
+        : mode === 'contains' ? text.indexOf(expected) !== -1
+        : mode === 'normalized' ? normalize(text) === expected
+        : pattern.test(text);
+    if (matched) { return {element: candidates[i], text: text, candidates: candidates.length}; }
+}
+return {element: null, text: null, candidates: candidates.length};
+"""
+
+# Returns {headers: [...], rows: [[...], ...]} for a table in one call.
+# arguments: table element, header by/value, row by/value, cell by/value (cells relative to each row)
+EXTRACT_TABLE_JS = LOCATE_ALL_JS + """
+var table = arguments[0];
+var cellBy = arguments[5], cellValue = arguments[6];
+var headers = locateAll(table, arguments[1], arguments[2]).map(elementText);
+var rows = locateAll(table, arguments[3], arguments[4]).map(function (row) {
+    return locateAll(row, cellBy, cellValue).map(elementText);
+});
+return {headers: headers, rows: rows};
+"""
+
+# Resolves several locators at once. Returns the first match of each locator when
+# every one of them is present and rendered, otherwise null (the caller keeps polling).
+# arguments: list of [by, value] pairs
+RESOLVE_ELEMENTS_JS = LOCATE_ALL_JS + """
+var elements = [];
+var locators = arguments[0];
+for (var i = 0; i < locators.length; i++) {
+    var element = locateAll(null, locators[i][0], locators[i][1])[0];
+    if (!element || element.getClientRects().length === 0) { return null; }
+    elements.push(element);
+}
+return elements;
+"""
+
+# Sets form values in one call and fires the events a user interaction would.
+# Text inputs use the native value setter (so framework-bound inputs see the change),
+# selects pick the option by value, checkboxes/radios are clicked only when their
+# state has to change. Like the per-field methods, disabled and read-only fields,
+# disabled options, file inputs and elements that are not form fields are refused.
+# Returns a list of error messages (empty on success).
+# arguments: list of elements, list of values
+FILL_FORM_JS = """
+var elements = arguments[0], values = arguments[1], errors = [];
+var fire = function (element, type) { element.dispatchEvent(new Event(type, {bubbles: true})); };
+for (var i = 0; i < elements.length; i++) {
+    var element = elements[i], value = values[i];
+    var tag = element.tagName.toLowerCase(), type = (element.type || '').toLowerCase();
+    var field = 'Element ' + i + ' (' + tag + (type && tag === 'input' ? ' type=' + type : '') + ')';
+    if (tag !== 'input' && tag !== 'select' && tag !== 'textarea') {
+        errors.push(field + ' is not a form field; type into it with input_text'); continue;
+    }
+    if (element.disabled) { errors.push(field + ' is disabled'); continue; }
+    if (tag === 'select') {
+        var option = Array.prototype.find.call(element.options, function (o) { return o.value === String(value); });
+        if (!option) { errors.push('Cannot locate option with value: ' + value); continue; }
+        if (option.disabled) { errors.push('You may not select a disabled option (value: ' + value + ')'); continue; }
+        option.selected = true;
+        fire(element, 'input');
+        fire(element, 'change');
+    } else if (type === 'checkbox' || type === 'radio') {
+        if (element.checked !== Boolean(value)) { element.click(); }
+    } else if (type === 'file') {
+        errors.push(field + ' is a file input; use upload_file'); continue;
+    } else if (element.readOnly) {
+        errors.push(field + ' is read-only');
+    } else {
+        var proto = tag === 'textarea' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        element.focus();
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, String(value));
+        fire(element, 'input');
+        fire(element, 'change');
+        element.blur();
+    }
+}
+return errors;
+"""
+
+# Reads or changes a <select> in one call instead of one command per option.
+# "read" returns {options: [{text, value, selected, disabled}]}. "text", "value" and
+# "index" select the matching options like Selenium's Select (text is whitespace-
+# normalized; every match on a multi-select, the first one otherwise) and fire input and
+# change events for options that were not selected yet. Selections return
+# {selected: n, error, errorType} with errorType tag|missing|disabled on failure.
+# arguments: select element, action (read|text|value|index), target
+DROPDOWN_JS = """
+var select = arguments[0], action = arguments[1], target = arguments[2];
+if (select.tagName.toLowerCase() !== 'select') {
+    return {error: 'Select only works on <select> elements, not on <' + select.tagName.toLowerCase() + '>', errorType: 'tag'};
+}
+var options = Array.prototype.slice.call(select.options);
+if (action === 'read') {
+    return {options: options.map(function (o) {
+        return {text: o.text, value: o.value, selected: o.selected, disabled: o.disabled};
+    })};
+}
+var normalize = function (text) { return String(text).replace(/\\s+/g, ' ').trim(); };
+var matches = options.filter(function (o) {
+    return action === 'text' ? normalize(o.text) === normalize(target)
+        : action === 'value' ? o.value === String(target)
+        : o.index === Number(target);
+});
+if (!select.multiple) { matches = matches.slice(0, 1); }
+if (matches.length === 0) {
+    var what = {text: 'visible text', value: 'value', index: 'index'}[action];
+    return {error: 'Could not locate option with ' + what + ': ' + target, errorType: 'missing'};
+}
+var changed = false;
+for (var i = 0; i < matches.length; i++) {
+    if (matches[i].disabled) { return {error: 'You may not select a disabled option', errorType: 'disabled'}; }
+    if (!matches[i].selected) { matches[i].selected = true; changed = true; }
+}
+if (changed) {
+    select.dispatchEvent(new Event('input', {bubbles: true}));
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return {selected: matches.length, error: null};
+"""
+
+# Outlines an element and restores its original style after a delay, without blocking.
+# arguments: element, highlight style, duration in ms
+HIGHLIGHT_JS = """
+var element = arguments[0], original = element.getAttribute('style');
+element.setAttribute('style', arguments[1]);
+setTimeout(function () {
+    if (original === null) { element.removeAttribute('style'); } else { element.setAttribute('style', original); }
+}, arguments[2]);
+"""
+
+# Waits (async script) until a locator reaches a DOM state, for at most one slice.
+# A MutationObserver re-checks the state on every DOM change, and a 250 ms in-browser
+# timer catches changes that produce no mutation (CSS, input values). Calls back with
+# true when the state holds, false when the slice expired, or {error: message} when the
+# browser can't evaluate it (the caller falls back to polling).
+# arguments: by, value, state (present|visible|clickable|invisible|text|attribute),
+#            attribute name, expected text/value, slice in ms, callback
+OBSERVE_CONDITION_JS = LOCATE_ALL_JS + """
+var by = arguments[0], value = arguments[1], state = arguments[2];
+var attribute = arguments[3], expected = arguments[4], sliceMs = arguments[5];
+var done = arguments[arguments.length - 1];
+var finished = false, observer = null, ticker = null, timer = null;
+function isVisible(element) {
+    if (!element.isConnected || element.getClientRects().length === 0) { return false; }
+    var style = window.getComputedStyle(element);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function attributeValue(element) {
+    var property = element[attribute];
+    if (attribute in element && property !== null && typeof property !== 'object' && typeof property !== 'function') {
+        return String(property);
+    }
+    return element.getAttribute(attribute);
+}
+function holds() {
+    var element = locateAll(null, by, value)[0];
+    switch (state) {
+        case 'present': return !!element;
+        case 'visible': return !!element && isVisible(element);
+        case 'clickable': return !!element && isVisible(element) && !element.disabled;
+        case 'invisible': return !element || !isVisible(element);
+        case 'text': return !!element && elementText(element).indexOf(expected) !== -1;
+        case 'attribute': return !!element && attributeValue(element) === expected;
+    }
+    throw new Error('Unsupported wait state: ' + state);
+}
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearInterval(ticker);
+    clearTimeout(timer);
+    done(result);
+}
+function check() {
+    try {
+        if (holds()) { finish(true); }
+    } catch (e) {
+        finish({error: String(e && e.message || e)});
+    }
+}
+check();
+if (!finished) {
+    if (typeof MutationObserver === 'undefined') {
+        finish({error: 'MutationObserver is not supported'});
+    } else {
+        observer = new MutationObserver(check);
+        observer.observe(document.documentElement || document,
+            {childList: true, subtree: true, attributes: true, characterData: true});
+        ticker = setInterval(check, 250);
+        timer = setTimeout(function () { finish(false); }, sliceMs);
+    }
+}
+"""
+
+# Installs window.__automationReadiness once per document: counts in-flight fetch/XHR
+# requests, the time of the last network activity and the number of DOM mutations.
+# Registered with CDP Page.addScriptToEvaluateOnNewDocument where available, so it runs
+# before the page's own scripts; WAIT_FOR_READY_JS installs it late otherwise.
+READINESS_TRACKER_JS = """
+(function () {
+    if (window.__automationReadiness) { return; }
+    var state = window.__automationReadiness = {requests: {}, nextId: 0, lastNetwork: Date.now(), mutations: 0};
+    var begin = function () {
+        var id = state.nextId++;
+        state.requests[id] = state.lastNetwork = Date.now();
+        return id;
+    };
+    var end = function (id) {
+        delete state.requests[id];
+        state.lastNetwork = Date.now();
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            var id = begin();
+            try {
+                return originalFetch.apply(this, arguments).then(
+                    function (response) { end(id); return response; },
+                    function (error) { end(id); throw error; });
+            } catch (e) {
+                end(id);
+                throw e;
+            }
+        };
+    }
+    if (window.XMLHttpRequest) {
+        var originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            var id = begin();
+            this.addEventListener('loadend', function () { end(id); });
+            try {
+                return originalSend.apply(this, arguments);
+            } catch (e) {
+                end(id);
+                throw e;
+            }
+        };
+    }
+    if (window.MutationObserver) {
+        new MutationObserver(function (records) { state.mutations += records.length; })
+            .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+})();
+"""
+
+# Waits (async script) until the page is ready, for at most one slice:
+#  - network idle: document loaded, no fetch/XHR in flight and none finished for quietMs
+#    (requests running longer than 10s, e.g. long polling, are ignored); skipped when quietMs is null
+#  - render stable: DOM mutations, document size, scroll position and finite animations
+#    unchanged for the given number of consecutive animation frames; skipped when frames is 0
+# Calls back with {ready: bool, inflight: number, readyState: string}.
+# arguments: quietMs (or null), frames, slice in ms, callback
+WAIT_FOR_READY_JS = READINESS_TRACKER_JS + """
+var quietMs = arguments[0], frames = arguments[1], sliceMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var state = window.__automationReadiness, start = Date.now(), stableFrames = 0, lastSignature = null;
+function inflight(now) {
+    var count = 0;
+    for (var id in state.requests) {
+        if (now - state.requests[id] < 10000) { count++; }
+    }
+    return count;
+}
+function networkIdle(now) {
+    if (quietMs === null) { return true; }
+    return document.readyState === 'complete' && inflight(now) === 0 && now - state.lastNetwork >= quietMs;
+}
+function runningAnimations() {
+    if (!document.getAnimations) { return 0; }
+    return document.getAnimations().filter(function (animation) {
+        return animation.playState === 'running' && animation.effect &&
+            animation.effect.getComputedTiming().iterations !== Infinity;
+    }).length;
+}
+function signature() {
+    var root = document.documentElement;
+    return [state.mutations, root ? root.scrollHeight : 0, root ? root.scrollWidth : 0,
+        window.scrollX, window.scrollY, runningAnimations()].join(',');
+}
+function nextFrame(callback) {
+    if (document.hidden) { setTimeout(callback, 16); } else { requestAnimationFrame(callback); }
+}
+function tick() {
+    var now = Date.now();
+    if (frames > 0) {
+        var current = signature();
+        stableFrames = current === lastSignature ? stableFrames + 1 : 0;
+        lastSignature = current;
+    }
+    if (networkIdle(now) && stableFrames >= frames) {
+        done({ready: true, inflight: 0, readyState: document.readyState});
+    } else if (now - start >= sliceMs) {
+        done({ready: false, inflight: inflight(now), readyState: document.readyState});
+    } else {
+        nextFrame(tick);
+    }
+}
+tick();
+"""
+
+# Collects performance metrics of the current document (async script, one call):
+# Navigation Timing (ttfb, dom_content_loaded, load in ms from navigation start),
+# Resource Timing (resource count, total transfer bytes) and paint metrics
+# (fcp, lcp in ms, cls score; left out when the browser doesn't report them).
+# LCP and CLS are only exposed to buffered PerformanceObservers.
+# arguments: callback
+PAGE_METRICS_JS = """
+var done = arguments[arguments.length - 1];
+var result = {url: location.href};
+var navigation = performance.getEntriesByType('navigation')[0];
+if (navigation) {
+    result.ttfb = navigation.responseStart;
+    result.dom_content_loaded = navigation.domContentLoadedEventEnd;
+    result.load = navigation.loadEventEnd;
+}
+var resources = performance.getEntriesByType('resource');
+result.resources = resources.length;
+result.transfer_bytes = resources.reduce(function (total, entry) {
+    return total + (entry.transferSize || 0);
+}, navigation ? navigation.transferSize || 0 : 0);
+var paint = performance.getEntriesByName('first-contentful-paint')[0];
+if (paint) { result.fcp = paint.startTime; }
+var observers = [];
+function observe(type, handle) {
+    try {
+        var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handle); });
+        observer.observe({type: type, buffered: true});
+        observers.push({observer: observer, handle: handle});
+        return true;
+    } catch (e) {
+        return false;  // entry type not supported
+    }
+}
+observe('largest-contentful-paint', function (entry) { result.lcp = entry.startTime; });
+var layoutShiftSupported = observe('layout-shift', function (entry) {
+    if (!entry.hadRecentInput) { result.cls = (result.cls || 0) + entry.value; }
+});
+setTimeout(function () {
+    observers.forEach(function (item) {
+        item.observer.takeRecords().forEach(item.handle);
+        item.observer.disconnect();
+    });
+    if (layoutShiftSupported && result.cls === undefined) { result.cls = 0; }
+    done(result);
+}, 0);
+"""
+
+# Revalidates a cached element in one call: still attached to the current document
+# (not replaced by a re-render, navigation or a frame switch) and, for the visible and
+# clickable states, still rendered and enabled. Returns [usable, location.href].
+# arguments: element, state (present|visible|clickable)
+ELEMENT_LIVENESS_JS = """
+var element = arguments[0], state = arguments[1];
+var usable = element.isConnected && element.ownerDocument === document;
+if (usable && state !== 'present') {
+    var style = window.getComputedStyle(element);
+    usable = element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+    if (state === 'clickable') { usable = usable && !element.disabled; }
+}
+return [usable, location.href];
+"""
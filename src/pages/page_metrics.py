@@ -0,0 +1,184 @@
+"""
+Page Metrics Module.
+
+This module collects page performance metrics captured by BasePage after
+every navigation (Navigation Timing, Resource Timing, FCP/LCP/CLS), checks
+them against performance budgets and aggregates them per URL for the run
+summary.
+"""
+import math
+import os
+from fnmatch import fnmatchcase
+from urllib.parse import urlsplit
+from src.utils.file_reader import get_file_with_json_extension, read_file
+from src.utils import logger
+log = logger.customLogger()
+
+# Metrics reported and budgeted, in report order (times in ms, cls is a score)
+METRIC_NAMES = ("ttfb", "fcp", "lcp", "dom_content_loaded", "load", "cls", "transfer_bytes", "resources")
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values (list[float]): Values (need not be sorted)
+        pct (float): Percentile, 0-100
+
+    Returns:
+        float: The percentile value, or None for no values
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
+
+
+def page_key(url):
+    """URL without query string and fragment, used to group visits of the same page."""
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}{parts.path}" if parts.netloc else url
+
+
+class PageMetricsCollector:
+    """Collects the page metrics of the running test."""
+
+    def __init__(self):
+        """Initialize page metrics collector."""
+        self.node_id = None
+        self.records = []
+
+    def start_test(self, node_id):
+        """Start collecting metrics for a test."""
+        self.node_id = node_id
+        self.records = []
+
+    def record(self, metrics):
+        """
+        Record the metrics of one page visit.
+
+        Args:
+            metrics (dict): Metrics returned by PAGE_METRICS_JS
+        """
+        metrics = {name: round(value, 3) if isinstance(value, float) else value for name, value in metrics.items()}
+        self.records.append(metrics)
+        log.info(f"Page metrics for {metrics.get('url')}: {self.format_record(metrics)}")
+
+    def stop_test(self):
+        """
+        Stop collecting and return the metrics of the test.
+
+        Returns:
+            list[dict]: One metrics dict per page visit
+        """
+        records = self.records
+        self.node_id = None
+        self.records = []
+        return records
+
+    @staticmethod
+    def format_record(metrics):
+        """Format one page visit as a single line."""
+        return " | ".join(f"{name}: {metrics[name]}" for name in METRIC_NAMES if metrics.get(name) is not None)
+
+    def format_records(self, records):
+        """
+        Format the page visits of a test as report text.
+
+        Args:
+            records (list[dict]): Metrics per page visit
+
+        Returns:
+            str: Human readable metrics
+        """
+        return "\n".join(f"{metrics.get('url')}\n  {self.format_record(metrics)}" for metrics in records)
+
+
+def load_budgets(folder_name="", file_name="performance_budgets.json"):
+    """
+    Load per-page performance budgets from test data.
+
+    The file maps URL patterns to metric limits, e.g.
+    {"*automationexercise.com/login*": {"load": 5000, "lcp": 2500}}.
+
+    Args:
+        folder_name (str, optional): Folder under testData/. Defaults to testData/ itself.
+        file_name (str, optional): Budget file. Defaults to performance_budgets.json.
+
+    Returns:
+        dict: URL pattern -> {metric: limit}; empty if the file does not exist
+    """
+    if not os.path.exists(get_file_with_json_extension(folder_name, file_name)):
+        return {}
+    return read_file(folder_name, file_name)
+
+
+def check_budgets(records, url_budgets=None, test_budget=None):
+    """
+    Check page visits against performance budgets.
+
+    Args:
+        records (list[dict]): Metrics per page visit
+        url_budgets (dict, optional): URL pattern -> {metric: limit} (from test data)
+        test_budget (dict, optional): {metric: limit} applying to every page of the test (from a marker)
+
+    Returns:
+        list[str]: One message per exceeded budget
+    """
+    violations = []
+    for metrics in records:
+        url = metrics.get("url", "")
+        budgets = [budget for pattern, budget in (url_budgets or {}).items() if fnmatchcase(url, pattern)]
+        if test_budget:
+            budgets.append(test_budget)
+        for budget in budgets:
+            for name, limit in budget.items():
+                value = metrics.get(name)
+                if value is not None and value > limit:
+                    violations.append(f"{name} {value} > {limit} on {url}")
+    return violations
+
+
+def aggregate(records):
+    """
+    Aggregate page visits per page.
+
+    Args:
+        records (list[dict]): Metrics per page visit (from any number of tests)
+
+    Returns:
+        dict: page -> {"visits": n, metric: (p50, p95)}
+    """
+    pages = {}
+    for metrics in records:
+        page = pages.setdefault(page_key(metrics.get("url")), {"visits": 0, "values": {}})
+        page["visits"] += 1
+        for name in METRIC_NAMES:
+            if metrics.get(name) is not None:
+                page["values"].setdefault(name, []).append(metrics[name])
+    return {
+        url: dict({"visits": page["visits"]},
+                  **{name: (percentile(values, 50), percentile(values, 95)) for name, values in page["values"].items()})
+        for url, page in pages.items()
+    }
+
+
+def format_aggregate(aggregated):
+    """
+    Format aggregated metrics as report lines.
+
+    Returns:
+        str: Human readable p50/p95 per page, or an empty string
+    """
+    lines = []
+    for url, page in sorted(aggregated.items()):
+        lines.append(f"  - {url} ({page['visits']} visits)")
+        lines.append("    " + " | ".join(f"{name} p50/p95: {page[name][0]}/{page[name][1]}"
+                                         for name in METRIC_NAMES if name in page))
+    return "\n".join(lines)
+
+
+# Process-wide collector; each xdist worker collects its own tests
+page_metrics = PageMetricsCollector()
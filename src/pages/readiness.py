@@ -0,0 +1,95 @@
+"""
+Readiness Engine Module.
+
+This module decides when a page is ready for the next interaction without
+fixed sleeps. A small tracker in the page counts in-flight fetch/XHR requests
+and DOM mutations; one async script per slice then waits in the browser until
+the network has been quiet for a given time and/or rendering has been stable
+for a few animation frames.
+"""
+import time
+import weakref
+from selenium.common.exceptions import TimeoutException, JavascriptException, WebDriverException
+from src.pages.js_scripts import READINESS_TRACKER_JS, WAIT_FOR_READY_JS
+from src.pages.wait_engine import wait_stats
+from src.utils import logger
+log = logger.customLogger()
+
+# Longest single readiness script in seconds (well below the session script timeout)
+READY_SLICE = 2.0
+
+# Drivers the tracker is already registered with (registration lives as long as the session)
+_registered_drivers = weakref.WeakSet()
+
+
+class ReadinessEngine:
+    """Waits for network idle and render stability inside the browser."""
+
+    def __init__(self, driver, timeout, ready_slice=READY_SLICE):
+        """
+        Initialize readiness engine.
+
+        Args:
+            driver: WebDriver instance
+            timeout (float): Default timeout in seconds
+            ready_slice (float, optional): Longest single readiness script in seconds.
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.ready_slice = ready_slice
+        self.register_tracker()
+
+    def register_tracker(self):
+        """
+        Register the request tracker to run before page scripts on every new document.
+
+        Uses CDP on Chromium-based local sessions. Elsewhere the tracker is installed
+        by the first wait on each document, so requests already in flight at that
+        point are not seen.
+        """
+        if self.driver in _registered_drivers:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": READINESS_TRACKER_JS})
+            log.info("Registered page readiness tracker via CDP")
+        except (AttributeError, WebDriverException):
+            log.info("CDP not available; page readiness tracker is installed on first wait")
+        _registered_drivers.add(self.driver)
+
+    def wait(self, quiet_ms=None, frames=0, timeout=None, key="page ready"):
+        """
+        Wait until the network is idle and/or rendering is stable.
+
+        Args:
+            quiet_ms (int, optional): Required network quiet time in ms. None skips the network check.
+            frames (int, optional): Required consecutive stable animation frames. 0 skips the render check.
+            timeout (float, optional): Timeout in seconds. Defaults to the engine timeout.
+            key (str, optional): Key the wait time is recorded under.
+
+        Returns:
+            dict: Final readiness state ({ready, inflight, readyState})
+
+        Raises:
+            TimeoutException: If the page is not ready within the timeout.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        state = {}
+        while True:
+            slice_ms = int(min(deadline - time.monotonic(), self.ready_slice) * 1000)
+            if slice_ms <= 0:
+                wait_stats.record(key, time.monotonic() - start, timed_out=True)
+                raise TimeoutException(
+                    f"Page not ready within {timeout}s "
+                    f"(in-flight requests: {state.get('inflight')}, readyState: {state.get('readyState')})")
+            try:
+                state = self.driver.execute_async_script(WAIT_FOR_READY_JS, quiet_ms, frames, slice_ms) or {}
+            except JavascriptException as e:
+                # The document was replaced mid-wait (navigation); wait on the new one
+                log.debug(f"Readiness wait interrupted: {e.msg}")
+                time.sleep(0.05)
+                continue
+            if state.get("ready"):
+                wait_stats.record(key, time.monotonic() - start)
+                return state
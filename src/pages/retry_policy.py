@@ -0,0 +1,190 @@
+"""
+Retry Policy Module.
+
+This module provides the fail-fast retry policy for BasePage interactions.
+Exceptions are classified before retrying: transient ones (stale element,
+intercepted click) are retried with short jittered backoff, while everything
+else (timeouts, invalid session, invalid selector, dead browser) fails
+immediately. A per-test retry time budget caps how long retries may add to a
+single test.
+"""
+import os
+import random
+import time
+from functools import wraps
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    MoveTargetOutOfBoundsException
+)
+from src.utils import logger
+log = logger.customLogger()
+
+# Exceptions that usually clear up on their own within a few hundred milliseconds
+# (DOM re-render, overlay animating away). Anything else is not retried: a
+# TimeoutException already waited for the full timeout, and invalid session /
+# invalid selector / dead browser errors can never succeed on retry.
+RETRYABLE_EXCEPTIONS = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    MoveTargetOutOfBoundsException,
+)
+
+
+class RetryBudget:
+    """Per-test budget of seconds that retries may add to a test."""
+
+    def __init__(self, seconds=None):
+        """
+        Initialize retry budget.
+
+        Args:
+            seconds (float, optional): Budget per test. Defaults to the
+                RETRY_BUDGET_SECONDS env var (5), re-read on every reset so the
+                environment file loaded at session start applies.
+        """
+        self.configured_seconds = seconds
+        self.seconds = seconds if seconds is not None else self._seconds_from_env()
+        self.spent = 0.0
+        self.retries = 0
+
+    @staticmethod
+    def _seconds_from_env():
+        """Read the per-test budget from the environment."""
+        try:
+            return float(os.getenv("RETRY_BUDGET_SECONDS", "5"))
+        except ValueError:
+            log.warning("Invalid RETRY_BUDGET_SECONDS env var. Using default: 5s")
+            return 5.0
+
+    @property
+    def remaining(self):
+        """Seconds left in the budget for the current test."""
+        return self.seconds - self.spent
+
+    def consume(self, seconds):
+        """Charge time spent on a retry to the budget."""
+        self.spent += seconds
+
+    def reset(self):
+        """Start a fresh budget (called before every test)."""
+        if self.configured_seconds is None:
+            self.seconds = self._seconds_from_env()
+        self.spent = 0.0
+        self.retries = 0
+
+
+# Process-wide budget, reset before each test by conftest
+retry_budget = RetryBudget()
+
+
+class RetryPolicy:
+    """Classifies exceptions and computes jittered backoff delays."""
+
+    def __init__(self, retries=2, base_delay=0.1, max_delay=1.0, retryable=RETRYABLE_EXCEPTIONS, budget=None):
+        """
+        Initialize retry policy.
+
+        Args:
+            retries (int, optional): Maximum number of retries. Defaults to 2.
+            base_delay (float, optional): Backoff base in seconds. Defaults to 0.1.
+            max_delay (float, optional): Backoff cap in seconds. Defaults to 1.0.
+            retryable (tuple, optional): Exception types that may be retried.
+            budget (RetryBudget, optional): Budget to charge. Defaults to the process-wide budget.
+        """
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable = retryable
+        self.budget = budget
+
+    def is_retryable(self, error):
+        """
+        Check whether an exception is worth retrying.
+
+        Args:
+            error (Exception): Exception raised by the interaction
+
+        Returns:
+            bool: True for transient exceptions, False otherwise
+        """
+        return isinstance(error, self.retryable)
+
+    def backoff(self, attempt):
+        """
+        Full-jitter exponential backoff delay for a retry attempt (1-based).
+
+        Returns:
+            float: Delay in seconds
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call a function, retrying transient failures within the retry budget.
+
+        Returns:
+            Any: Return value of the function
+
+        Raises:
+            Exception: The last exception, immediately for non-retryable errors.
+        """
+        budget = self.budget or retry_budget
+        attempt = 0
+        retry_start = None
+        try:
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if retry_start is not None:
+                        budget.consume(time.monotonic() - retry_start)
+                        retry_start = None
+                    attempt += 1
+                    if not self.is_retryable(e):
+                        raise
+                    if attempt > self.retries:
+                        log.error(f"{func.__name__} failed after {self.retries} retries: {type(e).__name__}")
+                        raise
+                    delay = self.backoff(attempt)
+                    if budget.remaining < delay:
+                        log.error(f"Retry budget exhausted ({budget.spent:.2f}s of {budget.seconds:.2f}s), "
+                                  f"not retrying {func.__name__}")
+                        raise
+                    log.warning(f"{type(e).__name__} in {func.__name__} "
+                                f"(attempt {attempt}/{self.retries}). Retrying in {delay:.2f}s...")
+                    retry_start = time.monotonic()
+                    budget.retries += 1
+                    time.sleep(delay)
+        finally:
+            # Charge the sleep and the retried attempt to the per-test budget
+            if retry_start is not None:
+                budget.consume(time.monotonic() - retry_start)
+
+
+def retry_on_transient(retries=2, base_delay=0.1, max_delay=1.0):
+    """
+    Decorator to retry a BasePage interaction on transient WebDriver exceptions.
+
+    Inside BasePage.batch_actions() the interaction is not retried: it records
+    its actions on the open batch, and a retry would record them again.
+
+    Args:
+        retries (int, optional): Maximum number of retries. Defaults to 2.
+        base_delay (float, optional): Backoff base in seconds. Defaults to 0.1.
+        max_delay (float, optional): Backoff cap in seconds. Defaults to 1.0.
+    """
+    policy = RetryPolicy(retries=retries, base_delay=base_delay, max_delay=max_delay)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if args and getattr(args[0], "_action_batch", None) is not None:
+                return func(*args, **kwargs)
+            return policy.call(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
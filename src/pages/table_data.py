@@ -0,0 +1,160 @@
+"""
+Table Data Module.
+
+This module provides TableData, a compact snapshot of an HTML table
+extracted in a single script call. Lookups and aggregates run on the
+in-memory snapshot without touching the browser again.
+"""
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+Number = Union[int, float]
+
+# Currency symbols and thousands separators stripped before parsing numbers
+_NUMBER_NOISE = re.compile(r"[\s$€£,]")
+
+
+def parse_number(value: str) -> Optional[Number]:
+    """
+    Parse a cell value as a number.
+
+    Args:
+        value (str): Cell text, e.g. "25", "$1,200.50"
+
+    Returns:
+        int or float or None: Parsed number (int for whole digits), or None if not numeric.
+            Text that only parses as NaN or infinity ("NaN", "Infinity") is not numeric.
+    """
+    cleaned = _NUMBER_NOISE.sub("", value or "")
+    if not cleaned:
+        return None
+    if cleaned.isdigit():
+        return int(cleaned)
+    try:
+        number = float(cleaned)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def unique_keys(headers: List[str]) -> List[str]:
+    """
+    Make header texts usable as unique column keys.
+
+    The first occurrence of a header keeps its text; repeats (including repeated
+    blank headers) get an occurrence suffix: ["Name", "", "Name", ""] becomes
+    ["Name", "", "Name_2", "_2"].
+
+    Args:
+        headers (list[str]): Header texts
+
+    Returns:
+        list[str]: One unique key per header, in column order
+    """
+    keys, used = [], set()
+    for header in headers:
+        key, occurrence = header, 1
+        while key in used:
+            occurrence += 1
+            key = f"{header}_{occurrence}"
+        used.add(key)
+        keys.append(key)
+    return keys
+
+
+@dataclass
+class TableData:
+    """Snapshot of an HTML table, with cells stored by position."""
+
+    headers: List[str]
+    keys: List[str]
+    cells: List[List[str]]
+    complete_rows: List[bool]
+    numeric: Dict[str, List[Optional[Number]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(cls, headers: List[str], rows: List[List[str]], skip_empty_rows: bool = False) -> "TableData":
+        """
+        Build a snapshot from raw header and row cell texts.
+
+        Every row located by the row locator is kept, so row indexes match the
+        located rows (a header row inside tbody is row 0 with empty cells),
+        unless skip_empty_rows is set. Short rows are padded with empty strings
+        and flagged as incomplete. A column is typed as numeric when every
+        non-empty value parses as a number.
+
+        Args:
+            headers (list[str]): Header texts
+            rows (list[list[str]]): Cell texts per row
+            skip_empty_rows (bool, optional): Leave out rows without any cells. Defaults to False.
+
+        Returns:
+            TableData: Table snapshot
+        """
+        if skip_empty_rows:
+            rows = [row for row in rows if row]
+        width = len(headers)
+        cells = [list(row[:width]) + [""] * (width - len(row)) for row in rows]
+        complete_rows = [len(row) == width for row in rows]
+        keys = unique_keys(headers)
+
+        numeric = {}
+        for i, key in enumerate(keys):
+            values = [row[i] for row in cells]
+            parsed = [parse_number(value) for value in values]
+            if any(number is not None for number in parsed) and all(
+                    number is not None or not value for number, value in zip(parsed, values)):
+                numeric[key] = parsed
+
+        return cls(headers=headers, keys=keys, cells=cells, complete_rows=complete_rows, numeric=numeric)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows."""
+        return len(self.cells)
+
+    def column_index(self, column_name: str) -> Optional[int]:
+        """Position of a column by key (header text, suffixed for repeats), or None."""
+        try:
+            return self.keys.index(column_name)
+        except ValueError:
+            return None
+
+    def column(self, column_name: str) -> List[str]:
+        """Get the values of a column (empty if there is no such column)."""
+        index = self.column_index(column_name)
+        return [] if index is None else [row[index] for row in self.cells]
+
+    def row(self, index: int) -> Dict[str, str]:
+        """Get a row as a {column key: value} dict (0-based index)."""
+        return dict(zip(self.keys, self.cells[index]))
+
+    def rows(self) -> List[Dict[str, str]]:
+        """Get all rows as {column key: value} dicts."""
+        return [self.row(i) for i in range(self.row_count)]
+
+    def find_rows(self, column_name: str, value: str) -> List[Dict[str, str]]:
+        """Get every row whose column equals value."""
+        return [self.row(i) for i, cell in enumerate(self.column(column_name)) if cell == value]
+
+    def cell(self, row_index: int, column_name: str) -> Optional[str]:
+        """Get a cell value by row index (0-based) and column key, or None if out of range."""
+        index = self.column_index(column_name)
+        if index is not None and 0 <= row_index < self.row_count:
+            return self.cells[row_index][index]
+        return None
+
+    def column_sum(self, column_name: str) -> Number:
+        """
+        Sum the numeric values of a column.
+
+        Incomplete rows and non-numeric cells are skipped.
+        """
+        total = 0
+        for value, complete in zip(self.column(column_name), self.complete_rows):
+            number = parse_number(value) if complete else None
+            if number is not None:
+                total += number
+        return total
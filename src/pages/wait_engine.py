@@ -0,0 +1,191 @@
+"""
+Wait Engine Module.
+
+This module provides the explicit-wait engine used by BasePage. Sessions run
+with an implicit wait of 0, so every wait goes through this engine and a
+timeout means exactly what it says. Polling starts fast and backs off, and the
+time spent waiting is recorded per locator.
+
+Waits on a locator's DOM state (present, visible, clickable, invisible, text,
+attribute) are push-based by default: one async script installs a
+MutationObserver and returns as soon as the state holds, instead of one
+WebDriver round trip per poll. The result is confirmed once with the Selenium
+condition, and the engine falls back to polling whenever the browser can't
+observe the state.
+"""
+import os
+import time
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    ElementNotVisibleException,
+    StaleElementReferenceException,
+    WebDriverException
+)
+from selenium.webdriver.support import expected_conditions as EC
+from src.pages.js_scripts import OBSERVE_CONDITION_JS
+from src.utils.timing_stats import TimingStats
+from src.utils import logger
+log = logger.customLogger()
+
+# Poll intervals in seconds: fast first polls, then back off to the last value
+POLL_INTERVALS = (0.05, 0.1, 0.2, 0.3, 0.5)
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, ElementNotVisibleException, StaleElementReferenceException)
+
+# Longest single observer script in seconds. Kept well below the session script
+# timeout (30s by default); the Selenium condition is re-checked after every slice.
+OBSERVE_SLICE = 2.0
+
+# DOM state the observer script waits for, per expected condition
+OBSERVED_STATES = {
+    EC.presence_of_element_located: "present",
+    EC.presence_of_all_elements_located: "present",
+    EC.visibility_of_element_located: "visible",
+    EC.element_to_be_clickable: "clickable",
+    EC.invisibility_of_element_located: "invisible",
+}
+
+# Process-wide wait time per locator/condition
+wait_stats = TimingStats("wait")
+
+
+class WaitEngine:
+    """Explicit wait with push-based DOM waits, adaptive polling and per-locator timing."""
+
+    def __init__(self, driver, timeout, poll_intervals=POLL_INTERVALS, ignored_exceptions=IGNORED_EXCEPTIONS,
+                 observe=None, observe_slice=OBSERVE_SLICE):
+        """
+        Initialize wait engine.
+
+        Args:
+            driver: WebDriver instance
+            timeout (float): Default timeout in seconds
+            poll_intervals (tuple, optional): Successive poll intervals; the last one repeats.
+            ignored_exceptions (tuple, optional): Exceptions treated as "condition not met yet".
+            observe (bool, optional): Use MutationObserver waits for DOM states.
+                Defaults to the WAIT_MODE env var ("observer", or "poll" to disable).
+            observe_slice (float, optional): Longest single observer script in seconds.
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_intervals = poll_intervals
+        self.ignored_exceptions = ignored_exceptions
+        if observe is None:
+            observe = os.getenv("WAIT_MODE", "observer").lower() != "poll"
+        self.observe = observe
+        self.observe_slice = observe_slice
+
+    def until(self, condition, timeout=None, message="", key=None):
+        """
+        Poll a condition until it returns a truthy value.
+
+        Args:
+            condition (callable): Called with the driver; a truthy return value ends the wait.
+            timeout (float, optional): Timeout in seconds. Defaults to the engine timeout.
+            message (str, optional): Message for the TimeoutException.
+            key (optional): Key the wait time is recorded under (usually the locator).
+
+        Returns:
+            Any: The truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the condition is not met within the timeout.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        key = key if key is not None else getattr(condition, "__name__", "custom condition")
+        start = time.monotonic()
+        return self._poll(condition, start, start + timeout, message, key)
+
+    def until_observed(self, condition, locator, state, timeout=None, message="", key=None,
+                       attribute=None, expected=None):
+        """
+        Wait until a locator reaches a DOM state, pushed by a MutationObserver.
+
+        Each observer script returns as soon as the state holds in the browser;
+        the Selenium condition then confirms it (and produces the return value)
+        in one more call. Falls back to polling the condition when observing is
+        disabled or the browser can't run the observer (navigation, frames
+        detached mid-wait, unsupported state).
+
+        Args:
+            condition (callable): Selenium condition matching the state, called with the driver.
+            locator (tuple): Locator tuple (By, value)
+            state (str): present, visible, clickable, invisible, text or attribute
+            timeout (float, optional): Timeout in seconds. Defaults to the engine timeout.
+            message (str, optional): Message for the TimeoutException.
+            key (optional): Key the wait time is recorded under. Defaults to the locator.
+            attribute (str, optional): Attribute name for the "attribute" state.
+            expected (str, optional): Expected text or attribute value.
+
+        Returns:
+            Any: The truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the state is not reached within the timeout.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        key = key if key is not None else locator
+        start = time.monotonic()
+        deadline = start + timeout
+        if not self.observe:
+            return self._poll(condition, start, deadline, message, key)
+
+        by, value = locator
+        attempt = 0
+        while True:
+            slice_ms = int(min(deadline - time.monotonic(), self.observe_slice) * 1000)
+            outcome = False
+            if slice_ms > 0:
+                try:
+                    outcome = self.driver.execute_async_script(
+                        OBSERVE_CONDITION_JS, by, value, state, attribute, expected, slice_ms)
+                except WebDriverException as e:
+                    log.debug(f"Observer wait for {locator} interrupted ({type(e).__name__}). Polling instead.")
+                    return self._poll(condition, start, deadline, message, key)
+                if isinstance(outcome, dict):
+                    log.debug(f"Observer wait for {locator} unavailable ({outcome.get('error')}). Polling instead.")
+                    return self._poll(condition, start, deadline, message, key)
+
+            # Confirm with the Selenium condition after a hit and at the end of every slice
+            try:
+                result = condition(self.driver)
+                if result:
+                    wait_stats.record(key, time.monotonic() - start)
+                    return result
+            except self.ignored_exceptions:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or slice_ms <= 0:
+                wait_stats.record(key, time.monotonic() - start, timed_out=True)
+                raise TimeoutException(message)
+            if outcome:
+                # Browser and Selenium disagree on the state; back off like a poll
+                time.sleep(min(self.poll_intervals[min(attempt, len(self.poll_intervals) - 1)], remaining))
+                attempt += 1
+
+    def _poll(self, condition, start, deadline, message, key):
+        """Poll a condition with backoff until the deadline (see until())."""
+        attempt = 0
+        last_exception = None
+
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    wait_stats.record(key, time.monotonic() - start)
+                    return value
+            except self.ignored_exceptions as e:
+                last_exception = e
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                wait_stats.record(key, time.monotonic() - start, timed_out=True)
+                screen = getattr(last_exception, "screen", None)
+                stacktrace = getattr(last_exception, "stacktrace", None)
+                raise TimeoutException(message, screen, stacktrace)
+
+            interval = self.poll_intervals[min(attempt, len(self.poll_intervals) - 1)]
+            time.sleep(min(interval, remaining))
+            attempt += 1
@@ -83,6 +83,25 @@ def validate_response_code(response, expected_response_code):
     )
     log.info(f'Expected response code {expected_response_code} matches the actual code {actual_status_code}')
 
+def validate_batch_response_codes(results, expected_response_codes):
+    """
+    Method to validate the response codes of a batch made with APIClient.make_requests
+    :param results: RequestResult list, in input order
+    :param expected_response_codes: One expected code per request, or a single code for all
+    :return:
+    """
+    if isinstance(expected_response_codes, int):
+        expected_response_codes = [expected_response_codes] * len(results)
+    failures = []
+    for result, expected in zip(results, expected_response_codes):
+        if not result.ok:
+            failures.append(f"request {result.index}: {type(result.exception).__name__}: {result.exception}")
+        elif result.response.status_code != expected:
+            failures.append(f"request {result.index}: expected {expected}, got {result.response.status_code}")
+    assert not failures, "Batch requests failed:\n" + "\n".join(failures)
+    log.info(f'All {len(results)} batch requests returned the expected response codes')
+
+
 def validate_entire_response_body_data(response, expected_response_data):
     """
     Method to validate response entire body
@@ -0,0 +1,206 @@
+"""
+Screenshot Service Module.
+
+This module captures failure screenshots for BasePage and the report hook.
+Only the WebDriver call happens on the test's thread; decoding, optional
+downscaling/re-encoding (with Pillow, if installed) and the disk write run on
+a background thread. Identical images are written once (by content hash), and
+a failure that already has a screenshot is not captured again while it
+propagates through nested BasePage methods and the report hook.
+"""
+import base64
+import datetime
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from src.utils import logger
+log = logger.customLogger()
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Supported output formats: Pillow format name and MIME type per file extension
+FORMATS = {"png": ("PNG", "image/png"), "jpeg": ("JPEG", "image/jpeg"), "webp": ("WEBP", "image/webp")}
+
+
+class ScreenshotService:
+    """Captures screenshots once per failure and writes them in the background."""
+
+    def __init__(self):
+        """Initialize screenshot service."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshots")
+        self._pending = set()
+        self._paths = {}
+        self._lock = threading.RLock()
+        self.captured = 0
+        self.duplicates = 0
+        self.reused = 0
+        self.capture_seconds = 0.0
+
+    @staticmethod
+    def _settings():
+        """
+        Read the output settings from the environment.
+
+        Returns:
+            tuple: (extension, max width or 0, quality); re-encoding falls back
+                to plain PNG when Pillow is not installed
+        """
+        extension = os.getenv("SCREENSHOT_FORMAT", "png").lower().replace("jpg", "jpeg")
+        if extension not in FORMATS:
+            log.warning(f"Invalid SCREENSHOT_FORMAT '{extension}'. Using png")
+            extension = "png"
+        try:
+            max_width = int(os.getenv("SCREENSHOT_MAX_WIDTH", "0"))
+            quality = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+        except ValueError:
+            log.warning("Invalid SCREENSHOT_MAX_WIDTH/SCREENSHOT_QUALITY env var. Using defaults: 0/80")
+            max_width, quality = 0, 80
+        if Image is None and (max_width or extension != "png"):
+            log.warning("Pillow is not installed; screenshots are saved as full-size PNG")
+            extension, max_width = "png", 0
+        return extension, max_width, quality
+
+    @staticmethod
+    def screenshot_of(exception):
+        """
+        Get the screenshot already taken for a failure.
+
+        Follows the exception chain, so a failure re-raised as another exception
+        (e.g. a TimeoutException with a better message) keeps its screenshot.
+
+        Args:
+            exception (BaseException): Failure being handled, or None
+
+        Returns:
+            str: Path of the screenshot, or None
+        """
+        seen = set()
+        while exception is not None and id(exception) not in seen:
+            seen.add(id(exception))
+            path = getattr(exception, "screenshot_path", None)
+            if path:
+                return path
+            exception = exception.__cause__ or exception.__context__
+        return None
+
+    def capture(self, driver, name_prefix="screenshot", directory="reports/screenshots", exception=None):
+        """
+        Capture a screenshot, unless the failure already has one.
+
+        Args:
+            driver: WebDriver instance
+            name_prefix (str, optional): Prefix for the file name.
+            directory (str, optional): Directory the file is written to.
+            exception (BaseException, optional): Failure the screenshot documents;
+                it is marked so the same failure is not captured again.
+
+        Returns:
+            str: Path of the screenshot (written in the background), or None if the capture failed
+        """
+        path = self.screenshot_of(exception)
+        if path:
+            self.reused += 1
+            log.info(f"Failure already has a screenshot: {path}")
+            return path
+
+        start = time.monotonic()
+        try:
+            data = base64.b64decode(driver.get_screenshot_as_base64())
+        except Exception as e:
+            log.error(f"Failed to take screenshot: {str(e)}")
+            return None
+        finally:
+            self.capture_seconds += time.monotonic() - start
+
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            path = self._paths.get(digest)
+            if path:
+                self.duplicates += 1
+                log.info(f"Screenshot identical to {path}; not written again")
+            else:
+                extension, max_width, quality = self._settings()
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+                path = os.path.join(directory, f"{name_prefix}_{timestamp}.{extension}")
+                self._paths[digest] = path
+                self.captured += 1
+                future = self._executor.submit(self._write, data, path, extension, max_width, quality)
+                self._pending.add(future)
+                future.add_done_callback(self._done)
+                log.info(f"Taking screenshot: {path}")
+        if exception is not None:
+            try:
+                exception.screenshot_path = path
+            except AttributeError:
+                pass
+        return path
+
+    def _done(self, future):
+        """Forget a finished background write."""
+        with self._lock:
+            self._pending.discard(future)
+
+    def flush(self, timeout=None):
+        """Wait until all screenshots taken so far are on disk."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending, timeout)
+
+    def read_base64(self, path):
+        """
+        Read a written screenshot as base64 (e.g. to embed it in the HTML report).
+
+        Args:
+            path (str): Path returned by capture()
+
+        Returns:
+            tuple: (base64 str, MIME type), or (None, None) if the file can't be read
+        """
+        self.flush()
+        try:
+            with open(path, "rb") as f:
+                content = base64.b64encode(f.read()).decode("ascii")
+        except OSError as e:
+            log.error(f"Failed to read screenshot {path}: {str(e)}")
+            return None, None
+        return content, FORMATS[os.path.splitext(path)[1].lstrip(".")][1]
+
+    def format_summary(self):
+        """
+        Format the capture counters as a report line.
+
+        Returns:
+            str: Human readable counters
+        """
+        return (f"  - Written: {self.captured} | Identical (skipped): {self.duplicates} | "
+                f"Same failure (reused): {self.reused} | Capture time: {self.capture_seconds:.2f}s")
+
+    @staticmethod
+    def _write(data, path, extension, max_width, quality):
+        """Background thread: downscale/re-encode if configured and write the file."""
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if extension != "png" or max_width:
+                image = Image.open(io.BytesIO(data))
+                if max_width and image.width > max_width:
+                    image = image.resize((max_width, round(image.height * max_width / image.width)))
+                if extension == "jpeg":
+                    image = image.convert("RGB")
+                buffer = io.BytesIO()
+                image.save(buffer, FORMATS[extension][0], quality=quality)
+                data = buffer.getvalue()
+            with open(path, "wb") as f:
+                f.write(data)
+            log.info(f"Screenshot saved successfully: {path}")
+        except Exception as e:
+            log.error(f"Failed to save screenshot to {path}: {str(e)}")
+
+
+# Process-wide service; each xdist worker writes its own screenshots
+screenshot_service = ScreenshotService()
@@ -0,0 +1,72 @@
+"""
+Timing Stats Module.
+
+This module provides a small collector for call counts and durations grouped
+by key (e.g. per locator or per operation). Collectors are process-wide, so
+each xdist worker aggregates its own statistics.
+"""
+from collections import defaultdict
+
+
+class TimingStats:
+    """Collects call counts, total and max duration per key."""
+
+    def __init__(self, name):
+        """
+        Initialize timing stats collector.
+
+        Args:
+            name (str): Collector name used in summaries
+        """
+        self.name = name
+        self.data = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+
+    def record(self, key, seconds, timed_out=False):
+        """
+        Record one timed call.
+
+        Args:
+            key: Grouping key (converted to str)
+            seconds (float): Duration of the call
+            timed_out (bool, optional): Whether the call ended in a timeout. Defaults to False.
+        """
+        entry = self.data[str(key)]
+        entry["count"] += 1
+        entry["total"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+        if timed_out:
+            entry["timeouts"] += 1
+
+    def summary(self, top=10):
+        """
+        Get the keys with the highest total duration.
+
+        Args:
+            top (int, optional): Number of entries to return. Defaults to 10.
+
+        Returns:
+            list[tuple]: (key, stats dict) pairs sorted by total duration, descending
+        """
+        return sorted(self.data.items(), key=lambda item: item[1]["total"], reverse=True)[:top]
+
+    def format_summary(self, top=10):
+        """
+        Format the summary as report lines.
+
+        Args:
+            top (int, optional): Number of entries to include. Defaults to 10.
+
+        Returns:
+            str: Human readable summary, or an empty string if nothing was recorded
+        """
+        lines = []
+        for key, entry in self.summary(top):
+            lines.append(
+                f"  - {key} > Count: {entry['count']} | Total: {entry['total']:.2f}s | "
+                f"Max: {entry['max']:.2f}s | Timeouts: {entry['timeouts']}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        """Clear all recorded statistics."""
+        self.data.clear()
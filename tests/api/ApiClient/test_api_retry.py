@@ -0,0 +1,212 @@
+"""
+API Retry Test Module.
+
+This module checks the retry and fail-fast layer of the API session: the
+retry budget and test deadline stopping BudgetedRetry, the circuit breaker
+states, and, against a local stub server, which responses count as breaker
+failures and when a breaker fails requests fast.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import aiohttp
+import pytest
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+
+from src.base import api_retry, api_session, async_api_client
+from src.base.api_retry import BudgetedRetry, CircuitBreaker, CircuitBreakers, CircuitOpenError, \
+    RetryRatioBudget
+from src.base.api_session import create_api_session
+from src.base.api_timeouts import TimeoutPolicy, current_deadline
+from src.base.async_api_client import AsyncAPIClient
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """Answers GET /status/<code> with that status and counts the requests per path."""
+
+    hits = {}
+
+    def do_GET(self):
+        StatusHandler.hits[self.path] = StatusHandler.hits.get(self.path, 0) + 1
+        self.send_response(int(self.path.split("/")[2]) if self.path.startswith("/status/") else 200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def breakers(monkeypatch):
+    """Fresh circuit breakers that open after 2 failures, for the session under test."""
+    monkeypatch.setenv("API_BREAKER_FAILURES", "2")
+    monkeypatch.setenv("API_BREAKER_COOLDOWN", "30")
+    monkeypatch.delenv("API_BREAKER_STATUSES", raising=False)
+    registry = CircuitBreakers()
+    monkeypatch.setattr(api_session, "circuit_breakers", registry)
+    monkeypatch.setattr(async_api_client, "circuit_breakers", registry)
+    return registry
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    """Fresh retry budget allowing 2 retries, whatever the number of requests."""
+    budget = RetryRatioBudget(ratio=0, minimum=2)
+    monkeypatch.setattr(api_retry, "api_retry_budget", budget)
+    monkeypatch.setattr(api_session, "api_retry_budget", budget)
+    monkeypatch.setattr(async_api_client, "api_retry_budget", budget)
+    return budget
+
+
+@pytest.mark.Positive
+def test_retry_budget_ratio():
+    budget = RetryRatioBudget(ratio=0.5, minimum=1)
+    for _ in range(4):
+        budget.record_request()
+
+    assert [budget.allow_retry() for _ in range(4)] == [True, True, True, False]
+    assert budget.snapshot() == {"requests": 4, "retries": 3, "denied": 1}
+
+
+@pytest.mark.Negative
+def test_retries_stop_when_budget_is_used_up(stub_server, breakers, budget):
+    session = create_api_session(BudgetedRetry(total=5, backoff_factor=0, status_forcelist=(502,),
+                                               allowed_methods=frozenset({"GET"}), raise_on_status=False))
+    StatusHandler.hits.pop("/status/502", None)
+
+    # With raise_on_status=False the last response is returned once retrying stops
+    assert session.get(f"{stub_server}/status/502").status_code == 502
+    assert StatusHandler.hits["/status/502"] == 3
+    assert budget.snapshot() == {"requests": 1, "retries": 2, "denied": 1}
+
+
+@pytest.mark.Positive
+def test_backoff_never_exceeds_remaining_deadline(budget):
+    budget.minimum = 100
+    retry = BudgetedRetry(total=10, backoff_factor=0.5, backoff_max=60)
+    token = current_deadline.set(time.monotonic() + 3)
+    retries = 0
+    try:
+        with pytest.raises(MaxRetryError):
+            while True:
+                retry = retry.increment("GET", "/", error=ConnectTimeoutError())
+                retries += 1
+                assert retry.get_backoff_time() <= retry.get_backoff_cap() < current_deadline.get() - time.monotonic()
+    finally:
+        current_deadline.reset(token)
+    # Backoff caps 0.5s, 1s and 2s fit in the 3s left; the 4s one does not
+    assert retries == 3
+
+
+@pytest.mark.Positive
+def test_backoff_jitter_is_capped(budget):
+    budget.minimum = 100
+    retry = BudgetedRetry(total=10, backoff_factor=1, backoff_max=3)
+    for _ in range(4):
+        retry = retry.increment("GET", "/", error=ConnectTimeoutError())
+
+    # 1s, 2s, 4s, 8s capped at backoff_max
+    assert retry.get_backoff_cap() == 3
+    assert all(0 <= retry.get_backoff_time() <= 3 for _ in range(200))
+
+
+@pytest.mark.Negative
+def test_breaker_opens_after_threshold_and_probes_after_cooldown():
+    breaker = CircuitBreaker("api.test", failure_threshold=3, cooldown=0.05)
+
+    for _ in range(2):
+        breaker.before_request("GET", "/")
+        breaker.record("503 on GET /")
+    assert breaker.state == "closed"
+    breaker.record("503 on GET /")
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError, match="after 3 consecutive failures"):
+        breaker.before_request("GET", "/")
+
+    time.sleep(0.06)
+    breaker.before_request("GET", "/")
+    assert breaker.state == "half-open"
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("GET", "/")
+    breaker.record(None)
+    assert breaker.state == "closed"
+    breaker.before_request("GET", "/")
+    assert breaker.snapshot()["trips"] == 1
+    assert breaker.snapshot()["short_circuited"] == 2
+
+
+@pytest.mark.Negative
+def test_failed_probe_opens_breaker_again():
+    breaker = CircuitBreaker("api.test", failure_threshold=1, cooldown=0.05)
+    breaker.record("ConnectionError on GET /")
+
+    time.sleep(0.06)
+    breaker.before_request("GET", "/")
+    breaker.record("ConnectionError on GET /")
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("GET", "/")
+
+
+@pytest.mark.Positive
+def test_expected_500_does_not_trip_breaker(stub_server, breakers):
+    session = create_api_session(max_retries=0)
+
+    statuses = [session.get(f"{stub_server}/status/500").status_code for _ in range(4)]
+
+    assert statuses == [500] * 4
+    assert breakers.snapshot() == {}
+
+
+@pytest.mark.Negative
+def test_gateway_errors_trip_breaker(stub_server, breakers):
+    session = create_api_session(max_retries=0)
+    StatusHandler.hits.pop("/status/503", None)
+
+    assert [session.get(f"{stub_server}/status/503").status_code for _ in range(2)] == [503, 503]
+    with pytest.raises(CircuitOpenError, match="503 Service Unavailable on GET /status/503"):
+        session.get(f"{stub_server}/status/503")
+    assert StatusHandler.hits["/status/503"] == 2
+
+
+@pytest.mark.Negative
+@pytest.mark.asyncio
+async def test_async_client_shares_breakers_with_session(stub_server, breakers, budget):
+    StatusHandler.hits.pop("/status/504", None)
+    session = create_api_session(max_retries=0)
+    async with aiohttp.ClientSession() as aiohttp_session:
+        client = AsyncAPIClient(aiohttp_session, TimeoutPolicy())
+
+        assert (await client.make_request(base_url=stub_server, api_endpoint="/status/500")).status_code == 500
+        assert (await client.make_request(base_url=stub_server, api_endpoint="/status/504")).status_code == 504
+        assert session.get(f"{stub_server}/status/504").status_code == 504
+        with pytest.raises(CircuitOpenError):
+            await client.make_request(base_url=stub_server, api_endpoint="/status/504")
+
+    assert StatusHandler.hits["/status/504"] == 2
+    assert budget.snapshot()["requests"] == 3
+
+
+@pytest.mark.Negative
+def test_breaker_statuses_from_env(stub_server, breakers, monkeypatch):
+    monkeypatch.setenv("API_BREAKER_STATUSES", "500, 503")
+    session = create_api_session(max_retries=0)
+
+    for _ in range(2):
+        session.get(f"{stub_server}/status/500")
+    with pytest.raises(CircuitOpenError):
+        session.get(f"{stub_server}/status/500")
@@ -0,0 +1,147 @@
+"""
+API Session Test Module.
+
+This module checks how the API session's connection pools are configured from
+the environment, including per-host overrides, and, against a keep-alive
+(HTTP/1.1) local stub server, that the pools count connections opened and
+reused, waits for a free connection and connections discarded.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from requests.adapters import DEFAULT_POOLSIZE
+
+from src.base import api_session
+from src.base.api_session import PoolStats, create_api_session, pool_settings
+
+from src.utils import logger
+log = logger.customLogger()
+
+POOL_VARS = ("API_POOL_CONNECTIONS", "API_POOL_MAXSIZE", "API_POOL_BLOCK", "API_POOL_HOST_OVERRIDES")
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET after a short delay and keeps the connection open."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in POOL_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    """Fresh pool counters for the sessions under test."""
+    stats = PoolStats()
+    monkeypatch.setattr(api_session, "pool_stats", stats)
+    return stats
+
+
+def concurrent_gets(session, url, count, rounds=2):
+    """Send rounds of `count` concurrent GETs."""
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        for _ in range(rounds):
+            assert all(response.status_code == 200 for response in executor.map(session.get, [url] * count))
+
+
+@pytest.mark.Positive
+def test_pool_settings_defaults():
+    assert pool_settings() == {"pool_connections": DEFAULT_POOLSIZE, "pool_maxsize": DEFAULT_POOLSIZE,
+                               "pool_block": False, "host_overrides": {}}
+
+
+@pytest.mark.Positive
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("API_POOL_CONNECTIONS", "4")
+    monkeypatch.setenv("API_POOL_MAXSIZE", "16")
+    monkeypatch.setenv("API_POOL_BLOCK", "True")
+    monkeypatch.setenv("API_POOL_HOST_OVERRIDES", " api.freeapi.app=32, localhost=4:false,")
+
+    assert pool_settings() == {"pool_connections": 4, "pool_maxsize": 16, "pool_block": True,
+                               "host_overrides": {"api.freeapi.app": {"maxsize": 32},
+                                                  "localhost": {"maxsize": 4, "block": False}}}
+
+
+@pytest.mark.Negative
+def test_invalid_pool_settings_fall_back(monkeypatch):
+    monkeypatch.setenv("API_POOL_MAXSIZE", "many")
+    monkeypatch.setenv("API_POOL_HOST_OVERRIDES", "api.freeapi.app=big,localhost=2")
+
+    settings = pool_settings()
+
+    assert settings["pool_maxsize"] == DEFAULT_POOLSIZE
+    assert settings["host_overrides"] == {"localhost": {"maxsize": 2}}
+
+
+@pytest.mark.Positive
+def test_host_override_sizes_its_pool(monkeypatch):
+    monkeypatch.setenv("API_POOL_MAXSIZE", "3")
+    monkeypatch.setenv("API_POOL_HOST_OVERRIDES", "localhost=7:true")
+    adapter = create_api_session(max_retries=0).get_adapter("http://localhost")
+
+    override_pool = adapter.poolmanager.connection_from_host("localhost", 80, "http")
+    default_pool = adapter.poolmanager.connection_from_host("127.0.0.1", 80, "http")
+
+    assert (override_pool.pool.maxsize, override_pool.block) == (7, True)
+    assert (default_pool.pool.maxsize, default_pool.block) == (3, False)
+
+
+@pytest.mark.Positive
+def test_sequential_requests_reuse_one_connection(stub_server, stats):
+    session = create_api_session(max_retries=0)
+
+    for _ in range(3):
+        session.get(f"{stub_server}/todos")
+
+    assert stats.snapshot()[stub_server] == dict(opened=1, reused=2, waits=0, discarded=0, wait_seconds=0.0)
+
+
+@pytest.mark.Negative
+def test_small_pool_discards_extra_connections(stub_server, stats, monkeypatch):
+    monkeypatch.setenv("API_POOL_MAXSIZE", "2")
+
+    concurrent_gets(create_api_session(max_retries=0), f"{stub_server}/todos", 8)
+
+    counters = stats.snapshot()[stub_server]
+    assert counters["reused"] > 0
+    assert counters["discarded"] > 0
+    assert counters["opened"] + counters["reused"] == 16
+    assert "Discarded: " in stats.format_summary()
+
+
+@pytest.mark.Negative
+def test_blocking_pool_waits_for_free_connection(stub_server, stats, monkeypatch):
+    monkeypatch.setenv("API_POOL_MAXSIZE", "2")
+    monkeypatch.setenv("API_POOL_BLOCK", "true")
+
+    concurrent_gets(create_api_session(max_retries=0), f"{stub_server}/todos", 8)
+
+    counters = stats.snapshot()[stub_server]
+    assert counters["waits"] > 0 and counters["wait_seconds"] > 0
+    assert counters["opened"] <= 2
+    assert counters["discarded"] == 0
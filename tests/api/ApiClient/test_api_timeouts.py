@@ -0,0 +1,131 @@
+"""
+API Timeouts Test Module.
+
+This module checks TimeoutPolicy: which connect/read timeout a request gets,
+how the per-test deadline caps it, and that requests to a slow local stub
+server fail with an APITimeoutError naming the limit that was hit.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ReadTimeoutError
+
+from src.base.api_client import APIClient
+from src.base.api_session import create_api_session
+from src.base.api_timeouts import APITimeoutError, TimeoutPolicy, current_deadline, timeout_kind
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Answers GET /delay/<seconds> after that many seconds."""
+
+    def do_GET(self):
+        time.sleep(float(self.path.split("/")[2]) if self.path.startswith("/delay/") else 0)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.Positive
+def test_endpoint_timeouts_and_overrides():
+    policy = TimeoutPolicy(connect=10, read=30, endpoint_timeouts={"*/upload*": 120, "*/todos/*": {"read": 60}})
+
+    assert policy.timeout_for("GET", "https://api.test/api/v1/users") == (10, 30)
+    assert policy.timeout_for("GET", "https://api.test/api/v1/todos/1") == (10, 60)
+    assert policy.timeout_for("POST", "https://api.test/upload") == (120, 120)
+    # An explicit timeout replaces the endpoint timeout; parts it leaves out use the defaults
+    assert policy.timeout_for("GET", "https://api.test/api/v1/todos/1", override=[2, 5]) == (2, 5)
+    assert policy.timeout_for("GET", "https://api.test/api/v1/todos/1", override={"connect": 3}) == (3, 30)
+
+
+@pytest.mark.Positive
+def test_deadline_caps_timeouts():
+    policy = TimeoutPolicy(connect=10, read=30, deadline_seconds=5)
+
+    connect, read = policy.timeout_for("GET", "https://api.test/")
+
+    assert 4 < connect <= 5 and 4 < read <= 5
+
+
+@pytest.mark.Negative
+def test_passed_deadline_raises_before_sending():
+    policy = TimeoutPolicy(deadline_seconds=1)
+    policy.deadline = time.monotonic() - 1
+
+    with pytest.raises(APITimeoutError) as error:
+        policy.timeout_for("GET", "https://api.test/")
+    assert error.value.limit == "test deadline of 1s already passed"
+
+
+@pytest.mark.Positive
+def test_from_env_reads_timeouts(monkeypatch):
+    monkeypatch.setenv("API_CONNECT_TIMEOUT", "3")
+    monkeypatch.setenv("API_TIMEOUT", "7")
+    monkeypatch.setenv("API_TEST_TIMEOUT", "0")
+
+    policy = TimeoutPolicy.from_env()
+
+    assert (policy.connect, policy.read, policy.deadline) == (3.0, 7.0, None)
+
+
+@pytest.mark.Positive
+@pytest.mark.parametrize("exception, kind", [
+    (requests.exceptions.ConnectTimeout(), "connect"),
+    (requests.exceptions.ReadTimeout(), "read"),
+    (requests.exceptions.ConnectionError(MaxRetryError(None, "/", ConnectTimeoutError())), "connect"),
+    (requests.exceptions.ConnectionError(MaxRetryError(None, "/", ReadTimeoutError(None, "/", "timed out"))),
+     "read"),
+    (requests.exceptions.ConnectionError("refused"), None),
+], ids=["connect", "read", "retried connect", "retried read", "not a timeout"])
+def test_timeout_kind(exception, kind):
+    assert timeout_kind(exception) == kind
+
+
+@pytest.mark.Negative
+def test_read_timeout_names_its_limit(stub_server):
+    client = APIClient(create_api_session(max_retries=0), TimeoutPolicy(connect=5, read=0.2))
+
+    with pytest.raises(APITimeoutError) as error:
+        client.make_request(base_url=stub_server, api_endpoint="/delay/1")
+    assert error.value.limit == "read timeout 0.2s"
+    assert 0.2 <= error.value.elapsed < 1
+
+
+@pytest.mark.Negative
+def test_deadline_stops_slow_request(stub_server):
+    client = APIClient(create_api_session(max_retries=0), TimeoutPolicy(connect=5, read=30, deadline_seconds=0.3))
+
+    start = time.monotonic()
+    with pytest.raises(APITimeoutError) as error:
+        client.make_request(base_url=stub_server, api_endpoint="/delay/2")
+    assert time.monotonic() - start < 1
+    assert "0.3s" in error.value.limit
+
+
+@pytest.mark.Positive
+def test_deadline_is_visible_while_sending(stub_server):
+    session = create_api_session(max_retries=0)
+    seen = []
+    session.hooks["response"].append(lambda response, **kwargs: seen.append(current_deadline.get()))
+    policy = TimeoutPolicy(deadline_seconds=10)
+
+    APIClient(session, policy).make_request(base_url=stub_server, api_endpoint="/delay/0")
+
+    assert seen == [policy.deadline]
+    assert current_deadline.get() is None
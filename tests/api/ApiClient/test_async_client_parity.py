@@ -0,0 +1,193 @@
+"""
+Async API Client Parity Test Module.
+
+This module checks that AsyncAPIClient behaves exactly like APIClient: the same
+request specs reach a local stub server as identical requests, and produce
+responses and errors the API utilities treat the same way.
+"""
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
+
+from src.utils.api_utilities import validate_response_code, validate_response_content_type, \
+    validate_in_response_body, validate_batch_response_codes
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answers every request with a JSON echo of what it received; /status/<code> sets the status."""
+
+    def _echo(self):
+        parts = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = int(parts.path.split("/")[2]) if parts.path.startswith("/status/") else 200
+        content_type = self.headers.get("Content-Type")
+        echo = {
+            "method": self.command,
+            "path": parts.path,
+            "query": parse_qs(parts.query),
+            "content_type": content_type.split(";")[0] if content_type else None,
+            "body": body.decode("utf-8", "replace") if not (content_type or "").startswith("multipart") else None,
+            "multipart_has_file": b'filename="notes.txt"' in body and b"hello file" in body,
+            "custom_header": self.headers.get("X-Test"),
+        }
+        data = json.dumps({"data": echo}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _echo
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+HEADERS = {"Content-Type": "application/json", "X-Test": "parity"}
+
+CASES = [
+    {"method": "GET", "api_endpoint": "/api/v1/todos", "header": HEADERS,
+     "query_params": {"page": 1, "tags": ["a", "b"], "skip": None, "done": True}},
+    {"method": "GET", "api_endpoint": "/api/v1/todos/{id}", "path_params": {"id": "123"}},
+    {"method": "POST", "api_endpoint": "/api/v1/todos", "header": HEADERS,
+     "payload": {"title": "Write tests", "description": "parity"}, "param": {"source": "ui"}},
+    {"method": "POST", "api_endpoint": "/api/v1/todos", "payload": {"title": "no headers"}},
+    {"method": "PUT", "api_endpoint": "/api/v1/todos/{id}", "path_params": {"id": "7"}, "header": HEADERS,
+     "payload": {"title": "Updated"}, "param": {"notify": "false"}},
+    {"method": "PATCH", "api_endpoint": "/api/v1/todos/7", "header": HEADERS, "payload": {"isComplete": True}},
+    {"method": "delete", "api_endpoint": "/api/v1/todos/7", "header": HEADERS, "query_params": {"hard": 1}},
+    {"method": "GET", "api_endpoint": "/status/404"},
+    {"method": "POST", "api_endpoint": "/status/500", "payload": None},
+]
+
+
+def comparable(response):
+    """The parts of a response the API utilities look at."""
+    return {
+        "status_code": response.status_code,
+        "content_type": response.headers.get("Content-Type"),
+        "json": response.json(),
+        "text": response.text,
+        "ok": response.ok,
+    }
+
+
+@pytest.mark.Positive
+@pytest.mark.asyncio
+@pytest.mark.parametrize("case", CASES, ids=lambda case: f"{case['method']} {case['api_endpoint']}")
+async def test_async_client_sends_same_request(api_request_context, async_api_request_context, stub_server, case):
+    log.info(f"Running parity case: {case['method']} {case['api_endpoint']}")
+
+    sync_response = api_request_context.make_request(base_url=stub_server, **case)
+    async_response = await async_api_request_context.make_request(base_url=stub_server, **case)
+
+    assert comparable(async_response) == comparable(sync_response)
+    validate_response_content_type(async_response)
+    validate_response_code(async_response, sync_response.status_code)
+
+
+@pytest.mark.Positive
+@pytest.mark.asyncio
+async def test_async_client_file_upload(api_request_context, async_api_request_context, stub_server):
+    case = {"method": "POST", "api_endpoint": "/upload", "payload": {"kind": "note"}}
+
+    sync_response = api_request_context.make_request(
+        base_url=stub_server, file={"file": ("notes.txt", io.BytesIO(b"hello file"), "text/plain")}, **case)
+    async_response = await async_api_request_context.make_request(
+        base_url=stub_server, file={"file": ("notes.txt", io.BytesIO(b"hello file"), "text/plain")}, **case)
+
+    assert async_response.json() == sync_response.json()
+    validate_in_response_body(async_response, "data.multipart_has_file", True, "file not uploaded")
+    validate_in_response_body(async_response, "data.content_type", "multipart/form-data", "not multipart")
+
+
+@pytest.mark.Negative
+@pytest.mark.asyncio
+@pytest.mark.parametrize("case, error", [
+    ({"method": "OPTIONS", "api_endpoint": "/api/v1/todos"}, ValueError),
+    ({"method": "GET", "api_endpoint": "/api/v1/todos/{id}", "path_params": {"todo": "1"}}, KeyError),
+], ids=["unsupported method", "missing path param"])
+async def test_async_client_raises_same_errors(api_request_context, async_api_request_context, stub_server,
+                                               case, error):
+    with pytest.raises(error) as sync_error:
+        api_request_context.make_request(base_url=stub_server, **case)
+    with pytest.raises(error) as async_error:
+        await async_api_request_context.make_request(base_url=stub_server, **case)
+
+    assert str(async_error.value) == str(sync_error.value)
+
+
+@pytest.mark.Positive
+@pytest.mark.asyncio
+async def test_async_client_batch_matches_sync_batch(api_request_context, async_api_request_context, stub_server):
+    batch = [dict(case, base_url=stub_server) for case in CASES] + [
+        {"base_url": stub_server, "method": "TRACE", "api_endpoint": "/"}]
+
+    sync_results = api_request_context.make_requests(batch, max_concurrency=4)
+    async_results = await async_api_request_context.make_requests(batch, max_concurrency=4)
+
+    assert [result.index for result in async_results] == list(range(len(batch)))
+    for sync_result, async_result in zip(sync_results, async_results):
+        assert async_result.ok == sync_result.ok
+        if async_result.ok:
+            assert comparable(async_result.response) == comparable(sync_result.response)
+        else:
+            assert type(async_result.exception) is type(sync_result.exception)
+    validate_batch_response_codes(async_results[:7], 200)
+
+
+class BarrierHandler(BaseHTTPRequestHandler):
+    """Answers only once every request of the batch has arrived, so they are all in flight together."""
+
+    barrier = None
+
+    def do_GET(self):
+        BarrierHandler.barrier.wait()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class BacklogServer(ThreadingHTTPServer):
+    """Stub server that accepts a burst of connections."""
+
+    request_queue_size = 512
+    daemon_threads = True
+
+
+@pytest.mark.Positive
+@pytest.mark.asyncio
+async def test_async_client_keeps_more_than_100_requests_in_flight(async_api_request_context):
+    in_flight = 150
+    BarrierHandler.barrier = threading.Barrier(in_flight, timeout=15)
+    server = BacklogServer(("127.0.0.1", 0), BarrierHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        results = await async_api_request_context.make_requests(
+            [{"base_url": base_url, "api_endpoint": f"/item/{i}"} for i in range(in_flight)],
+            max_concurrency=in_flight)
+    finally:
+        BarrierHandler.barrier.abort()
+        server.shutdown()
+
+    validate_batch_response_codes(results, 200)
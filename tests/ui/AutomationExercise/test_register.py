@@ -24,23 +24,22 @@ class TestRegister:
         register_user.enterEmail(case["register_user_email"])
         register_user.clickSignupButton()
         register_user.clickUserTitle(case["register_user_title"])
-        register_user.enterPassword(case["register_user_password"])
-        register_user.selectDate(case["register_user_birthDay"])
-        register_user.selectmonth(case["register_user_birthMonth"])
-        register_user.selectyear(case["register_user_birthYear"])
-        register_user.clickNewsletterBox()
-        register_user.clickSpecialoffersBox()
-        register_user.enterAddressfirstName(case["register_user_addressfirstName"])
-        register_user.enterAddresslastName(case["register_user_addresslastName"])
-        register_user.enterAddresscompany(case["register_user_addressCompany"])
-        register_user.enterStreetaddress(case["register_user_streetAddress"])
-        register_user.enterAddress(case["register_user_address"])
-
-        register_user.selectCountry(case["register_user_selectCountry"])
-        register_user.enterState(case["register_user_state"])
-        register_user.enterCity(case["register_user_city"])
-        register_user.enterZipcode(case["register_user_zipcode"])
-        register_user.enterMobilenumber(case["register_user_mobilenumber"])
+        register_user.fillAccountInformation(
+            password=case["register_user_password"],
+            birth_day=case["register_user_birthDay"],
+            birth_month=case["register_user_birthMonth"],
+            birth_year=case["register_user_birthYear"],
+            first_name=case["register_user_addressfirstName"],
+            last_name=case["register_user_addresslastName"],
+            company=case["register_user_addressCompany"],
+            street_address=case["register_user_streetAddress"],
+            address_2=case["register_user_address"],
+            country=case["register_user_selectCountry"],
+            state=case["register_user_state"],
+            city=case["register_user_city"],
+            zipcode=case["register_user_zipcode"],
+            mobile_number=case["register_user_mobilenumber"]
+        )
         register_user.clickCreateaccountButton()
         Accountcreatedmessage=register_user.getAccountcreatedmessage()
         register_user.verifiytheCreateAccountmessage(Accountcreatedmessage,"ACOUNT CREATED!")
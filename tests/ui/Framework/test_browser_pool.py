@@ -0,0 +1,204 @@
+"""
+Browser Pool Test Module.
+
+This module checks, on fake WebDriver sessions, that a pooled session is reset
+between leases without breaking what is bound to its tab: the network
+interceptor of a reused session still blocks requests on the next lease, and
+sessions without DevTools are reset through WebDriver and reused too.
+"""
+import pytest
+
+from src.base import web_driver
+from src.base.browser_pool import BrowserPool
+from src.base.web_driver import WebDriverManager
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        assert handle in self.driver.handles
+        self.driver.current = handle
+
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    """WebDriver session with tabs, per-origin storage and cookies (like Firefox: no DevTools)."""
+
+    caps = {"browserName": "firefox"}
+
+    def __init__(self):
+        self.handles = ["tab-1"]
+        self.current = "tab-1"
+        self.urls = {"tab-1": "about:blank"}
+        self.history = {"tab-1": []}
+        self.local_storage = {}
+        self.cookies = set()
+        self.switch_to = FakeSwitchTo(self)
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        return list(self.handles)
+
+    @property
+    def current_window_handle(self):
+        return self.current
+
+    def get(self, url):
+        self.urls[self.current] = url
+        self.history[self.current].append(url)
+
+    def open_tab(self, url):
+        handle = f"tab-{len(self.history) + 1}"
+        self.handles.append(handle)
+        self.urls[handle], self.history[handle] = url, [url]
+        return handle
+
+    def close(self):
+        self.handles.remove(self.current)
+
+    def origin(self):
+        return "/".join(self.urls[self.current].split("/")[:3])
+
+    def execute_script(self, script):
+        self.local_storage.pop(self.origin(), None)
+
+    def delete_all_cookies(self):
+        self.cookies.discard(self.origin())
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeChromeDriver(FakeDriver):
+    """Fake session with the DevTools commands the pool uses."""
+
+    caps = {"browserName": "chrome"}
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.history[self.current]]}
+        if command == "Page.getFrameTree":
+            return {"frameTree": {"frame": {"url": self.urls[self.current]}, "childFrames": []}}
+        if command == "Storage.clearDataForOrigin":
+            self.local_storage.pop(params["origin"], None)
+        if command == "Network.clearBrowserCookies":
+            self.cookies.clear()
+        return {}
+
+
+class FakeInterceptor:
+    """Interceptor bound to the tab that was current when it started, like NetworkInterceptor."""
+
+    starts = 0
+
+    def __init__(self):
+        self.profile = None
+        self.error = None
+        self.driver = None
+        self.target = None
+
+    def start(self, driver):
+        FakeInterceptor.starts += 1
+        self.driver, self.target = driver, driver.current_window_handle
+        return True
+
+    @property
+    def running(self):
+        return self.target is not None and self.target in self.driver.handles
+
+    def stop(self):
+        self.target = None
+
+    def set_profile(self, profile):
+        self.profile = profile
+
+    def reset_stats(self):
+        pass
+
+    def blocks(self, url, resource_type):
+        return self.running and self.profile is not None and self.profile.blocks(url, resource_type)
+
+
+@pytest.fixture
+def driver_manager(monkeypatch):
+    monkeypatch.setenv("BROWSER", "chrome")
+    monkeypatch.setattr(web_driver, "NetworkInterceptor", FakeInterceptor)
+    FakeInterceptor.starts = 0
+    manager = WebDriverManager()
+    monkeypatch.setattr(manager, "create_driver", lambda remote=False: FakeChromeDriver())
+    return manager
+
+
+@pytest.fixture
+def pool(driver_manager):
+    pool = BrowserPool(driver_manager, max_reuse=5, reuse=True, spares=0)
+    yield pool
+    pool.close()
+
+
+@pytest.mark.Positive
+def test_reused_session_keeps_blocking_requests(driver_manager, pool):
+    driver = pool.acquire()
+    driver_manager.apply_network_profile(driver, "fast")
+    driver.get("https://shop.test/cart")
+    driver.local_storage["https://shop.test"] = {"cart": "1"}
+    driver.cookies.add("https://shop.test")
+    driver.switch_to.window(driver.open_tab("https://pay.test/checkout"))
+    driver.local_storage["https://pay.test"] = {"token": "x"}
+    driver.get("https://bank.test/")
+    driver.local_storage["https://bank.test"] = {"session": "y"}
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    interceptor = driver_manager.apply_network_profile(driver, "fast")
+
+    assert interceptor.blocks("https://shop.test/logo.png", "Image")
+    assert FakeInterceptor.starts == 1
+    assert driver.handles == ["tab-1"] and driver.urls["tab-1"] == "about:blank"
+    assert driver.local_storage == {} and not driver.cookies
+    assert pool.stats["reused"] == 1
+
+
+@pytest.mark.Positive
+def test_session_without_devtools_is_reset_and_reused(driver_manager, monkeypatch):
+    monkeypatch.setattr(driver_manager, "create_driver", lambda remote=False: FakeDriver())
+    pool = BrowserPool(driver_manager, max_reuse=5, reuse=True, spares=0)
+    driver = pool.acquire()
+    driver.get("https://shop.test/cart")
+    driver.local_storage["https://shop.test"] = {"cart": "1"}
+    driver.cookies.add("https://shop.test")
+    driver.switch_to.window(driver.open_tab("https://pay.test/checkout"))
+    driver.local_storage["https://pay.test"] = {"token": "x"}
+    driver.cookies.add("https://pay.test")
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    assert not driver.quit_called
+    assert driver.handles == ["tab-1"] and driver.urls["tab-1"] == "about:blank"
+    # Storage and cookies of the origins open at release are cleared
+    assert driver.local_storage == {} and not driver.cookies
+    assert pool.stats == dict(pool.stats, created=1, reused=1, recycled=0)
+    pool.close()
+
+
+@pytest.mark.Negative
+def test_interceptor_of_closed_tab_is_restarted(driver_manager, pool):
+    driver = pool.acquire()
+    driver_manager.apply_network_profile(driver, "fast")
+    # The test switches to a new tab and closes the one the interceptor was attached to
+    new_tab = driver.open_tab("https://shop.test/")
+    driver.close()
+    driver.switch_to.window(new_tab)
+
+    interceptor = driver_manager.apply_network_profile(driver, "fast")
+
+    assert interceptor.blocks("https://shop.test/logo.png", "Image")
+    assert FakeInterceptor.starts == 2
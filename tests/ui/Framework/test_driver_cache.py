@@ -0,0 +1,107 @@
+"""
+Driver Cache Test Module.
+
+This module checks how DriverCache resolves driver binaries: explicit paths,
+cache file entries shared between instances, offline resolution from PATH and
+re-resolution when the installed browser was upgraded.
+"""
+import json
+import pytest
+
+from src.base import driver_cache
+from src.base.driver_cache import DriverCache
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class FakeManager:
+    """Stands in for a webdriver-manager class; counts installs."""
+
+    installs = 0
+    driver_path = None
+
+    def install(self):
+        FakeManager.installs += 1
+        return FakeManager.driver_path
+
+
+@pytest.fixture
+def fake_driver(tmp_path, monkeypatch):
+    """A chromedriver binary in tmp_path, resolved by FakeManager and found on PATH."""
+    driver = tmp_path / "chromedriver"
+    driver.write_text("")
+    driver.chmod(0o755)
+    FakeManager.installs = 0
+    FakeManager.driver_path = str(driver)
+    monkeypatch.setitem(driver_cache.DRIVER_MANAGERS, "chrome", (FakeManager, "CHROMEDRIVER_PATH", "chromedriver"))
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    return str(driver)
+
+
+def make_cache(tmp_path, offline=False, browser_version="120.0"):
+    cache = DriverCache(cache_file=tmp_path / "cache" / "drivers.json", offline=offline)
+    cache._get_browser_version = lambda manager_class: browser_version
+    return cache
+
+
+@pytest.mark.Positive
+def test_explicit_driver_path_wins(tmp_path, fake_driver, monkeypatch):
+    monkeypatch.setenv("CHROMEDRIVER_PATH", "/opt/drivers/chromedriver")
+    cache = make_cache(tmp_path)
+
+    assert cache.resolve("Chrome") == "/opt/drivers/chromedriver"
+    assert FakeManager.installs == 0
+    assert not cache.cache_file.exists()
+
+
+@pytest.mark.Positive
+def test_resolved_driver_is_cached_for_other_instances(tmp_path, fake_driver):
+    assert make_cache(tmp_path).resolve("chrome") == fake_driver
+    assert make_cache(tmp_path).resolve("chrome") == fake_driver
+
+    assert FakeManager.installs == 1
+    entry = next(iter(json.loads((tmp_path / "cache" / "drivers.json").read_text()).values()))
+    assert entry["driver_path"] == fake_driver
+    assert entry["browser_version"] == "120.0"
+
+
+@pytest.mark.Positive
+def test_browser_upgrade_resolves_driver_again(tmp_path, fake_driver):
+    make_cache(tmp_path, browser_version="120.0").resolve("chrome")
+    make_cache(tmp_path, browser_version="121.0").resolve("chrome")
+
+    assert FakeManager.installs == 2
+
+
+@pytest.mark.Positive
+def test_offline_mode_uses_driver_on_path(tmp_path, fake_driver):
+    cache = make_cache(tmp_path, offline=True)
+
+    assert cache.resolve("chrome") == fake_driver
+    assert FakeManager.installs == 0
+
+
+@pytest.mark.Negative
+def test_offline_mode_without_driver_raises(tmp_path, fake_driver, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+
+    with pytest.raises(FileNotFoundError):
+        make_cache(tmp_path, offline=True).resolve("chrome")
+
+
+@pytest.mark.Negative
+def test_corrupt_cache_file_is_ignored(tmp_path, fake_driver):
+    cache = make_cache(tmp_path)
+    cache.cache_file.parent.mkdir(parents=True)
+    cache.cache_file.write_text("{not json")
+
+    assert cache.resolve("chrome") == fake_driver
+    assert FakeManager.installs == 1
+
+
+@pytest.mark.Negative
+def test_unsupported_browser_raises(tmp_path):
+    with pytest.raises(ValueError):
+        make_cache(tmp_path).resolve("opera")
@@ -0,0 +1,141 @@
+"""
+HAR Recorder Test Module.
+
+This module checks how HarRecorder turns DevTools Network events from a fake
+session's performance log into HAR entries: timings, redirects, failed and
+unfinished requests, and response bodies.
+"""
+import json
+import pytest
+
+from src.base import har_recorder as har_module
+from src.base.har_recorder import HarRecorder
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class FakeDriver:
+    """Session whose performance log returns the queued DevTools events once."""
+
+    def __init__(self):
+        self.events = []
+
+    def queue(self, method, **params):
+        self.events.append({"message": json.dumps({"message": {"method": method, "params": params}})})
+
+    def get_log(self, log_type):
+        assert log_type == "performance"
+        events, self.events = self.events, []
+        return events
+
+    def execute_cdp_cmd(self, command, params):
+        assert command == "Network.getResponseBody"
+        return {"body": "aGk=", "base64Encoded": True}
+
+
+def request(driver, request_id, url, timestamp, **extra):
+    driver.queue("Network.requestWillBeSent", requestId=request_id, timestamp=timestamp, wallTime=1700000000.0,
+                 type="Document", request={"method": "GET", "url": url, "headers": {"Accept": "*/*"}}, **extra)
+
+
+def response(status, **extra):
+    return dict({"status": status, "statusText": "OK", "protocol": "http/1.1", "mimeType": "text/html",
+                 "headers": {"content-type": "text/html"}}, **extra)
+
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    monkeypatch.setattr(har_module, "HAR_DIR", str(tmp_path))
+    monkeypatch.delenv("HAR_BODIES", raising=False)
+    return HarRecorder()
+
+
+def start_recording(recorder, driver, node_id="tests/ui/test_shop.py::test_cart"):
+    """Start recording a test; events logged before it (here a request to before.test) are dropped."""
+    driver.queue("Network.requestWillBeSent", requestId="old", timestamp=1.0, wallTime=1.0,
+                 request={"method": "GET", "url": "https://before.test/"})
+    recorder.start_test(node_id, driver)
+
+
+def entries(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["log"]["entries"]
+
+
+@pytest.mark.Positive
+def test_completed_request_becomes_entry_with_timings(recorder):
+    driver = FakeDriver()
+    start_recording(recorder, driver)
+    request(driver, "1", "https://shop.test/cart", 10.0)
+    request(driver, "2", "data:image/png;base64,AAAA", 10.0)
+    driver.queue("Network.responseReceived", requestId="1", response=response(200, timing={
+        "dnsStart": 1, "dnsEnd": 3, "connectStart": 3, "connectEnd": 8, "sslStart": -1, "sslEnd": -1,
+        "sendStart": 8, "sendEnd": 9, "receiveHeadersEnd": 59}))
+    driver.queue("Network.loadingFinished", requestId="1", timestamp=10.1, encodedDataLength=2048)
+
+    path = recorder.stop_test()
+
+    assert path.endswith("tests_ui_test_shop.py_test_cart.har")
+    [entry] = entries(path)
+    assert entry["request"]["url"] == "https://shop.test/cart"
+    assert entry["request"]["headers"] == [{"name": "Accept", "value": "*/*"}]
+    assert entry["response"]["status"] == 200
+    assert entry["response"]["bodySize"] == 2048
+    assert entry["time"] == 100.0
+    assert entry["timings"] == {"blocked": -1, "dns": 2, "connect": 5, "ssl": -1, "send": 1, "wait": 50,
+                                "receive": 41.0}
+    assert "_start" not in entry and "_timing" not in entry
+
+
+@pytest.mark.Positive
+def test_redirect_is_written_as_its_own_entry(recorder):
+    driver = FakeDriver()
+    start_recording(recorder, driver)
+    request(driver, "1", "http://shop.test/", 1.0)
+    request(driver, "1", "https://shop.test/", 1.2,
+            redirectResponse=response(301, headers={"location": "https://shop.test/"}))
+    driver.queue("Network.responseReceived", requestId="1", response=response(200))
+    driver.queue("Network.loadingFinished", requestId="1", timestamp=1.5, encodedDataLength=10)
+
+    redirect, final = entries(recorder.stop_test())
+
+    assert (redirect["request"]["url"], redirect["response"]["status"]) == ("http://shop.test/", 301)
+    assert redirect["response"]["redirectURL"] == "https://shop.test/"
+    assert redirect["time"] == 200.0
+    assert (final["request"]["url"], final["response"]["status"]) == ("https://shop.test/", 200)
+    # Without ResourceTiming the whole time counts as waiting
+    assert final["timings"] == {"send": 0, "wait": 300.0, "receive": 0}
+
+
+@pytest.mark.Negative
+def test_failed_and_unfinished_requests_are_flagged(recorder):
+    driver = FakeDriver()
+    start_recording(recorder, driver)
+    request(driver, "1", "https://ads.test/pixel", 1.0)
+    driver.queue("Network.loadingFailed", requestId="1", timestamp=1.1, errorText="net::ERR_BLOCKED_BY_CLIENT")
+    request(driver, "2", "https://shop.test/slow", 1.0)
+
+    failed, unfinished = entries(recorder.stop_test())
+
+    assert failed["response"]["_error"] == "net::ERR_BLOCKED_BY_CLIENT"
+    assert unfinished["response"]["_error"] == "incomplete"
+    assert not recorder.active
+
+
+@pytest.mark.Positive
+def test_bodies_are_included_when_enabled(recorder, monkeypatch):
+    monkeypatch.setenv("HAR_BODIES", "true")
+    driver = FakeDriver()
+    start_recording(recorder, driver)
+    request(driver, "1", "https://shop.test/api", 1.0)
+    driver.queue("Network.loadingFinished", requestId="1", timestamp=1.1, encodedDataLength=2)
+
+    [entry] = entries(recorder.stop_test())
+
+    assert entry["response"]["content"] == {"size": 4, "mimeType": "", "text": "aGk=", "encoding": "base64"}
+
+
+@pytest.mark.Negative
+def test_stop_without_test_returns_none(recorder):
+    assert recorder.stop_test() is None
@@ -0,0 +1,74 @@
+"""
+Page Metrics Test Module.
+
+This module checks the page metrics helpers: nearest-rank percentiles, budget
+checks from test data and markers, and the per-page p50/p95 aggregation of the
+run summary.
+"""
+import pytest
+
+from src.pages.page_metrics import PageMetricsCollector, aggregate, check_budgets, format_aggregate, \
+    page_key, percentile
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+@pytest.mark.Positive
+@pytest.mark.parametrize("pct, expected", [(0, 1), (50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_is_nearest_rank(pct, expected):
+    assert percentile([7, 3, 10, 1, 9, 2, 8, 4, 6, 5], pct) == expected
+
+
+@pytest.mark.Negative
+def test_percentile_of_no_values():
+    assert percentile([], 50) is None
+
+
+@pytest.mark.Positive
+def test_page_key_drops_query_and_fragment():
+    assert page_key("https://shop.test/products?page=2#top") == "https://shop.test/products"
+    assert page_key("about:blank") == "about:blank"
+
+
+@pytest.mark.Negative
+def test_check_budgets_reports_each_exceeded_limit():
+    records = [{"url": "https://shop.test/login", "load": 6000, "lcp": 2000, "cls": 0.3},
+               {"url": "https://shop.test/cart", "load": 900, "lcp": None}]
+    url_budgets = {"*shop.test/login*": {"load": 5000, "lcp": 2500}, "*/cart": {"lcp": 1}}
+
+    violations = check_budgets(records, url_budgets, test_budget={"cls": 0.1, "load": 800})
+
+    assert violations == ["load 6000 > 5000 on https://shop.test/login",
+                          "cls 0.3 > 0.1 on https://shop.test/login",
+                          "load 6000 > 800 on https://shop.test/login",
+                          "load 900 > 800 on https://shop.test/cart"]
+
+
+@pytest.mark.Positive
+def test_check_budgets_without_budgets():
+    assert check_budgets([{"url": "https://shop.test/", "load": 99999}]) == []
+
+
+@pytest.mark.Positive
+def test_aggregate_per_page():
+    records = [{"url": f"https://shop.test/products?page={i}", "load": load, "ttfb": 100}
+               for i, load in enumerate([400, 100, 300, 200])]
+    records.append({"url": "https://shop.test/cart", "load": 50, "fcp": None})
+
+    aggregated = aggregate(records)
+
+    assert aggregated == {"https://shop.test/products": {"visits": 4, "ttfb": (100, 100), "load": (200, 400)},
+                          "https://shop.test/cart": {"visits": 1, "load": (50, 50)}}
+    assert "https://shop.test/products (4 visits)" in format_aggregate(aggregated)
+    assert "load p50/p95: 200/400" in format_aggregate(aggregated)
+
+
+@pytest.mark.Positive
+def test_collector_keeps_records_of_one_test():
+    collector = PageMetricsCollector()
+    collector.start_test("test_a")
+    collector.record({"url": "https://shop.test/", "load": 123.45678, "resources": 12})
+
+    assert collector.stop_test() == [{"url": "https://shop.test/", "load": 123.457, "resources": 12}]
+    assert collector.stop_test() == []
@@ -0,0 +1,131 @@
+"""
+Retry Policy Test Module.
+
+This module checks the BasePage retry policy: full-jitter backoff stays within
+its cap, only transient exceptions are retried, and the per-test retry budget
+stops retries once it is used up.
+"""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+from src.pages import retry_policy
+from src.pages.retry_policy import RetryBudget, RetryPolicy
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Delays the policy slept for, without sleeping."""
+    delays = []
+    monkeypatch.setattr(retry_policy.time, "sleep", delays.append)
+    return delays
+
+
+def flaky(failures, error=StaleElementReferenceException):
+    """A function that raises error the first `failures` calls, then returns its call count."""
+    calls = []
+
+    def interaction():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error("transient")
+        return len(calls)
+
+    return interaction
+
+
+@pytest.mark.Positive
+@pytest.mark.parametrize("attempt, cap", [(1, 0.2), (2, 0.4), (3, 0.5), (10, 0.5)])
+def test_backoff_stays_within_jitter_bounds(attempt, cap):
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+
+    delays = [policy.backoff(attempt) for _ in range(500)]
+
+    assert all(0 <= delay <= cap for delay in delays)
+    # Full jitter spreads the delays over the whole range instead of a fixed value
+    assert max(delays) - min(delays) > cap / 2
+
+
+@pytest.mark.Positive
+def test_transient_error_is_retried(sleeps):
+    budget = RetryBudget(seconds=5)
+
+    assert RetryPolicy(retries=2, budget=budget).call(flaky(2)) == 3
+    assert len(sleeps) == 2
+    assert budget.retries == 2
+
+
+@pytest.mark.Negative
+def test_non_retryable_error_fails_immediately(sleeps):
+    interaction = flaky(1, error=TimeoutException)
+
+    with pytest.raises(TimeoutException):
+        RetryPolicy(retries=2, budget=RetryBudget(seconds=5)).call(interaction)
+    assert sleeps == []
+
+
+@pytest.mark.Negative
+def test_retries_are_limited(sleeps):
+    with pytest.raises(StaleElementReferenceException):
+        RetryPolicy(retries=2, budget=RetryBudget(seconds=5)).call(flaky(3))
+    assert len(sleeps) == 2
+
+
+@pytest.mark.Negative
+def test_used_up_budget_stops_retries(sleeps):
+    budget = RetryBudget(seconds=1)
+    budget.consume(1)
+
+    with pytest.raises(StaleElementReferenceException):
+        RetryPolicy(retries=2, base_delay=0.1, budget=budget).call(flaky(1))
+    assert sleeps == []
+    assert budget.retries == 0
+
+
+@pytest.mark.Positive
+def test_budget_reset_rereads_environment(monkeypatch):
+    budget = RetryBudget()
+    budget.consume(2)
+    monkeypatch.setenv("RETRY_BUDGET_SECONDS", "7")
+
+    budget.reset()
+
+    assert (budget.seconds, budget.spent, budget.retries) == (7.0, 0.0, 0)
+
+
+class RecordingPage:
+    """Page object whose interaction records an action on the open batch before failing once."""
+
+    def __init__(self, batch=None):
+        self._action_batch = batch
+        self.recorded = []
+        self.calls = 0
+
+    @retry_policy.retry_on_transient()
+    def hover(self):
+        self.calls += 1
+        self.recorded.append("move")
+        if self.calls == 1:
+            raise StaleElementReferenceException("transient")
+        return self
+
+
+@pytest.mark.Negative
+def test_interaction_inside_action_batch_is_not_retried(sleeps):
+    page = RecordingPage(batch=object())
+
+    with pytest.raises(StaleElementReferenceException):
+        page.hover()
+    assert page.recorded == ["move"]
+    assert sleeps == []
+
+
+@pytest.mark.Positive
+def test_interaction_outside_action_batch_is_retried(sleeps, monkeypatch):
+    monkeypatch.setattr(retry_policy, "retry_budget", RetryBudget(seconds=5))
+    page = RecordingPage()
+
+    assert page.hover() is page
+    assert page.calls == 2
@@ -0,0 +1,99 @@
+"""
+Screenshot Service Test Module.
+
+This module checks the failure screenshot service with a fake session: one
+capture per failure (also when it is re-raised as another exception),
+identical images written once, and background writes that flush() and
+read_base64() wait for.
+"""
+import base64
+import os
+import pytest
+
+from src.utils.screenshot_service import ScreenshotService
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+class FakeDriver:
+    """Session whose screenshots are the given images, in turn."""
+
+    def __init__(self, *images):
+        self.images = list(images)
+        self.calls = 0
+
+    def get_screenshot_as_base64(self):
+        self.calls += 1
+        return base64.b64encode(self.images[min(self.calls, len(self.images)) - 1]).decode("ascii")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    for name in ("SCREENSHOT_FORMAT", "SCREENSHOT_MAX_WIDTH", "SCREENSHOT_QUALITY"):
+        monkeypatch.delenv(name, raising=False)
+    return ScreenshotService()
+
+
+@pytest.mark.Positive
+def test_failure_is_captured_once_along_its_chain(service, tmp_path):
+    driver = FakeDriver(b"page one")
+    try:
+        try:
+            raise ValueError("element not found")
+        except ValueError as first:
+            path = service.capture(driver, "click_failed", str(tmp_path), first)
+            # Re-raised implicitly (context) by the failing page method, then explicitly (cause) by the test
+            try:
+                raise RuntimeError("click failed")
+            except RuntimeError as second:
+                raise AssertionError("checkout failed") from second
+    except AssertionError as failure:
+        assert service.capture(driver, "failure_test", str(tmp_path), failure) == path
+    assert driver.calls == 1
+    assert (service.captured, service.reused) == (1, 1)
+
+
+@pytest.mark.Positive
+def test_identical_images_are_written_once(service, tmp_path):
+    driver = FakeDriver(b"same page", b"same page", b"other page")
+
+    paths = [service.capture(driver, "shot", str(tmp_path)) for _ in range(3)]
+    service.flush()
+
+    assert paths[0] == paths[1] != paths[2]
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in {paths[0], paths[2]})
+    assert (service.captured, service.duplicates) == (2, 1)
+
+
+@pytest.mark.Positive
+def test_read_base64_waits_for_the_write(service, tmp_path):
+    path = service.capture(FakeDriver(b"\x89PNG image"), "shot", str(tmp_path / "nested"))
+
+    assert path.endswith(".png")
+    assert service.read_base64(path) == (base64.b64encode(b"\x89PNG image").decode("ascii"), "image/png")
+
+
+@pytest.mark.Negative
+def test_read_base64_of_missing_file(service, tmp_path):
+    assert service.read_base64(str(tmp_path / "missing.png")) == (None, None)
+
+
+@pytest.mark.Negative
+def test_failed_capture_returns_none(service, tmp_path):
+    class DeadDriver:
+        def get_screenshot_as_base64(self):
+            raise RuntimeError("invalid session id")
+
+    error = ValueError("failure")
+
+    assert service.capture(DeadDriver(), "shot", str(tmp_path), error) is None
+    assert not hasattr(error, "screenshot_path")
+    assert service.captured == 0
+
+
+@pytest.mark.Negative
+def test_unknown_format_falls_back_to_png(service, monkeypatch):
+    monkeypatch.setenv("SCREENSHOT_FORMAT", "gif")
+
+    assert service._settings()[0] == "png"
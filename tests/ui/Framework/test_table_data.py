@@ -0,0 +1,79 @@
+"""
+Table Data Test Module.
+
+This module checks the TableData snapshot BasePage.get_table() returns: cells
+are kept by position, so repeated or blank headers don't share a column, and
+row indexes match the rows the row locator found.
+"""
+import pytest
+
+from src.pages.table_data import TableData, parse_number, unique_keys
+
+from src.utils import logger
+log = logger.customLogger()
+
+
+@pytest.mark.Positive
+def test_duplicate_and_blank_headers_keep_their_own_columns():
+    table = TableData.from_rows(["Name", "", "Price", "", "Price"],
+                                [["Book", "x", "10", "y", "12"],
+                                 ["Pen", "z", "2", "w", "3"]])
+
+    assert table.keys == ["Name", "", "Price", "_2", "Price_2"]
+    assert table.column("") == ["x", "z"]
+    assert table.column("_2") == ["y", "w"]
+    assert table.row(1) == {"Name": "Pen", "": "z", "Price": "2", "_2": "w", "Price_2": "3"}
+    assert table.cell(0, "Price_2") == "12"
+    assert table.find_rows("", "z") == [table.row(1)]
+    assert table.column_sum("Price") == 12
+    assert table.column_sum("Price_2") == 15
+    assert set(table.numeric) == {"Price", "Price_2"}
+
+
+@pytest.mark.Positive
+def test_unique_keys_does_not_collide_with_existing_suffixes():
+    assert unique_keys(["A", "A_2", "A", ""]) == ["A", "A_2", "A_3", ""]
+
+
+@pytest.mark.Positive
+def test_row_indexes_match_located_rows():
+    # The header row inside tbody has no td cells, as on the Academy practice page
+    rows = [[], ["Rahul", "Chennai", "28"], ["Amit", "Bangalore", "55"]]
+
+    table = TableData.from_rows(["Name", "City", "Amount"], rows)
+
+    assert table.row_count == 3
+    assert table.row(0) == {"Name": "", "City": "", "Amount": ""}
+    assert table.cell(1, "City") == "Chennai"
+    assert table.complete_rows == [False, True, True]
+    assert table.column_sum("Amount") == 83
+
+
+@pytest.mark.Positive
+def test_skip_empty_rows_is_explicit():
+    table = TableData.from_rows(["Name", "Amount"], [[], ["Rahul", "28"]], skip_empty_rows=True)
+
+    assert table.row_count == 1
+    assert table.cell(0, "Name") == "Rahul"
+
+
+@pytest.mark.Negative
+def test_short_rows_are_padded_and_left_out_of_sums():
+    table = TableData.from_rows(["Name", "Amount"], [["Rahul"], ["Amit", "$1,200.50"]])
+
+    assert table.row(0) == {"Name": "Rahul", "Amount": ""}
+    assert table.column_sum("Amount") == 1200.5
+    assert table.cell(5, "Name") is None
+    assert table.cell(0, "Missing") is None
+
+
+@pytest.mark.Negative
+@pytest.mark.parametrize("text", ["NaN", "nan", "Infinity", "-inf", "INF"])
+def test_nan_and_infinity_are_text(text):
+    table = TableData.from_rows(["Name", "Amount"], [[text, "5"], ["Amit", "7"]])
+
+    assert parse_number(text) is None
+    assert "Name" not in table.numeric
+    assert table.cell(0, "Name") == text
+    assert table.find_rows("Name", text) == [table.row(0)]
+    assert table.column_sum("Amount") == 12